@@ -2,8 +2,8 @@ import random
 import string
 import timeit
 
-from mappingtools.operators import combine, merge
-from mappingtools.resolvers import Resolver
+from mappingtools.operators import Engine, combine, merge
+from mappingtools.resolvers import DecisionMetric, Resolver
 
 # --- Setup Small Data ---
 base_tree_small = {
@@ -213,6 +213,104 @@ def run_benchmark(name: str, base: dict, override: dict, iterations: int):
         print(f"Result    : `combine` is {factor:.2f}x faster.")
 
 
+def run_engine_benchmark(name: str, base: dict, override: dict, iterations: int):
+    print(f"\n--- Benchmarking Engines: {name} ({iterations:,} iterations) ---")
+
+    for func in (merge, combine):
+        # --- Validation ---
+        if func(base, override, engine=Engine.RECURSIVE) != func(base, override, engine=Engine.ITERATIVE):
+            print(f"ERROR: {name} {func.__name__}() engine outputs do not match!")
+            exit(1)
+
+        # --- Timing ---
+        recursive_time = min(timeit.repeat(
+            lambda f=func: f(base, override, engine=Engine.RECURSIVE), number=iterations, repeat=3
+        ))
+        iterative_time = min(timeit.repeat(
+            lambda f=func: f(base, override, engine=Engine.ITERATIVE), number=iterations, repeat=3
+        ))
+
+        ratio = recursive_time / iterative_time
+        print(f"{func.__name__ + '()':<10}: recursive {recursive_time:.4f}s, iterative {iterative_time:.4f}s "
+              f"(iterative runs at {ratio:.2f}x the recursive speed)")
+
+
+def run_beyond_recursion_limit_benchmark(depth: int, iterations: int):
+    print(f"\n--- Benchmarking Engines: Beyond Recursion Limit ({depth:,} Levels, {iterations:,} iterations) ---")
+    base = generate_deep_tree_iteratively(depth, "base_value")
+    override = generate_deep_tree_iteratively(depth, "override_value")
+
+    for func in (merge, combine):
+        # The recursive engine (the default) raises RecursionError internally and retries with the iterative one
+        fallback_time = timeit.timeit(lambda f=func: f(base, override, engine=Engine.RECURSIVE), number=iterations)
+        iterative_time = timeit.timeit(lambda f=func: f(base, override, engine=Engine.ITERATIVE), number=iterations)
+        print(f"{func.__name__ + '()':<10}: recursive (with fallback) {fallback_time:.4f}s, "
+              f"iterative {iterative_time:.4f}s")
+
+
+def generate_deep_tree_iteratively(depth: int, value) -> dict:
+    """Generates a deeply nested dictionary without recursion (for depths beyond the recursion limit)."""
+    tree = {"leaf": value}
+    for _ in range(depth):
+        tree = {"child": tree}
+    return tree
+
+
+def generate_sparse_overlay(base: dict, ratio: float) -> dict:
+    """Generates an overlay touching a single leaf in a `ratio` fraction of the base nodes."""
+    keys = random.sample(sorted(base), int(len(base) * ratio))
+    return {key: {"config": {"features": {"f1": False}}} for key in keys}
+
+
+def generate_snapshot_override(base: dict, ratio: float) -> dict:
+    """
+    Generates a full snapshot of base (sharing its subtrees by identity) with a `ratio` fraction of nodes replaced.
+    """
+    snapshot = dict(base)
+    for key in random.sample(sorted(base), int(len(base) * ratio)):
+        snapshot[key] = {**base[key], "id": -1}
+    return snapshot
+
+
+def run_sharing_benchmark(name: str, base: dict, override: dict, iterations: int):
+    print(f"\n--- Benchmarking Structural Sharing: {name} ({iterations:,} iterations) ---")
+
+    for func in (merge, combine):
+        # --- Validation ---
+        if func(base, override) != func(base, override, share_unchanged=True):
+            print(f"ERROR: {name} {func.__name__}() shared outputs do not match!")
+            exit(1)
+
+        # --- Timing ---
+        copy_time = min(timeit.repeat(lambda f=func: f(base, override), number=iterations, repeat=3))
+        shared_time = min(timeit.repeat(
+            lambda f=func: f(base, override, share_unchanged=True), number=iterations, repeat=3
+        ))
+
+        print(f"{func.__name__ + '()':<10}: copy {copy_time:.4f}s, share_unchanged {shared_time:.4f}s "
+              f"(speedup: {copy_time / shared_time:.2f}x)")
+
+
+def run_fast_path_benchmark(name: str, base: dict, override: dict, iterations: int):
+    print(f"\n--- Benchmarking combine() Code Paths vs. merge(): {name} ({iterations:,} iterations) ---")
+
+    # --- Validation ---
+    if combine(base, override) != combine(base, override, decision_metrics=[DecisionMetric.PROVENANCE])[0]:
+        print(f"ERROR: {name} combine() code path outputs do not match!")
+        exit(1)
+
+    # --- Timing ---
+    merge_time = min(timeit.repeat(lambda: merge(base, override), number=iterations, repeat=3))
+    combine_time = min(timeit.repeat(lambda: combine(base, override), number=iterations, repeat=3))
+    collect_time = min(timeit.repeat(
+        lambda: combine(base, override, decision_metrics=[DecisionMetric.PROVENANCE]), number=iterations, repeat=3
+    ))
+
+    print(f"merge()                      : {merge_time:.4f}s")
+    print(f"combine() (metrics-free path): {combine_time:.4f}s ({combine_time / merge_time:.2f}x merge)")
+    print(f"combine() (collecting path)  : {collect_time:.4f}s ({collect_time / merge_time:.2f}x merge)")
+
+
 if __name__ == "__main__":
     # 1. Small Tree Benchmark (Balanced)
     run_benchmark(
@@ -269,3 +367,59 @@ if __name__ == "__main__":
         override=override_tree_stochastic,
         iterations=1000
     )
+
+    # 8. Engine Benchmarks (Recursive vs. Iterative)
+    run_engine_benchmark(
+        name="Wide Tree (1,000+ Keys, High Breadth)",
+        base=base_tree_wide,
+        override=override_tree_wide,
+        iterations=500
+    )
+    run_engine_benchmark(
+        name="Deep Tree (100 Levels, High Depth)",
+        base=base_tree_deep,
+        override=override_tree_deep,
+        iterations=1000
+    )
+    run_engine_benchmark(
+        name="Large Enterprise Tree (2,500 Total Nodes)",
+        base=base_tree_large,
+        override=override_tree_large,
+        iterations=50
+    )
+    run_beyond_recursion_limit_benchmark(depth=10_000, iterations=10)
+
+    # 9. Structural Sharing Benchmarks (Copy vs. Copy-on-Write)
+    base_tree_huge = generate_large_enterprise_tree(20_000, "base")
+    run_sharing_benchmark(
+        name="Sparse Overlay (5% of 20,000 Nodes Touched)",
+        base=base_tree_huge,
+        override=generate_sparse_overlay(base_tree_huge, 0.05),
+        iterations=10
+    )
+    run_sharing_benchmark(
+        name="Snapshot Override (5% of 20,000 Nodes Replaced)",
+        base=base_tree_huge,
+        override=generate_snapshot_override(base_tree_huge, 0.05),
+        iterations=10
+    )
+
+    # 10. combine() Code Paths vs. merge() (Metrics-Free Fast Path vs. Collecting Path)
+    run_fast_path_benchmark(
+        name="Wide Tree (1,000+ Keys, High Breadth)",
+        base=base_tree_wide,
+        override=override_tree_wide,
+        iterations=500
+    )
+    run_fast_path_benchmark(
+        name="Deep Tree (100 Levels, High Depth)",
+        base=base_tree_deep,
+        override=override_tree_deep,
+        iterations=1000
+    )
+    run_fast_path_benchmark(
+        name="Same-Shape Overlay (20,000 Nodes)",
+        base=base_tree_huge,
+        override=generate_large_enterprise_tree(20_000, "base"),
+        iterations=5
+    )
@@ -2,7 +2,7 @@ import timeit
 from collections import Counter, defaultdict
 
 from mappingtools.aggregations import Aggregation
-from mappingtools.operators import pivot, rekey
+from mappingtools.operators import pivot, rekey, reshape
 
 
 # Mock of the old inline logic for pivot (for comparison)
@@ -143,6 +143,32 @@ def pivot_hyper_opt(iterable, index, columns, values, mode=Aggregation.LAST):
     return final_result
 
 
+# Mock of the old reshape logic, checking callable() per key on every record (for comparison)
+def reshape_old_logic(iterable, keys, value, aggregation=Aggregation.LAST):  # NOSONAR - just benchmark
+    result = {}
+    aggregate = aggregation.aggregator
+    ctype = aggregation.collection_type
+    path_keys = keys[:-1]
+    leaf_key = keys[-1]
+
+    for item in iterable:
+        current = result
+        for k in path_keys:
+            key_val = k(item) if callable(k) else item.get(k)
+            if key_val not in current:
+                current[key_val] = {}
+            current = current[key_val]
+
+        leaf_val = leaf_key(item) if callable(leaf_key) else item.get(leaf_key)
+        value_val = value(item) if callable(value) else item.get(value)
+
+        if ctype and leaf_val not in current:
+            current[leaf_val] = ctype()
+        aggregate(current, leaf_val, (value_val,))
+
+    return result
+
+
 def benchmark():
     print("Benchmarking pivot (10,000 records)...")
 
@@ -177,6 +203,22 @@ def benchmark():
     t_rekey = timeit.timeit(lambda: rekey(mapping, lambda k, v: k % 100, aggregation=Aggregation.LAST), number=100)
     print(f"Rekey (New): {t_rekey:.4f}s")
 
+    print("\nBenchmarking reshape depth-3 (1,000,000 records)...")
+    records = [
+        {"country": f"country_{i % 10}", "region": f"region_{i % 100}", "product": f"product_{i % 1000}", "sales": i}
+        for i in range(1_000_000)
+    ]
+    keys = ["country", "region", "product"]
+
+    for agg in (Aggregation.LAST, Aggregation.SUM, Aggregation.ALL):
+        t_old = min(timeit.repeat(lambda mode=agg: reshape_old_logic(records, keys, "sales", mode), number=1, repeat=3))
+        t_new = min(timeit.repeat(lambda mode=agg: reshape(records, keys, "sales", mode), number=1, repeat=3))
+
+        print(
+            f"Mode {agg.name:8}: Old: {t_old:.4f}s ({t_old * 1e3:.0f} ns/record),"
+            f" New: {t_new:.4f}s ({t_new * 1e3:.0f} ns/record) ({(t_new - t_old) / t_old * 100:+.2f}%)"
+        )
+
 
 if __name__ == "__main__":
     benchmark()
@@ -1,14 +1,15 @@
 """
 Recipe 04: Deep JSON Diffing
 
-This recipe demonstrates how to use the `flatten()` operator to collapse
-deeply nested JSON structures into single-layer dictionaries with tuple paths as keys.
+This recipe demonstrates how to use the `diff()` operator to find additions,
+removals, and changes between two deeply nested JSON structures, keyed by
+tuple paths as `flatten()` would produce them.
 
-Once flattened, comparing two nested structures to find additions,
-removals, or changes becomes a trivial set operation on their keys.
+The structures are walked together and unchanged subtrees are skipped, so
+neither of them is fully flattened.
 """
 
-from mappingtools.operators import flatten
+from mappingtools.operators import diff
 
 
 def main():
@@ -36,28 +37,13 @@ def main():
         }
     }
 
-    # 3. Flatten both structures into 1D dictionaries
-    # Keys become tuples: ('user', 'preferences', 'theme')
-    flat_original = flatten(original_profile)
-    flat_updated = flatten(updated_profile)
-
-    # 4. Perform set operations on the keys to find the diff
-    keys_original = set(flat_original.keys())
-    keys_updated = set(flat_updated.keys())
-
-    added_keys = keys_updated - keys_original
-    removed_keys = keys_original - keys_updated
-    common_keys = keys_original.intersection(keys_updated)
-
-    changed_keys = {
-        k for k in common_keys
-        if flat_original[k] != flat_updated[k]
-    }
+    # 3. Diff the structures. Paths are tuples: ('user', 'preferences', 'theme')
+    result = diff(original_profile, updated_profile)
 
     print("--- Deep JSON Diff ---")
-    print(f"Added: {[(k, flat_updated[k]) for k in added_keys]}")
-    print(f"Removed: {[(k, flat_original[k]) for k in removed_keys]}")
-    print(f"Changed: {[(k, f'{flat_original[k]} -> {flat_updated[k]}') for k in changed_keys]}")
+    print(f"Added: {list(result['added'].items())}")
+    print(f"Removed: {list(result['removed'].items())}")
+    print(f"Changed: {[(k, f'{old} -> {new}') for k, (old, new) in result['changed'].items()]}")
 
 
 def test_main():
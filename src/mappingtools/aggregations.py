@@ -91,6 +91,49 @@ def ema_aggregator(mapping: MutableMapping, key: Any, values: Iterable[Any]):
     mapping[key] = current_ema
 
 
+def all_merger(first: list, last: list) -> list:
+    """Concatenates two partial lists (in place)."""
+    first.extend(last)
+    return first
+
+
+def count_merger(first: Counter, last: Counter) -> Counter:
+    """Adds the counts of two partial Counters (in place)."""
+    first.update(last)
+    return first
+
+
+def distinct_merger(first: set, last: set) -> set:
+    """Unites two partial sets (in place)."""
+    first |= last
+    return first
+
+
+def first_merger(first: Any, last: Any) -> Any:
+    """Keeps the first partial value."""
+    return first
+
+
+def last_merger(first: Any, last: Any) -> Any:
+    """Keeps the last partial value."""
+    return last
+
+
+def sum_merger(first: Any, last: Any) -> Any:
+    """Adds two partial sums."""
+    return first + last
+
+
+def max_merger(first: Any, last: Any) -> Any:
+    """Takes the maximum of two partial maxima."""
+    return max(first, last)
+
+
+def min_merger(first: Any, last: Any) -> Any:
+    """Takes the minimum of two partial minima."""
+    return min(first, last)
+
+
 class Aggregation(Enum):
     """Data aggregation modes."""
 
@@ -98,29 +141,30 @@ class Aggregation(Enum):
     class Item:
         collection_type: type | None
         func: Callable[[MutableMapping, Any, Iterable[Any]], None]
+        merge: Callable[[Any, Any], Any] | None = None
 
-    ALL = Item(collection_type=list, func=all_aggregator)
+    ALL = Item(collection_type=list, func=all_aggregator, merge=all_merger)
     """Aggregate all values into a list."""
 
-    COUNT = Item(collection_type=Counter, func=count_aggregator)
+    COUNT = Item(collection_type=Counter, func=count_aggregator, merge=count_merger)
     """Count occurrences of each value."""
 
-    DISTINCT = Item(collection_type=set, func=distinct_aggregator)
+    DISTINCT = Item(collection_type=set, func=distinct_aggregator, merge=distinct_merger)
     """Aggregate distinct values into a set."""
 
-    FIRST = Item(collection_type=None, func=first_aggregator)
+    FIRST = Item(collection_type=None, func=first_aggregator, merge=first_merger)
     """Take the first value encountered."""
 
-    LAST = Item(collection_type=None, func=last_aggregator)
+    LAST = Item(collection_type=None, func=last_aggregator, merge=last_merger)
     """Take the last value encountered."""
 
-    SUM = Item(collection_type=float, func=sum_aggregator)
+    SUM = Item(collection_type=float, func=sum_aggregator, merge=sum_merger)
     """Sum all values."""
 
-    MAX = Item(collection_type=float, func=max_aggregator)
+    MAX = Item(collection_type=float, func=max_aggregator, merge=max_merger)
     """Take the maximum value."""
 
-    MIN = Item(collection_type=float, func=min_aggregator)
+    MIN = Item(collection_type=float, func=min_aggregator, merge=min_merger)
     """Take the minimum value."""
 
     EMA = Item(collection_type=float, func=ema_aggregator)
@@ -139,3 +183,14 @@ class Aggregation(Enum):
         Return the aggregator function for this mode.
         """
         return self.value.func
+
+    @property
+    def merger(self) -> Callable[[Any, Any], Any] | None:
+        """
+        Return the function merging two partial results of this mode, or None if they cannot be merged.
+
+        The merger combines a partial result aggregated from earlier values with one aggregated from later values
+        (e.g., in separate processes) and may update the first in place. EMA depends on the order and count of all
+        the values, so its partial results cannot be merged.
+        """
+        return self.value.merge
@@ -1,107 +1,481 @@
+import concurrent.futures
 import itertools
-from collections import defaultdict
-from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
+import os
+import re
+from array import array
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor
 from copy import deepcopy
 from enum import Enum, member
+from functools import lru_cache, partial
+from hashlib import blake2b
 from itertools import chain
-from typing import Any, overload
+from operator import itemgetter, methodcaller
+from typing import Any, Literal, overload
 
 from mappingtools.aggregations import Aggregation
-from mappingtools.resolvers import DecisionMetric, LogicalResolver, NumericResolver, Resolver, ResolverType
+from mappingtools.resolvers import (
+    DecisionMetric,
+    LogicalResolver,
+    NumericResolver,
+    Resolver,
+    ResolverType,
+    _vectorized_resolver,
+)
 from mappingtools.traversal import _is_traversal_iterable
 from mappingtools.typing import MISSING, Combine, K, Missing, T, Tree
 
 __all__ = [
+    'Combiner',
+    'Engine',
+    'FingerprintCache',
+    'Flattener',
     'KeyFormat',
+    'MergedView',
+    'SparseTensor',
+    'TensorFormat',
     'combine',
+    'combine_all',
+    'combine_parallel',
+    'diff',
     'distinct',
+    'fingerprint',
     'flatten',
+    'flatten_many',
+    'iflatten',
     'inverse',
     'merge',
+    'merge_stream',
     'pivot',
+    'pivot_columns',
+    'pivot_sorted',
     'rekey',
     'rename',
     'reshape',
+    'reshape_parallel',
+    'unflatten',
 ]
 
 
 # region combine
 
-def _combine(  # NOSOANR
+class Engine(Enum):
+    """
+    Defines the traversal strategy used by the tree operators (`combine` and `merge`).
+    """
+    RECURSIVE = 'recursive'
+    """Native Python recursion. The fastest; trees deeper than the recursion limit are retried with ITERATIVE."""
+
+    ITERATIVE = 'iterative'
+    """Explicit-stack traversal. Handles trees of arbitrary depth, without first attempting recursion."""
+
+
+def _is_circular(tree: Any) -> bool:
+    """Return True if a dict or list contains itself (at any depth), using an explicit stack."""
+    if not isinstance(tree, (dict, list)):
+        return False
+
+    path = {id(tree)}
+    stack = [(iter(tree.values() if isinstance(tree, dict) else tree), id(tree))]
+    while stack:
+        children, node_id = stack[-1]
+        for child in children:
+            if isinstance(child, (dict, list)):
+                if id(child) in path:
+                    return True
+                path.add(id(child))
+                stack.append((iter(child.values() if isinstance(child, dict) else child), id(child)))
+                break
+        else:
+            stack.pop()
+            path.discard(node_id)
+    return False
+
+
+def _run_engine(engine: Engine, recursive: Callable[..., Any], iterative: Callable[..., Any],
+                t1: Any, t2: Any, *args: Any) -> Any:
+    """Run the implementation of the engine. The recursive one falls back to the iterative one beyond its limit."""
+    if engine is Engine.ITERATIVE:
+        return iterative(t1, t2, *args)
+    try:
+        return recursive(t1, t2, *args)
+    except RecursionError:
+        # Circular trees have no end, so only trees that are merely too deep are retried
+        if _is_circular(t1) or _is_circular(t2):
+            raise
+    return iterative(t1, t2, *args)
+
+
+def _is_branch_pair(t1: Any, t2: Any) -> bool:
+    """Return True if both nodes are dicts or both are lists, i.e., they are combined structurally."""
+    return (isinstance(t1, dict) and isinstance(t2, dict)) or (isinstance(t1, list) and isinstance(t2, list))
+
+
+def _metric_results(t: Any, side: int, metric_ops: dict[str, Any]) -> dict[str, Any]:
+    return {k: DecisionMetric.calculate(t, side, v) for k, v in metric_ops.items()}
+
+
+def _nullified_results(t: Any, metric_ops: dict[str, Any]) -> dict[str, Any]:
+    none_tree = DecisionMetric.nullify(t)
+    return {k: deepcopy(none_tree) for k in metric_ops}
+
+
+def _resolve_leaf(t1: Any, t2: Any, op: Any) -> Any:
+    """Resolve a node pair that is not structurally combinable (i.e., not a dict/dict or list/list pair)."""
+    # If one side is MISSING, the other wins unconditionally. Otherwise, there is a conflict.
+    if t1 is MISSING:
+        return t2
+    if t2 is MISSING:
+        return t1
+    return op(t1, t2)
+
+
+def _resolve_conflict(  # NOSONAR
         t1: Any,
         t2: Any,
         op: Any,
-        metric_ops: dict[str, Any] | None = None,
-        collect: bool = False,
-) -> Any:
-    def metric_results(t: Any, side: int) -> dict[str, Any]:
-        return {k: DecisionMetric.calculate(t, side, v) for k, v in metric_ops.items()}
-
-    def nullified_result(t: Any) -> dict[str, Any]:
-        none_tree = DecisionMetric.nullify(t)
-        return {k: deepcopy(none_tree) for k in metric_ops}
-
+        metric_ops: dict[str, Any],
+) -> tuple[Any, dict[str, Any]]:
+    """Like `_resolve_leaf`, but also returns the decision metrics of the resolution."""
     # 1) If one side is MISSING, the other wins unconditionally.
     if t1 is MISSING:
-        return (t2, metric_results(t2, 1)) if collect else t2
+        return t2, _metric_results(t2, 1, metric_ops)
     if t2 is MISSING:
-        return (t1, metric_results(t1, 0)) if collect else t1
+        return t1, _metric_results(t1, 0, metric_ops)
+
+    # 2) Otherwise, there is a conflict. Resolve it.
+    resolved = op(t1, t2)
+    if resolved is MISSING:
+        return MISSING, dict.fromkeys(metric_ops, MISSING)
+
+    # Check resolved container shape to prevent shape divergence
+    if isinstance(resolved, (dict, list)):
+        if resolved is t1 or resolved == t1:
+            return resolved, _metric_results(resolved, 0, metric_ops)
+        elif resolved is t2 or resolved == t2:
+            return resolved, _metric_results(resolved, 1, metric_ops)
+        else:
+            return resolved, _nullified_results(resolved, metric_ops)
+
+    res_metrics = {}
+    for metric_name, metric_op in metric_ops.items():
+        res_metrics[metric_name] = metric_op(t1, t2, resolved)
+    return resolved, res_metrics
 
-    # 2) If both are dicts, recursively combine.
+
+def _combine(t1: Any, t2: Any, op: Any, vectorized: Callable[[list, list], list | None] | None = None) -> Any:
+    """
+    The recursive combine, without decision metrics. If given, `vectorized` resolves list pairs in a single operation
+    (it returns None for lists it does not handle).
+    """
+    # 1) If both are dicts, recursively combine.
     if isinstance(t1, dict) and isinstance(t2, dict):
         combined = {}
-        metrics = {name: {} for name in metric_ops} if collect else None
-        all_keys = set(t1.keys()) | set(t2.keys())
-        for k in all_keys:
-            res = _combine(t1.get(k, MISSING), t2.get(k, MISSING), op, metric_ops, collect)
-            val = res[0] if collect else res
+        # tree1 keys first, then the keys new in tree2, so the output order is deterministic.
+        for k, v1 in t1.items():
+            val = _combine(v1, t2.get(k, MISSING), op, vectorized)
             if val is not MISSING:
                 combined[k] = val
-                if collect:
-                    m_dict = res[1]
-                    for metric_name in metric_ops:
-                        metrics[metric_name][k] = m_dict[metric_name]
-        return (combined, metrics) if collect else combined
+        for k, v2 in t2.items():
+            if k not in t1 and v2 is not MISSING:
+                combined[k] = v2
+        return combined
+
+    # 2) If both are lists, recursively combine by position.
+    if isinstance(t1, list) and isinstance(t2, list):
+        if vectorized is not None and (resolved := vectorized(t1, t2)) is not None:
+            return resolved
+        return [_combine(i1, i2, op, vectorized) for i1, i2 in itertools.zip_longest(t1, t2, fillvalue=MISSING)]
+
+    # 3) Otherwise, it is a leaf (or a MISSING side, or a structural mismatch).
+    return _resolve_leaf(t1, t2, op)
+
+
+def _combine_collect(  # NOSONAR
+        t1: Any,
+        t2: Any,
+        op: Any,
+        metric_ops: dict[str, Any],
+) -> tuple[Any, dict[str, Any]]:
+    """The recursive combine, collecting the decision metrics alongside the combined tree."""
+    # 1) If both are dicts, recursively combine.
+    if isinstance(t1, dict) and isinstance(t2, dict):
+        combined = {}
+        metrics = {name: {} for name in metric_ops}
+        for k in _key_union(t1, t2):
+            val, m_dict = _combine_collect(t1.get(k, MISSING), t2.get(k, MISSING), op, metric_ops)
+            if val is not MISSING:
+                combined[k] = val
+                for metric_name in metric_ops:
+                    metrics[metric_name][k] = m_dict[metric_name]
+        return combined, metrics
 
-    # 3) If both are lists, recursively combine by position.
+    # 2) If both are lists, recursively combine by position.
     if isinstance(t1, list) and isinstance(t2, list):
         combined = []
-        metrics = {name: [] for name in metric_ops} if collect else None
-        zipped = itertools.zip_longest(t1, t2, fillvalue=MISSING)
-        for i1, i2 in zipped:
-            res = _combine(i1, i2, op, metric_ops, collect)
-            val = res[0] if collect else res
+        metrics = {name: [] for name in metric_ops}
+        for i1, i2 in itertools.zip_longest(t1, t2, fillvalue=MISSING):
+            val, m_dict = _combine_collect(i1, i2, op, metric_ops)
             combined.append(val)
-            if collect:
-                m_dict = res[1]
-                for metric_name in metric_ops:
-                    metrics[metric_name].append(m_dict[metric_name])
-        return (combined, metrics) if collect else combined
+            for metric_name in metric_ops:
+                metrics[metric_name].append(m_dict[metric_name])
+        return combined, metrics
 
-    # 4) Otherwise, there is a conflict. Resolve it.
-    resolved = op(t1, t2)
-    if resolved is MISSING:
-        return (MISSING, dict.fromkeys(metric_ops, MISSING)) if collect else MISSING
+    # 3) Otherwise, it is a leaf (or a MISSING side, or a structural mismatch).
+    return _resolve_conflict(t1, t2, op, metric_ops)
 
-    # Check resolved container shape to prevent shape divergence
-    if isinstance(resolved, (dict, list)):
-        if collect:
-            if resolved is t1 or resolved == t1:
-                return resolved, metric_results(resolved, 0)
-            elif resolved is t2 or resolved == t2:
-                return resolved, metric_results(resolved, 1)
+
+def _key_union(d1: dict, d2: dict) -> Iterator[Any]:
+    """Iterate the keys of d1, then the keys of d2 that are not in d1 (an ordered union, without temporary sets)."""
+    return chain(d1, itertools.filterfalse(d1.__contains__, d2))
+
+
+def _combine_frame(t1: Any, t2: Any) -> tuple:
+    """Create the (still empty) output node of a dict/dict or list/list pair and its traversal stack frame."""
+    if isinstance(t1, dict):
+        return _key_union(t1, t2), t1, t2, {}
+    return itertools.zip_longest(t1, t2, fillvalue=MISSING), None, None, []
+
+
+def _combine_iterative(  # NOSONAR
+        t1: Any,
+        t2: Any,
+        op: Any,
+        vectorized: Callable[[list, list], list | None] | None = None,
+) -> Any:
+    """
+    An explicit-stack equivalent of `_combine`.
+
+    Each stack frame holds a children iterator together with the (still filling) output node. A child node is
+    attached to its parent as soon as it is created, and filled before the remaining siblings are visited, so the
+    insertion order, and hence the output, is identical to the recursive implementation.
+    """
+    if not _is_branch_pair(t1, t2):
+        return _resolve_leaf(t1, t2, op)
+    if vectorized is not None and isinstance(t1, list) and (resolved := vectorized(t1, t2)) is not None:
+        return resolved
+
+    root = _combine_frame(t1, t2)
+    stack = [root]
+
+    while stack:
+        children, d1, d2, node = stack[-1]
+        if d1 is not None:
+            # A dict frame: children is an iterator over the ordered union of keys.
+            for k in children:
+                c1 = d1.get(k, MISSING)
+                c2 = d2.get(k, MISSING)
+                if (isinstance(c1, dict) and isinstance(c2, dict)) or (isinstance(c1, list) and isinstance(c2, list)):
+                    if vectorized is not None and isinstance(c1, list) and (resolved := vectorized(c1, c2)) is not None:
+                        node[k] = resolved
+                        continue
+                    frame = _combine_frame(c1, c2)
+                    node[k] = frame[3]
+                    # Descend into the child before visiting the remaining siblings.
+                    stack.append(frame)
+                    break
+                # An inlined `_resolve_leaf`.
+                if c1 is MISSING:
+                    val = c2
+                elif c2 is MISSING:
+                    val = c1
+                else:
+                    val = op(c1, c2)
+                if val is not MISSING:
+                    node[k] = val
             else:
-                return resolved, nullified_result(resolved)
+                stack.pop()
         else:
-            return resolved
+            # A list frame: children is an iterator over the zipped (longest) pairs.
+            for c1, c2 in children:
+                if (isinstance(c1, dict) and isinstance(c2, dict)) or (isinstance(c1, list) and isinstance(c2, list)):
+                    if vectorized is not None and isinstance(c1, list) and (resolved := vectorized(c1, c2)) is not None:
+                        node.append(resolved)
+                        continue
+                    frame = _combine_frame(c1, c2)
+                    node.append(frame[3])
+                    # Descend into the child before visiting the remaining siblings.
+                    stack.append(frame)
+                    break
+                if c1 is MISSING:
+                    node.append(c2)
+                elif c2 is MISSING:
+                    node.append(c1)
+                else:
+                    node.append(op(c1, c2))
+            else:
+                stack.pop()
 
-    if collect:
-        res_metrics = {}
-        for metric_name, metric_op in metric_ops.items():
-            res_metrics[metric_name] = metric_op(t1, t2, resolved)
-        return resolved, res_metrics
+    return root[3]
+
+
+def _combine_collect_frame(t1: Any, t2: Any, metric_ops: dict[str, Any]) -> tuple:
+    """Like `_combine_frame`, but the frame also holds the (still empty) metric nodes."""
+    frame = _combine_frame(t1, t2)
+    return *frame, {name: type(frame[3])() for name in metric_ops}
+
+
+def _combine_collect_iterative(  # NOSONAR
+        t1: Any,
+        t2: Any,
+        op: Any,
+        metric_ops: dict[str, Any],
+) -> tuple[Any, dict[str, Any]]:
+    """An explicit-stack equivalent of `_combine_collect`."""
+    if not _is_branch_pair(t1, t2):
+        return _resolve_conflict(t1, t2, op, metric_ops)
+
+    root = _combine_collect_frame(t1, t2, metric_ops)
+    stack = [root]
+
+    while stack:
+        children, d1, d2, node, node_metrics = stack[-1]
+        if d1 is not None:
+            # A dict frame: children is an iterator over the ordered union of keys.
+            for k in children:
+                c1 = d1.get(k, MISSING)
+                c2 = d2.get(k, MISSING)
+                if (isinstance(c1, dict) and isinstance(c2, dict)) or (isinstance(c1, list) and isinstance(c2, list)):
+                    frame = _combine_collect_frame(c1, c2, metric_ops)
+                    node[k] = frame[3]
+                    for metric_name in metric_ops:
+                        node_metrics[metric_name][k] = frame[4][metric_name]
+                    # Descend into the child before visiting the remaining siblings.
+                    stack.append(frame)
+                    break
+                val, m_dict = _resolve_conflict(c1, c2, op, metric_ops)
+                if val is not MISSING:
+                    node[k] = val
+                    for metric_name in metric_ops:
+                        node_metrics[metric_name][k] = m_dict[metric_name]
+            else:
+                stack.pop()
+        else:
+            # A list frame: children is an iterator over the zipped (longest) pairs.
+            for c1, c2 in children:
+                if (isinstance(c1, dict) and isinstance(c2, dict)) or (isinstance(c1, list) and isinstance(c2, list)):
+                    frame = _combine_collect_frame(c1, c2, metric_ops)
+                    node.append(frame[3])
+                    for metric_name in metric_ops:
+                        node_metrics[metric_name].append(frame[4][metric_name])
+                    # Descend into the child before visiting the remaining siblings.
+                    stack.append(frame)
+                    break
+                val, m_dict = _resolve_conflict(c1, c2, op, metric_ops)
+                node.append(val)
+                for metric_name in metric_ops:
+                    node_metrics[metric_name].append(m_dict[metric_name])
+            else:
+                stack.pop()
+
+    return root[3], root[4]
+
+
+_IDEMPOTENT_RESOLVERS = frozenset(r.value for r in (
+    Resolver.COALESCE_FIRST,
+    Resolver.COALESCE_LAST,
+    Resolver.FIRST,
+    Resolver.LAST,
+    Resolver.PREFER_FIRST,
+    Resolver.PREFER_LAST,
+    Resolver.TYPE_SAFE,
+))
+"""Resolvers for which `op(x, x)` is `x`, so combining a subtree with itself yields the very same subtree."""
+
+
+def _combine_shared(t1: Any, t2: Any, leaf: Callable[[Any, Any], Any], share_identical: bool) -> Any:
+    """
+    Combine two trees with structural sharing: a dict node starts as a shallow copy of the `t1` node, so subtrees
+    that exist only in `t1` are reused without being walked, and only the children of `t2` are visited.
+    If `share_identical` is True, subtrees that are identical (by identity) in both trees are reused as well.
+    """
+    if share_identical and t1 is t2:
+        return t1
+    if isinstance(t1, dict) and isinstance(t2, dict):
+        combined = dict(t1)
+        for k, v2 in t2.items():
+            val = _combine_shared(t1.get(k, MISSING), v2, leaf, share_identical)
+            if val is MISSING:
+                combined.pop(k, None)
+            else:
+                combined[k] = val
+        return combined
+    if isinstance(t1, list) and isinstance(t2, list):
+        zipped = itertools.zip_longest(t1, t2, fillvalue=MISSING)
+        return [_combine_shared(i1, i2, leaf, share_identical) for i1, i2 in zipped]
+    return leaf(t1, t2)
+
+
+def _combine_shared_iterative(  # NOSONAR
+        t1: Any,
+        t2: Any,
+        leaf: Callable[[Any, Any], Any],
+        share_identical: bool,
+) -> Any:
+    """
+    An explicit-stack equivalent of `_combine_shared`.
+
+    Each stack frame holds a children iterator, the original `t1` node (None for list frames) and the (still filling)
+    output node. A child node is attached to its parent as soon as it is created, and filled before the remaining
+    siblings are visited.
+    """
+    if share_identical and t1 is t2:
+        return t1
+    if isinstance(t1, dict) and isinstance(t2, dict):
+        root = (iter(t2.items()), t1, dict(t1))
+    elif isinstance(t1, list) and isinstance(t2, list):
+        root = (itertools.zip_longest(t1, t2, fillvalue=MISSING), None, [])
+    else:
+        return leaf(t1, t2)
+
+    stack = [root]
+    while stack:
+        children, d1, node = stack[-1]
+        if d1 is not None:
+            # A dict frame: the node is a copy of d1, so only the items of t2 are visited.
+            for k, v2 in children:
+                v1 = d1.get(k, MISSING)
+                if v1 is v2 and share_identical:
+                    continue
+                if isinstance(v1, dict) and isinstance(v2, dict):
+                    frame = (iter(v2.items()), v1, dict(v1))
+                elif isinstance(v1, list) and isinstance(v2, list):
+                    frame = (itertools.zip_longest(v1, v2, fillvalue=MISSING), None, [])
+                else:
+                    val = leaf(v1, v2)
+                    if val is MISSING:
+                        node.pop(k, None)
+                    else:
+                        node[k] = val
+                    continue
+                node[k] = frame[2]
+                # Descend into the child before visiting the remaining siblings.
+                stack.append(frame)
+                break
+            else:
+                stack.pop()
+        else:
+            # A list frame: children is an iterator over the zipped (longest) pairs.
+            for i1, i2 in children:
+                if i1 is i2 and share_identical:
+                    node.append(i1)
+                    continue
+                if isinstance(i1, dict) and isinstance(i2, dict):
+                    frame = (iter(i2.items()), i1, dict(i1))
+                elif isinstance(i1, list) and isinstance(i2, list):
+                    frame = (itertools.zip_longest(i1, i2, fillvalue=MISSING), None, [])
+                else:
+                    node.append(leaf(i1, i2))
+                    continue
+                node.append(frame[2])
+                # Descend into the child before visiting the remaining siblings.
+                stack.append(frame)
+                break
+            else:
+                stack.pop()
 
-    return resolved
+    return root[2]
 
 
 @overload
@@ -110,6 +484,9 @@ def combine(
         tree2: Tree[T] | Missing = MISSING,
         op: Combine | ResolverType = Resolver.LAST,
         decision_metrics: None = None,
+        *,
+        engine: Engine = ...,
+        share_unchanged: bool = ...,
 ) -> Tree[T] | Any:
     ...
 
@@ -120,6 +497,9 @@ def combine(
         tree2: Tree[T] | Missing = MISSING,
         op: Combine | ResolverType = Resolver.LAST,
         decision_metrics: list[DecisionMetric | Callable[[Any, Any, Any], Any]] = ...,
+        *,
+        engine: Engine = ...,
+        share_unchanged: bool = ...,
 ) -> tuple[Tree[T] | Any, dict[str, Tree[Any] | Any]]:
     ...
 
@@ -129,22 +509,66 @@ def combine(
         tree2: Tree[T] | Missing = MISSING,
         op: Combine | ResolverType = Resolver.LAST,
         decision_metrics: list[DecisionMetric | Callable[[Any, Any, Any], Any]] | None = None,
+        *,
+        engine: Engine = Engine.RECURSIVE,
+        share_unchanged: bool = False,
 ) -> Any:
     """
     Combines two trees using a binary operator `op` that resolves conflicts at the leaf nodes.
-    Optionally extracts decision metrics of the combination process in a single recursive pass.
+    Optionally extracts decision metrics of the combination process in a single pass.
+
+    The key order of each combined dict is deterministic: the keys of tree1 in their order, followed by the keys
+    that are new in tree2 in their order.
+
+    If NumPy is installed, conflicts between long, homogeneous numeric lists are resolved by a NumericResolver in a
+    single vectorized operation, with identical results.
 
     Args:
         tree1: The first tree structure.
         tree2: The second tree structure.
         op: A resolver strategy or custom callable to handle conflicts. Defaults to Resolver.LAST.
         decision_metrics: An optional list of DecisionMetric enums or custom callable metrics.
+        engine: The traversal strategy. Defaults to Engine.RECURSIVE, which retries trees deeper than the recursion
+            limit with Engine.ITERATIVE (so a custom `op` may be called again for some leaves).
+        share_unchanged: If True, reuse unchanged subtrees of the inputs in the output instead of walking and
+            rebuilding them: subtrees that exist only in one of the trees are never walked, and subtrees that are
+            identical (by identity) in both trees are reused when `op` is idempotent (e.g., Resolver.LAST).
+            The output then shares nodes with the inputs, so it must not be mutated in place. Not supported with
+            decision_metrics, which require visiting every leaf. Defaults to False.
 
     Returns:
         The combined tree structure if decision_metrics is None, otherwise a 2-tuple containing:
         1. The combined tree structure.
         2. A dictionary mapping each metric's name to its corresponding metric tree.
+
+    Raises:
+        ValueError: If share_unchanged is used together with decision_metrics.
     """
+    op, metric_ops = _combine_ops(op, decision_metrics)
+    collect = decision_metrics is not None
+
+    if share_unchanged:
+        if collect:
+            raise ValueError("'share_unchanged' cannot be used together with 'decision_metrics'.")
+
+        def leaf(t1: Any, t2: Any) -> Any:
+            return _resolve_leaf(t1, t2, op)
+
+        return _run_engine(engine, _combine_shared, _combine_shared_iterative,
+                           tree1, tree2, leaf, op in _IDEMPOTENT_RESOLVERS)
+
+    # Dispatch to a dedicated code path, so that the common (metrics-free) case does no per-node metrics bookkeeping.
+    if collect:
+        return _run_engine(engine, _combine_collect, _combine_collect_iterative, tree1, tree2, op, metric_ops)
+
+    return _run_engine(engine, _combine, _combine_iterative, tree1, tree2, op, _vectorized_resolver(op))
+
+
+def _combine_ops(
+        op: Combine | ResolverType,
+        decision_metrics: list[DecisionMetric | Callable[[Any, Any, Any], Any]] | None,
+) -> tuple[Any, dict[str, Any]]:
+    """Unwrap the resolver enum (if any) and map each decision metric to its name."""
     if isinstance(op, (Resolver, LogicalResolver, NumericResolver)):
         op = op.value
 
@@ -155,8 +579,561 @@ def combine(
             for v in decision_metrics
         )
 
+    return op, metric_ops
+
+
+def _branch_type(values: list) -> type | None:
+    """Return dict (or list) if all values are dicts (or all are lists), otherwise None."""
+    kind = dict if isinstance(values[0], dict) else list if isinstance(values[0], list) else None
+    if kind is not None and all(isinstance(v, kind) for v in values):
+        return kind
+    return None
+
+
+def _combine_all_children(kind: type, head: list, last: Any) -> Iterator[tuple[Any, list, Any]]:
+    """Iterate the (key, child head, child last) triplets of a node whose values are all dicts or all lists."""
+    if kind is dict:
+        # Group the children by key in a single pass over all items (first-seen key order).
+        groups = {}
+        for d in head:
+            for k, v in d.items():
+                group = groups.get(k)
+                if group is None:
+                    groups[k] = [v]
+                else:
+                    group.append(v)
+        if last is MISSING:
+            return ((k, group, MISSING) for k, group in groups.items())
+        for k in last:
+            groups.setdefault(k, [])
+        return ((k, group, last.get(k, MISSING)) for k, group in groups.items())
+
+    if last is MISSING:
+        rows = itertools.zip_longest(*head, fillvalue=MISSING)
+        return ((None, [v for v in row if v is not MISSING], MISSING) for row in rows)
+    rows = itertools.zip_longest(*head, last, fillvalue=MISSING)
+    return ((None, [v for v in row[:-1] if v is not MISSING], row[-1]) for row in rows)
+
+
+def _combine_all_node(head: list, last: Any, op: Any, metric_ops: dict[str, Any], collect: bool) -> tuple[Any, Any]:
+    """
+    Resolve a node of the N-ary combination.
+
+    Returns a 2-tuple of the node result and, if the node is structurally combined, its traversal stack frame
+    (otherwise None). When collecting, `head` holds the values of all trees but the last, whose value is `last`.
+    When not collecting, `head` holds the values of all trees and `last` is always MISSING.
+    """
+    if not collect and len(head) == 1:
+        # A subtree present in a single tree is taken as is.
+        return head[0], None
+
+    values = head if last is MISSING else [*head, last]
+    is_branch = bool(head) and last is not MISSING if collect else len(values) > 1
+    kind = _branch_type(values) if is_branch else None
+
+    if kind is None:
+        if collect:
+            # Metrics describe how the last tree combines onto the combination of all preceding trees.
+            acc = _combine_all(head, MISSING, op, metric_ops, False)
+            return _combine_collect_iterative(acc, last, op, metric_ops), None
+        if len(values) == 1:
+            return values[0], None
+        # A leaf conflict (or a structural mismatch): left fold with the binary combine.
+        acc = MISSING
+        for v in values:
+            acc = _combine_iterative(acc, v, op)
+        return acc, None
+
+    node = kind()
+    metrics = {name: kind() for name in metric_ops} if collect else None
+    frame = (_combine_all_children(kind, head, last), node, metrics)
+    return ((node, metrics) if collect else node), frame
+
+
+def _combine_all(head: list, last: Any, op: Any, metric_ops: dict[str, Any], collect: bool) -> Any:
+    """
+    An explicit-stack, single pass N-ary combine. At each level the key union of all trees is walked exactly once.
+    """
+    root, frame = _combine_all_node(head, last, op, metric_ops, collect)
+    if frame is None:
+        return root
+
+    stack = [frame]
+    while stack:
+        children, node, node_metrics = stack[-1]
+        is_dict = isinstance(node, dict)
+        for k, child_head, child_last in children:
+            res, frame = _combine_all_node(child_head, child_last, op, metric_ops, collect)
+            val, m_dict = res if collect else (res, None)
+
+            if is_dict:
+                if val is not MISSING:
+                    node[k] = val
+                    if collect:
+                        for metric_name in metric_ops:
+                            node_metrics[metric_name][k] = m_dict[metric_name]
+            else:
+                node.append(val)
+                if collect:
+                    for metric_name in metric_ops:
+                        node_metrics[metric_name].append(m_dict[metric_name])
+
+            if frame is not None:
+                # Descend into the child before visiting the remaining siblings.
+                stack.append(frame)
+                break
+        else:
+            stack.pop()
+
+    return root
+
+
+@overload
+def combine_all(
+        *trees: Tree[T] | Missing,
+        op: Combine | ResolverType = Resolver.LAST,
+        decision_metrics: None = None,
+) -> Tree[T] | Any:
+    ...
+
+
+@overload
+def combine_all(
+        *trees: Tree[T] | Missing,
+        op: Combine | ResolverType = Resolver.LAST,
+        decision_metrics: list[DecisionMetric | Callable[[Any, Any, Any], Any]] = ...,
+) -> tuple[Tree[T] | Any, dict[str, Tree[Any] | Any]]:
+    ...
+
+
+def combine_all(
+        *trees: Tree[T] | Missing,
+        op: Combine | ResolverType = Resolver.LAST,
+        decision_metrics: list[DecisionMetric | Callable[[Any, Any, Any], Any]] | None = None,
+) -> Any:
+    """
+    Combines any number of trees in a single pass, using a binary operator `op` that resolves conflicts at the leaf
+    nodes.
+
+    The result equals (as a mapping) the left fold `functools.reduce(lambda a, b: combine(a, b, op), trees)`, but the
+    key union of all trees is walked exactly once per level and each output node is allocated once, instead of
+    rebuilding the accumulated tree for every tree. Conflicting leaves are resolved by folding `op` from left to right.
+    Keys are in first-seen order, so when a resolver drops a key (e.g., Resolver.VOID) that a later tree adds back,
+    the key keeps its first position, whereas the fold appends it.
+
+    Args:
+        *trees: The tree structures, in order of precedence (lowest first).
+        op: A resolver strategy or custom callable to handle conflicts. Defaults to Resolver.LAST.
+        decision_metrics: An optional list of DecisionMetric enums or custom callable metrics. The metrics describe
+            how the last tree combines onto the combination of all preceding trees, i.e., they are identical to
+            `combine(combine_all(*trees[:-1], op=op), trees[-1], op, decision_metrics)`.
+
+    Returns:
+        The combined tree structure if decision_metrics is None, otherwise a 2-tuple containing:
+        1. The combined tree structure.
+        2. A dictionary mapping each metric's name to its corresponding metric tree.
+    """
+    op, metric_ops = _combine_ops(op, decision_metrics)
+
+    if decision_metrics is None:
+        return _combine_all([t for t in trees if t is not MISSING], MISSING, op, metric_ops, False)
+
+    head = [t for t in trees[:-1] if t is not MISSING]
+    last = trees[-1] if trees else MISSING
+    return _combine_all(head, last, op, metric_ops, True)
+
+
+def _combine_chunk(t1: dict, t2: dict, op: Any, metric_ops: dict[str, Any], collect: bool) -> Any:
+    """Combine a chunk of top-level subtrees. Runs in an executor worker, so it must be a module level function."""
+    if collect:
+        return _combine_collect_iterative(t1, t2, op, metric_ops)
+    return _combine_iterative(t1, t2, op, _vectorized_resolver(op))
+
+
+def _combine_chunks(  # NOSONAR
+        executor: Executor,
+        tree1: dict,
+        tree2: dict,
+        keys: list,
+        op: Any,
+        metric_ops: dict[str, Any],
+        collect: bool,
+        chunks: int,
+) -> Any:
+    """Partition the (ordered) top-level keys into contiguous chunks, combine them in the executor and reassemble."""
+    size = -(-len(keys) // chunks)
+    futures = []
+    for i in range(0, len(keys), size):
+        part = keys[i:i + size]
+        t1 = {k: tree1[k] for k in part if k in tree1}
+        t2 = {k: tree2[k] for k in part if k in tree2}
+        futures.append(executor.submit(_combine_chunk, t1, t2, op, metric_ops, collect))
+
+    # The chunks are contiguous slices of the ordered key union, so updating in submission order preserves it.
+    combined = {}
+    metrics = {name: {} for name in metric_ops}
+    for future in futures:
+        res = future.result()
+        if collect:
+            res, m_dict = res
+            for metric_name in metric_ops:
+                metrics[metric_name].update(m_dict[metric_name])
+        combined.update(res)
+
+    return (combined, metrics) if collect else combined
+
+
+@overload
+def combine_parallel(
+        tree1: Tree[T] | Missing = MISSING,
+        tree2: Tree[T] | Missing = MISSING,
+        op: Combine | ResolverType = Resolver.LAST,
+        decision_metrics: None = None,
+        *,
+        executor: Executor | None = ...,
+        chunks: int | None = ...,
+        min_keys: int = ...,
+) -> Tree[T] | Any:
+    ...
+
+
+@overload
+def combine_parallel(
+        tree1: Tree[T] | Missing = MISSING,
+        tree2: Tree[T] | Missing = MISSING,
+        op: Combine | ResolverType = Resolver.LAST,
+        decision_metrics: list[DecisionMetric | Callable[[Any, Any, Any], Any]] = ...,
+        *,
+        executor: Executor | None = ...,
+        chunks: int | None = ...,
+        min_keys: int = ...,
+) -> tuple[Tree[T] | Any, dict[str, Tree[Any] | Any]]:
+    ...
+
+
+def combine_parallel(
+        tree1: Tree[T] | Missing = MISSING,
+        tree2: Tree[T] | Missing = MISSING,
+        op: Combine | ResolverType = Resolver.LAST,
+        decision_metrics: list[DecisionMetric | Callable[[Any, Any, Any], Any]] | None = None,
+        *,
+        executor: Executor | None = None,
+        chunks: int | None = None,
+        min_keys: int = 10_000,
+) -> Any:
+    """
+    Combines two wide trees in parallel. The ordered union of the top-level keys is partitioned into contiguous
+    chunks, the subtrees of each chunk are combined in a `concurrent.futures` executor, and the partial results (and
+    metrics) are reassembled in the original key order. The output is identical to `combine`.
+
+    Trees that are not both dicts, or whose top-level key union is smaller than `min_keys`, are combined serially,
+    so small combinations do not pay the pickling and scheduling overhead.
+
+    Args:
+        tree1: The first tree structure.
+        tree2: The second tree structure.
+        op: A resolver strategy or custom callable to handle conflicts. Defaults to Resolver.LAST.
+        decision_metrics: An optional list of DecisionMetric enums or custom callable metrics.
+        executor: The executor to run the chunks in. With a process pool, `op` and the metrics must be picklable
+            (e.g., module level functions). Defaults to None, which creates (and shuts down) a ProcessPoolExecutor
+            per call; pass a long-lived executor to amortize its startup.
+        chunks: The number of chunks to partition the top-level keys into. Defaults to the number of CPUs.
+        min_keys: The minimal size of the top-level key union to combine in parallel. Defaults to 10,000.
+
+    Returns:
+        The combined tree structure if decision_metrics is None, otherwise a 2-tuple containing:
+        1. The combined tree structure.
+        2. A dictionary mapping each metric's name to its corresponding metric tree.
+    """
+    if not (isinstance(tree1, dict) and isinstance(tree2, dict)):
+        return combine(tree1, tree2, op, decision_metrics)
+
+    keys = list(_key_union(tree1, tree2))
+    if len(keys) < min_keys:
+        return combine(tree1, tree2, op, decision_metrics)
+
+    op, metric_ops = _combine_ops(op, decision_metrics)
     collect = decision_metrics is not None
-    return _combine(tree1, tree2, op, metric_ops, collect=collect)
+    chunks = max(1, min(chunks or os.cpu_count() or 1, len(keys)))
+
+    if executor is None:
+        with concurrent.futures.ProcessPoolExecutor() as pool:
+            return _combine_chunks(pool, tree1, tree2, keys, op, metric_ops, collect, chunks)
+    return _combine_chunks(executor, tree1, tree2, keys, op, metric_ops, collect, chunks)
+
+
+class MergedView(Mapping):
+    """
+    A read-only, lazy Mapping presenting the combination of several trees (layers) without materializing it.
+
+    Key lookups resolve through the layers on demand: a key whose values are dicts in every layer that holds it is
+    returned as a nested `MergedView` of those values, and any other key is resolved exactly as `combine_all` would
+    resolve it (conflicting leaves are folded with `op` from left to right). Resolved values are cached per view, so
+    the layers must not be mutated while the view is in use.
+
+    Args:
+        *trees: The dict layers, in order of precedence (lowest first). MISSING layers are ignored.
+        op: A resolver strategy or custom callable to handle conflicts. Defaults to Resolver.LAST.
+
+    Raises:
+        TypeError: If a layer is not a dict.
+    """
+
+    __slots__ = ('_cache', '_layers', '_op')
+
+    def __init__(self, *trees: dict | Missing, op: Combine | ResolverType = Resolver.LAST):
+        layers = [t for t in trees if t is not MISSING]
+        for layer in layers:
+            if not isinstance(layer, dict):
+                raise TypeError(f'MergedView layers must be dicts, got {type(layer).__name__}.')
+        self._layers = layers
+        self._op, _ = _combine_ops(op, None)
+        self._cache = {}
+
+    @classmethod
+    def _of(cls, layers: list[dict], op: Any) -> 'MergedView':
+        """Create a nested view over already validated layers and an unwrapped resolver."""
+        view = cls.__new__(cls)
+        view._layers = layers
+        view._op = op
+        view._cache = {}
+        return view
+
+    def _resolve(self, key: Any) -> Any:
+        """Resolve the value of a key across the layers (MISSING if absent or resolved to MISSING)."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        values = [layer[key] for layer in self._layers if key in layer]
+        if not values:
+            return MISSING
+
+        if all(isinstance(v, dict) for v in values):
+            value = MergedView._of(values, self._op)
+        else:
+            value = _combine_all(values, MISSING, self._op, {}, False)
+        self._cache[key] = value
+        return value
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._resolve(key)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        # Keys in first-seen order across the layers, skipping keys the resolver drops (e.g. Resolver.VOID).
+        for key in dict.fromkeys(chain.from_iterable(self._layers)):
+            if self._resolve(key) is not MISSING:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f'MergedView(layers={len(self._layers)}, op={getattr(self._op, "__name__", self._op)})'
+
+    @property
+    def layers(self) -> tuple[dict, ...]:
+        """The layers of this view, in order of precedence (lowest first)."""
+        return tuple(self._layers)
+
+    def materialize(self) -> dict:
+        """
+        Materialize the view into a plain tree.
+
+        Returns:
+            A tree equal to `combine_all(*layers, op=op)` (and thus to folding the layers with `combine`).
+        """
+        if not self._layers:
+            return {}
+        return _combine_all(self._layers, MISSING, self._op, {}, False)
+
+
+def _copy_branches(tree: Any) -> Any:
+    """Copy the dicts and lists of a tree (leaves are shared), without aliasing repeated subtrees."""
+    if not isinstance(tree, (dict, list)):
+        return tree
+
+    root = {} if isinstance(tree, dict) else []
+    stack = [(tree, root)]
+    while stack:
+        source, target = stack.pop()
+        is_dict = isinstance(source, dict)
+        for k, v in source.items() if is_dict else enumerate(source):
+            if isinstance(v, (dict, list)):
+                copy = {} if isinstance(v, dict) else []
+                stack.append((v, copy))
+                v = copy
+            if is_dict:
+                target[k] = v
+            else:
+                target.append(v)
+    return root
+
+
+def _apply_patch(node: dict, patch: dict) -> dict:
+    """Apply a merge patch to a dict in place. MISSING values in the patch delete the respective keys."""
+    for k, p in patch.items():
+        if p is MISSING:
+            node.pop(k, None)
+        elif isinstance(p, dict):
+            child = node.get(k)
+            if not isinstance(child, dict):
+                child = node[k] = {}
+            _apply_patch(child, p)
+        else:
+            node[k] = _copy_branches(p)
+    return node
+
+
+_KEEP = object()
+"""Marks a key that is not patched by a delta."""
+
+
+def _stays_dict(p: Any, o: Any) -> bool:
+    """Return True if an input value `o` is a dict (or absent) and remains so after applying its patch `p`."""
+    if p is _KEEP:
+        return o is MISSING or isinstance(o, dict)
+    return isinstance(p, dict) and isinstance(o, dict)
+
+
+class Combiner:
+    """
+    An incremental `combine`. Holds the last inputs, the combined tree and its decision metrics, and accepts deltas
+    to either input, recomputing only the paths the deltas touch.
+
+    A delta is a merge patch: a (nested) dict whose leaves replace the values at their paths, nested dicts are applied
+    recursively onto existing dicts, and MISSING values delete their keys. The combiner keeps private copies of the
+    inputs, so the result and metric trees are updated in place and must not be mutated by the caller.
+
+    Args:
+        tree1: The first tree structure.
+        tree2: The second tree structure.
+        op: A resolver strategy or custom callable to handle conflicts. Defaults to Resolver.LAST.
+        decision_metrics: An optional list of DecisionMetric enums or custom callable metrics.
+    """
+
+    _ROOT = None
+    """The key of the root in the internal holders, which let the root be patched like any other node."""
+
+    def __init__(
+            self,
+            tree1: Tree[T] | Missing = MISSING,
+            tree2: Tree[T] | Missing = MISSING,
+            op: Combine | ResolverType = Resolver.LAST,
+            decision_metrics: list[DecisionMetric | Callable[[Any, Any, Any], Any]] | None = None,
+    ):
+        self._op, self._metric_ops = _combine_ops(op, decision_metrics)
+        self._collect = decision_metrics is not None
+        self._inputs = tuple({} if t is MISSING else {self._ROOT: _copy_branches(t)} for t in (tree1, tree2))
+        self._result = {}
+        self._metrics = {name: {} for name in self._metric_ops}
+        self._recompute(self._result, self._metrics, self._ROOT, tree1, tree2)
+
+    @property
+    def tree1(self) -> Tree[T] | Any:
+        """The first tree, with all the deltas applied."""
+        return self._inputs[0].get(self._ROOT, MISSING)
+
+    @property
+    def tree2(self) -> Tree[T] | Any:
+        """The second tree, with all the deltas applied."""
+        return self._inputs[1].get(self._ROOT, MISSING)
+
+    @property
+    def result(self) -> Tree[T] | Any:
+        """The combined tree."""
+        return self._result.get(self._ROOT, MISSING)
+
+    @property
+    def metrics(self) -> dict[str, Tree[Any] | Any]:
+        """A dictionary mapping each metric's name to its corresponding metric tree."""
+        return {name: metric.get(self._ROOT, MISSING) for name, metric in self._metrics.items()}
+
+    def update(self, delta1: dict | None = None, delta2: dict | None = None) -> Any:
+        """
+        Apply deltas to the inputs and recompute only the affected paths of the result and the metric trees.
+
+        Args:
+            delta1: A merge patch for the first tree.
+            delta2: A merge patch for the second tree.
+
+        Returns:
+            The combined tree if no decision metrics were given, otherwise a 2-tuple of the combined tree and the
+            metrics dictionary, i.e., exactly what `combine(tree1, tree2, op, decision_metrics)` returns for the
+            patched inputs.
+        """
+        deltas = tuple(MISSING if d is None else {self._ROOT: d} for d in (delta1, delta2))
+        self._patch(*self._inputs, self._result, self._metrics, *deltas)
+        return (self.result, self.metrics) if self._collect else self.result
+
+    def _recompute(self, result: dict, metrics: dict[str, dict], k: Any, v1: Any, v2: Any) -> None:
+        """Combine the inputs of a single key and store the (private) result and metrics in their parents."""
+        if self._collect:
+            val, m_dict = _combine_collect_iterative(v1, v2, self._op, self._metric_ops)
+        else:
+            val, m_dict = _combine_iterative(v1, v2, self._op), None
+        if val is MISSING:
+            result.pop(k, None)
+            for metric in metrics.values():
+                metric.pop(k, None)
+            return
+
+        result[k] = _copy_branches(val)
+        for name, metric in metrics.items():
+            metric[k] = m_dict[name]
+
+    def _patch(  # NOSONAR
+            self,
+            n1: dict | Missing,
+            n2: dict | Missing,
+            result: dict,
+            metrics: dict[str, dict],
+            d1: dict | Missing,
+            d2: dict | Missing,
+    ) -> None:
+        """Walk the deltas alongside the inputs (MISSING if absent), the result and the metrics of a dict node."""
+        reorder = False
+        for k in dict.fromkeys(chain(() if d1 is MISSING else d1, () if d2 is MISSING else d2)):
+            p1 = _KEEP if d1 is MISSING else d1.get(k, _KEEP)
+            p2 = _KEEP if d2 is MISSING else d2.get(k, _KEEP)
+            o1 = MISSING if n1 is MISSING else n1.get(k, MISSING)
+            o2 = MISSING if n2 is MISSING else n2.get(k, MISSING)
+
+            if (o1 is not MISSING or o2 is not MISSING) and _stays_dict(p1, o1) and _stays_dict(p2, o2):
+                # Both sides stay dicts (or absent): the result node is a dict and only the patched keys change.
+                self._patch(
+                    o1, o2, result[k], {name: metric[k] for name, metric in metrics.items()},
+                    p1 if isinstance(p1, dict) else MISSING,
+                    p2 if isinstance(p2, dict) else MISSING,
+                )
+                continue
+
+            values = []
+            for n, o, p in ((n1, o1, p1), (n2, o2, p2)):
+                if p is not _KEEP:
+                    if p is MISSING:
+                        o = MISSING
+                        n.pop(k, None)
+                    else:
+                        o = n[k] = _apply_patch(o if isinstance(o, dict) else {}, p) if isinstance(p, dict) \
+                            else _copy_branches(p)
+                values.append(o)
+            present = k in result
+            self._recompute(result, metrics, k, *values)
+            # A key added to or deleted from either side (or the result) may move in the key order of combine.
+            reorder = reorder or present != (k in result) or (o1 is MISSING) != (values[0] is MISSING) \
+                or (o2 is MISSING) != (values[1] is MISSING)
+
+        if reorder:
+            order = list(_key_union({} if n1 is MISSING else n1, {} if n2 is MISSING else n2))
+            for node in (result, *metrics.values()):
+                ordered = {k: node[k] for k in order if k in node}
+                node.clear()
+                node.update(ordered)
 
 # endregion combine
 
@@ -230,65 +1207,804 @@ class KeyFormat(Enum):
     JSONPOINTER = member(('', _flatten_step_pointer))
 
 
+def _flatten_cached_step(step: Callable[[str, Any], str]) -> Callable[[str, Any], str]:
+    """
+    Wrap the step of a string key format, so the suffix it appends for a str part is formatted only once.
+
+    Every string step appends a suffix to a non-empty path that depends only on the part, so the suffix is cached per
+    str part (e.g. a field name repeated in many records) and appended to the path of the parent.
+    """
+    suffixes = {}
+
+    def cached_step(path: str, part: Any) -> str:
+        if type(part) is str and path:
+            suffix = suffixes.get(part)
+            if suffix is None:
+                suffix = suffixes[part] = step('_', part)[1:]
+            return path + suffix
+        return step(path, part)
+
+    return cached_step
+
+
+def _flatten(data: Tree[Any], initial: Any, step: Callable[[Any, Any], Any]) -> dict:
+    result = {}
+
+    if not isinstance(data, (dict, list)):
+        result[initial] = data
+        return result
+
+    # Each frame holds the children iterator, the path and the container.
+    stack = [(iter(data.items()) if isinstance(data, dict) else enumerate(data), initial, data)]
+
+    while stack:
+        children, path, container = stack[-1]
+        is_dict = isinstance(container, dict)
+        for k, v in children:
+            # Fast path for list indices and common atomic keys (str, int)
+            if not is_dict or isinstance(k, (str, int)) or not _is_traversal_iterable(k):
+                child_path = step(path, k)
+            else:
+                # k is a tuple/list/iterable, extend the path by each of its parts.
+                child_path = path
+                for part in tuple(k):
+                    child_path = step(child_path, part)
+
+            if isinstance(v, dict):
+                v_children = iter(v.items())
+            elif isinstance(v, list):
+                v_children = enumerate(v)
+            else:
+                result[child_path] = v
+                continue
+
+            # A circular reference grows the stack without bound. Look for it only when the depth reaches a power of
+            # two, which keeps the check amortized O(1) per frame.
+            depth = len(stack)
+            if depth >= 1024 and not depth & (depth - 1) and any(frame[2] is v for frame in stack):
+                raise RecursionError('Cannot flatten a tree with a circular reference.')
+            # Descend into the child before visiting the remaining siblings.
+            stack.append((v_children, child_path, v))
+            break
+        else:
+            stack.pop()
+
+    return result
+
+
 def flatten(data: Tree[Any], key_format: KeyFormat = KeyFormat.TUPLE) -> Tree[Any]:
     """
     Flatten a nested tree structure (dicts and lists) into a single-level dictionary.
 
+    The tree is walked with an explicit stack, so there is no limit on its depth. For the string key formats, the
+    formatted suffix of each str key is computed once per call and appended to the path of its parent.
+
     Args:
         data (Tree[Any]): The nested mapping or list to flatten.
         key_format (KeyFormat): The format for keys. Defaults to KeyFormat.TUPLE.
 
     Returns:
         Tree[Any]: The flattened dictionary.
+
+    Raises:
+        RecursionError: If the tree contains a circular reference.
     """
-    result = {}
     initial, step = key_format.value
+    return _flatten(data, initial, _flatten_cached_step(step) if isinstance(initial, str) else step)
+
+
+def _iflatten(data: Tree[Any], initial: Any, step: Callable[[Any, Any], Any], max_depth: int | None,
+              is_leaf: Callable[[Any, Any], bool] | None) -> Generator[tuple[Any, Any], None, None]:
+    if not isinstance(data, (dict, list)) or max_depth == 0 or (is_leaf is not None and is_leaf(initial, data)):
+        yield initial, data
+        return
+
+    # Each frame holds the children iterator, the path and the container.
+    stack = [(iter(data.items()) if isinstance(data, dict) else enumerate(data), initial, data)]
 
-    def _recurse(value: Any, current_path: Any):
-        if isinstance(value, dict):
-            for k, v in value.items():
-                # Fast path for common atomic keys (str, int)
-                if isinstance(k, (str, int)):  # NOSONAR
-                    _recurse(v, step(current_path, k))
-                elif _is_traversal_iterable(k):
-                    # k is a tuple/list/iterable, extend path
-                    # We need to convert to tuple first to know length or iterate safely if it's a generator.
-                    k_seq = tuple(k)
-                    next_path = current_path
-                    for part in k_seq:
-                        next_path = step(next_path, part)
-                    _recurse(v, next_path)
+    while stack:
+        children, path, container = stack[-1]
+        is_dict = isinstance(container, dict)
+        for k, v in children:
+            # Fast path for list indices and common atomic keys (str, int)
+            if not is_dict or isinstance(k, (str, int)) or not _is_traversal_iterable(k):
+                child_path = step(path, k)
+            else:
+                # k is a tuple/list/iterable, extend the path by each of its parts.
+                child_path = path
+                for part in tuple(k):
+                    child_path = step(child_path, part)
+
+            # The depth of v is the number of containers on the stack.
+            depth = len(stack)
+            if (not isinstance(v, (dict, list))
+                    or depth == max_depth
+                    or (is_leaf is not None and is_leaf(child_path, v))):
+                yield child_path, v
+                continue
+
+            if depth >= 1024 and not depth & (depth - 1) and any(frame[2] is v for frame in stack):
+                raise RecursionError('Cannot flatten a tree with a circular reference.')
+            # Descend into the child before visiting the remaining siblings.
+            stack.append((iter(v.items()) if isinstance(v, dict) else enumerate(v), child_path, v))
+            break
+        else:
+            stack.pop()
+
+
+def iflatten(data: Tree[Any],
+             key_format: KeyFormat = KeyFormat.TUPLE,
+             max_depth: int | None = None,
+             is_leaf: Callable[[Any, Any], bool] | None = None) -> Generator[tuple[Any, Any], None, None]:
+    """
+    Lazily flatten a nested tree structure (dicts and lists) into (path, value) pairs, in document order.
+
+    Unlike `flatten`, no dictionary is built, so the pairs can be consumed one at a time, e.g. by
+    `MappingCollector.collect` or a CSV writer. A container cut by `max_depth` or `is_leaf` is yielded as a single
+    pair and its subtree is never visited.
+
+    Args:
+        data (Tree[Any]): The nested mapping or list to flatten.
+        key_format (KeyFormat): The format for keys. Defaults to KeyFormat.TUPLE.
+        max_depth (int | None): The depth at which containers are yielded as leaves, the root being at depth 0.
+            Defaults to None (no limit).
+        is_leaf (Callable[[Any, Any], bool] | None): A predicate called with the path and the value of each container.
+            If it returns True, the container is yielded as a leaf. Defaults to None.
+
+    Returns:
+        Generator[tuple[Any, Any], None, None]: A generator of the (path, value) pairs of the leaves.
+
+    Raises:
+        ValueError: If `max_depth` is negative.
+    """
+    if max_depth is not None and max_depth < 0:
+        raise ValueError("'max_depth' must be zero or more.")
+    initial, step = key_format.value
+    if isinstance(initial, str):
+        step = _flatten_cached_step(step)
+    return _iflatten(data, initial, step, max_depth, is_leaf)
+
+
+class Flattener:
+    """
+    A reusable `flatten` in a fixed key format, for many documents of the same shape.
+
+    The path of each child is cached in a bounded LRU by the path of its parent and its part. Documents of the same
+    shape thus reuse the same key objects instead of formatting and allocating them again, which saves both time and
+    the memory of the flattened dicts, as they share their keys.
+
+    Args:
+        key_format (KeyFormat): The format for keys. Defaults to KeyFormat.TUPLE.
+        maxsize (int | None): The maximum number of cached paths. Defaults to 65536. None means no limit.
+    """
+
+    __slots__ = ('_initial', '_key_format', '_step')
+
+    def __init__(self, key_format: KeyFormat = KeyFormat.TUPLE, maxsize: int | None = 65_536):
+        self._key_format = key_format
+        self._initial, step = key_format.value
+        # typed, so that parts that are equal but of different types (e.g. 1, 1.0 and True) are formatted apart.
+        self._step = lru_cache(maxsize=maxsize, typed=True)(step)
+
+    def __repr__(self):
+        maxsize = self._step.cache_info().maxsize
+        return f'{self.__class__.__name__}(key_format={self._key_format.name}, maxsize={maxsize})'
+
+    def __call__(self, data: Tree[Any]) -> Tree[Any]:
+        """
+        Flatten a nested tree structure (dicts and lists) into a single-level dictionary. See `flatten`.
+
+        Args:
+            data (Tree[Any]): The nested mapping or list to flatten.
+
+        Returns:
+            Tree[Any]: The flattened dictionary.
+        """
+        return _flatten(data, self._initial, self._step)
+
+    @property
+    def key_format(self) -> KeyFormat:
+        """The format for keys."""
+        return self._key_format
+
+    def iflatten(self,
+                 data: Tree[Any],
+                 max_depth: int | None = None,
+                 is_leaf: Callable[[Any, Any], bool] | None = None) -> Generator[tuple[Any, Any], None, None]:
+        """
+        Lazily flatten a nested tree structure into (path, value) pairs, in document order. See `iflatten`.
+
+        Args:
+            data (Tree[Any]): The nested mapping or list to flatten.
+            max_depth (int | None): The depth at which containers are yielded as leaves. Defaults to None (no limit).
+            is_leaf (Callable[[Any, Any], bool] | None): A predicate called with the path and the value of each
+                container. If it returns True, the container is yielded as a leaf. Defaults to None.
+
+        Returns:
+            Generator[tuple[Any, Any], None, None]: A generator of the (path, value) pairs of the leaves.
+
+        Raises:
+            ValueError: If `max_depth` is negative.
+        """
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("'max_depth' must be zero or more.")
+        return _iflatten(data, self._initial, self._step, max_depth, is_leaf)
+
+    def cache_info(self) -> Any:
+        """Return the statistics of the path cache, as `functools.lru_cache` does."""
+        return self._step.cache_info()
+
+    def cache_clear(self):
+        """Clear the path cache."""
+        self._step.cache_clear()
+
+
+def _flatten_column_array(column: list) -> array | list:
+    """Return the column as an `array.array` if all its values are ints (fitting in 64 bits) or all floats."""
+    if all(type(v) is float for v in column):
+        return array('d', column)
+    if all(type(v) is int for v in column):
+        try:
+            return array('q', column)
+        except OverflowError:
+            pass
+    return column
+
+
+_FLATTEN_ARRAY_TYPECODES = {float: 'd', int: 'q'}
+_FLATTEN_ARRAY_TYPES = {'d': float, 'q': int}
+
+
+def _flatten_new_typed_column(fill: Any, count: int, value: Any) -> array | list:
+    """Create a column of `count` fills followed by value, as an `array.array` if they are all ints or all floats."""
+    typecode = _FLATTEN_ARRAY_TYPECODES.get(type(value))
+    if typecode is not None and (count == 0 or type(fill) is type(value)):
+        try:
+            column = array(typecode, [fill] * count)
+            column.append(value)
+        except OverflowError:
+            pass
+        else:
+            return column
+    column = [fill] * count
+    column.append(value)
+    return column
+
+
+def _flatten_typed_column_append(columns: dict, path: Any, column: array | list, value: Any):
+    """Append a value to a column, turning a typed array into a list on the first value that it cannot hold."""
+    if type(column) is not list:
+        if type(value) is _FLATTEN_ARRAY_TYPES[column.typecode]:
+            try:
+                column.append(value)
+            except OverflowError:
+                pass
+            else:
+                return
+        columns[path] = column = column.tolist()
+    column.append(value)
+
+
+def flatten_many(records: Iterable[Tree[Any]],
+                 key_format: KeyFormat = KeyFormat.TUPLE,
+                 fill: Any = None,
+                 arrays: bool = False) -> dict[Any, list | array]:
+    """
+    Flatten a batch of records into columns, one per path, in a single pass.
+
+    Each column holds the values at its path, one per record in order, with `fill` for the records that lack the
+    path. Columns are ordered by the first appearance of their path. The records are flattened by a `Flattener`, so
+    records of the same shape share their paths.
+
+    Args:
+        records (Iterable[Tree[Any]]): The nested mappings or lists to flatten.
+        key_format (KeyFormat): The format for keys. Defaults to KeyFormat.TUPLE.
+        fill (Any): The value of a column for a record that lacks its path. Defaults to None.
+        arrays (bool): If True, columns of ints fitting in 64 bits or of floats are built and returned as
+            `array.array` of typecode 'q' or 'd' respectively, so they are never held as lists of Python objects. A
+            column turns into a list at its first value of another type. Defaults to False.
+
+    Returns:
+        dict[Any, list | array]: The columns, keyed by path.
+    """
+    flattener = Flattener(key_format)
+    columns = {}
+
+    if arrays:
+        # Fill typed arrays as we go, so the columns never exist as lists of boxed ints or floats
+        for index, record in enumerate(records):
+            for path, value in flattener(record).items():
+                column = columns.get(path)
+                if column is None:
+                    columns[path] = _flatten_new_typed_column(fill, index, value)
                 else:
-                    _recurse(v, step(current_path, k))
-        elif isinstance(value, list):
-            for i, v in enumerate(value):
-                _recurse(v, step(current_path, i))
+                    _flatten_typed_column_append(columns, path, column, value)
+            # Pad the columns of the paths that the record lacks.
+            for path, column in columns.items():
+                if len(column) == index:
+                    _flatten_typed_column_append(columns, path, column, fill)
+        return columns
+
+    for index, record in enumerate(records):
+        for path, value in flattener(record).items():
+            column = columns.get(path)
+            if column is None:
+                column = columns[path] = [fill] * index
+            column.append(value)
+        # Pad the columns of the paths that the record lacks.
+        for column in columns.values():
+            if len(column) == index:
+                column.append(fill)
+
+    return columns
+
+
+# A quoted str part, or the text of any other part, of a KeyFormat.STR key.
+_UNFLATTEN_STR_TOKENS = re.compile(r'"(.*?)"(?=,|\Z)|([^,]+)')
+# A quoted str part, an index, or an identifier of a KeyFormat.JSONPATH or KeyFormat.JAVASCRIPT key.
+_UNFLATTEN_PATH_TOKENS = re.compile(r'\["(.*?)"\]|\[(-?[0-9]+)\]|(?:\.|^)([^.\[]+)')
+_UNFLATTEN_INT = re.compile(r'-?[0-9]+')
+
+
+def _unflatten_int_or_str(text: str) -> Any:
+    return int(text) if _UNFLATTEN_INT.fullmatch(text) else text
+
+
+class _UnflattenParser(dict):
+    """Split KeyFormat.TUPLE keys into path parts. The subclasses parse string keys, caching the part of each token."""
+    __slots__ = ()
+
+    def split(self, key: Any) -> Sequence:
+        return key if isinstance(key, tuple) else (key,)
+
+
+class _UnflattenStrParser(_UnflattenParser):
+    __slots__ = ()
+
+    def split(self, key: str) -> Sequence:
+        return [self[token] for token in _UNFLATTEN_STR_TOKENS.findall(key)]
+
+    def __missing__(self, token: tuple[str, str]) -> Any:
+        quoted, text = token
+        part = self[token] = _unflatten_int_or_str(text) if text else quoted
+        return part
+
+
+class _UnflattenPathParser(_UnflattenParser):
+    __slots__ = ()
+
+    def split(self, key: str) -> Sequence:
+        return [self[token] for token in _UNFLATTEN_PATH_TOKENS.findall(key, 1 if key[:1] == '$' else 0)]
+
+    def __missing__(self, token: tuple[str, str, str]) -> Any:
+        quoted, index, identifier = token
+        part = self[token] = int(index) if index else identifier or quoted
+        return part
+
+
+class _UnflattenPointerParser(_UnflattenParser):
+    __slots__ = ()
+
+    def split(self, key: str) -> Sequence:
+        return [self[token] for token in key.split('/')[1:]]
+
+    def __missing__(self, token: str) -> Any:
+        part = self[token] = _unflatten_int_or_str(token.replace('~1', '/').replace('~0', '~'))
+        return part
+
+
+_UNFLATTEN_PARSERS = {
+    KeyFormat.TUPLE: _UnflattenParser,
+    KeyFormat.STR: _UnflattenStrParser,
+    KeyFormat.JAVASCRIPT: _UnflattenPathParser,
+    KeyFormat.JSONPATH: _UnflattenPathParser,
+    KeyFormat.JSONPOINTER: _UnflattenPointerParser,
+}
+
+
+class _UnflattenNode(dict):
+    """A branch created by unflatten, told apart from leaf values that happen to be dicts."""
+    __slots__ = ()
+
+
+def _unflatten_container(node: _UnflattenNode) -> dict | list:
+    """Return the node as a list if its keys are exactly the indices 0..n-1, otherwise as a dict."""
+    size = len(node)
+    # Distinct ints with a minimum of 0 and a maximum of n-1 are exactly 0..n-1, in whatever order they were added.
+    if (type(next(iter(node))) is int
+            and all(type(k) is int for k in node)
+            and min(node) == 0
+            and max(node) == size - 1):
+        return [node[i] for i in range(size)]
+    return dict(node)
+
+
+def unflatten(flat: Mapping[Any, Any], key_format: KeyFormat = KeyFormat.TUPLE) -> Tree[Any]:
+    """
+    Rebuild a nested tree structure (dicts and lists) from a single-level dictionary. The inverse of `flatten`.
+
+    Each key is parsed into its path parts according to `key_format`, caching the parsing of repeated parts, and the
+    tree is built in a single pass over the items, in linear time. A branch whose keys are exactly the indices 0..n-1
+    becomes a list, any other branch becomes a dict.
+
+    `unflatten(flatten(tree, key_format), key_format) == tree` holds, except for empty containers (flatten drops them),
+    dicts whose keys are the indices 0..n-1 (they become lists), and, with `KeyFormat.JSONPOINTER`, str keys made of
+    digits (they become int keys).
+
+    Args:
+        flat (Mapping[Any, Any]): The flattened dictionary.
+        key_format (KeyFormat): The format of the keys. Defaults to KeyFormat.TUPLE.
+
+    Returns:
+        Tree[Any]: The nested tree.
+
+    Raises:
+        ValueError: If a key is both a leaf and a prefix of another key.
+    """
+    split = _UNFLATTEN_PARSERS[key_format]().split
+    root = _UnflattenNode()
+    # The created branches with their parent and part, parents before children.
+    branches = []
+    # Consecutive keys usually share their parent branch (e.g. the output of flatten), so the last one is kept.
+    branch_parts, node = (), root
+
+    for key, value in flat.items():
+        parts = split(key)
+        if not parts:
+            if len(flat) > 1:
+                raise ValueError(f'Conflicting flat keys at {key!r}: the root cannot be both a leaf and a branch.')
+            return value
+
+        if parts[:-1] != branch_parts:
+            branch_parts = parts[:-1]
+            node = root
+            for part in branch_parts:
+                child = node.get(part, MISSING)
+                if child is MISSING:
+                    child = node[part] = _UnflattenNode()
+                    branches.append((child, node, part))
+                elif type(child) is not _UnflattenNode:
+                    raise ValueError(f'Conflicting flat keys at {key!r}: {part!r} is both a leaf and a branch.')
+                node = child
+
+        last = parts[-1]
+        if type(node.get(last)) is _UnflattenNode:
+            raise ValueError(f'Conflicting flat keys at {key!r}: {last!r} is both a leaf and a branch.')
+        node[last] = value
+
+    # Convert the branches, children first, so each parent holds its final containers.
+    for node, parent, part in reversed(branches):
+        parent[part] = _unflatten_container(node)
+
+    return _unflatten_container(root) if root else {}
+
+
+def _fingerprint_leaf(value: Any) -> bytes:
+    value_type = type(value)
+    return blake2b(f'{value_type.__module__}.{value_type.__qualname__}:{value!r}'.encode(), digest_size=16).digest()
+
+
+class _FingerprintLeaves(dict):
+    """
+    The hashes of the str and int leaves and keys of a tree, which repeat often.
+
+    Equal leaves of other types (e.g. 1, 1.0 and True, or 0.0 and -0.0) may hash differently, so they are not kept.
+    """
+    __slots__ = ()
+
+    def __missing__(self, value: str | int) -> bytes:
+        digest = self[value] = _fingerprint_leaf(value)
+        return digest
+
+    def of(self, value: Any) -> bytes:
+        value_type = type(value)
+        return self[value] if value_type is str or value_type is int else _fingerprint_leaf(value)
+
+
+class FingerprintCache:
+    """
+    A bounded cache of the hashes of containers for `fingerprint`, by identity, to reuse across calls.
+
+    The cache holds references to its containers, so beyond `maxsize` the least recently used ones are evicted, and a
+    long-lived cache does not keep every tree it has seen alive. Cached containers must not be mutated in place.
+
+    Args:
+        maxsize (int | None): The maximum number of cached containers. Defaults to 65536. None means no limit.
+
+    Raises:
+        ValueError: If `maxsize` is negative.
+    """
+
+    __slots__ = ('_entries', '_maxsize')
+
+    def __init__(self, maxsize: int | None = 65_536):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("'maxsize' must be zero or more.")
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(maxsize={self._maxsize})'
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def maxsize(self) -> int | None:
+        """The maximum number of cached containers, or None for no limit."""
+        return self._maxsize
+
+    def get(self, container: Any) -> bytes | None:
+        """Return the cached hash of the container (the same object, not an equal one), or None."""
+        key = id(container)
+        entry = self._entries.get(key)
+        # An id is only unique among live objects, so check that the entry is of this very container.
+        if entry is None or entry[0] is not container:
+            return None
+        if self._maxsize is not None:
+            self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, container: Any, digest: bytes):
+        """Cache the hash of the container, evicting the least recently used containers beyond `maxsize`."""
+        key = id(container)
+        entries = self._entries
+        entries[key] = (container, digest)
+        if self._maxsize is not None:
+            entries.move_to_end(key)
+            while len(entries) > self._maxsize:
+                entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all the cached containers."""
+        self._entries.clear()
+
+
+def fingerprint(tree: Tree[Any], cache: FingerprintCache | None = None) -> str:
+    """
+    Compute a stable, Merkle-style hash of a nested tree structure (dicts and lists), bottom-up.
+
+    The hash of a container is computed from the hashes of its children, in order (and of the keys of a dict), and the
+    hash of a leaf from its type and repr. Equal fingerprints thus mean equal trees, with the same types and key order,
+    and are stable across processes as long as the reprs of the leaves are. A changed leaf changes the fingerprints of
+    all the containers on its path, and only those.
+
+    Args:
+        tree (Tree[Any]): The nested mapping or list to fingerprint.
+        cache (FingerprintCache | None): A cache to keep the hashes of the containers in, by identity, across calls.
+            A container found in it is not visited again, so containers must not be mutated in place while cached.
+            Defaults to None (no cache).
+
+    Returns:
+        str: The fingerprint, as a hex string.
+
+    Raises:
+        RecursionError: If the tree contains a circular reference.
+    """
+    if not isinstance(tree, (dict, list)):
+        return _fingerprint_leaf(tree).hex()
+    if cache is not None and (cached := cache.get(tree)) is not None:
+        return cached.hex()
+
+    leaf = _FingerprintLeaves().of
+    # Each frame holds the children iterator, the container, the hashes of its children and its kind.
+    stack = [(iter(tree.items()) if isinstance(tree, dict) else enumerate(tree), tree, [], isinstance(tree, dict))]
+    while True:
+        children, container, hashes, is_dict = stack[-1]
+        for k, v in children:
+            if is_dict:
+                hashes.append(leaf(k))
+            if not isinstance(v, (dict, list)):
+                hashes.append(leaf(v))
+                continue
+            if cache is not None and (cached := cache.get(v)) is not None:
+                hashes.append(cached)
+                continue
+
+            depth = len(stack)
+            if depth >= 1024 and not depth & (depth - 1) and any(frame[1] is v for frame in stack):
+                raise RecursionError('Cannot fingerprint a tree with a circular reference.')
+            # Descend into the child before hashing the remaining siblings.
+            stack.append((iter(v.items()) if isinstance(v, dict) else enumerate(v), v, [], isinstance(v, dict)))
+            break
         else:
-            result[current_path] = value
+            stack.pop()
+            digest = blake2b((b'{' if is_dict else b'[') + b''.join(hashes), digest_size=16).digest()
+            if cache is not None:
+                cache.put(container, digest)
+            if not stack:
+                return digest.hex()
+            stack[-1][2].append(digest)
 
-    _recurse(data, initial)
-    return result
+
+_DIFF_UNCHECKED_LEVELS = 1024
+"""The number of levels diff descends without comparing containers, after they were too deep to compare."""
+
+
+def diff(tree1: Tree[Any], tree2: Tree[Any], key_format: KeyFormat = KeyFormat.TUPLE) -> dict[str, dict[Any, Any]]:
+    """
+    Compare two nested tree structures (dicts and lists) leaf by leaf, as their flattened forms would compare.
+
+    The trees are walked together, and subtrees that are the same object or equal are skipped without being visited,
+    so the cost depends on the size of the differences rather than the size of the trees. The flattened dicts of the
+    trees are never built.
+
+    Args:
+        tree1 (Tree[Any]): The old tree.
+        tree2 (Tree[Any]): The new tree.
+        key_format (KeyFormat): The format for paths. Defaults to KeyFormat.TUPLE.
+
+    Returns:
+        dict[str, dict[Any, Any]]: A dictionary with the keys:
+            - 'added': The leaves of tree2 at paths that tree1 lacks, keyed by path.
+            - 'removed': The leaves of tree1 at paths that tree2 lacks, keyed by path.
+            - 'changed': The (old, new) pairs of the leaves that differ, keyed by path.
+    """
+    initial, step = key_format.value
+    if isinstance(initial, str):
+        step = _flatten_cached_step(step)
+    added, removed, changed = {}, {}, {}
+
+    # Each entry holds a path, its old and new values, and the number of levels to descend before comparing
+    # containers again, after they were too deep to compare.
+    stack = [(initial, tree1, tree2, 0)]
+    while stack:
+        path, old, new, unchecked = stack.pop()
+        if old is new:
+            continue
+
+        old_is_container = isinstance(old, (dict, list))
+        new_is_container = isinstance(new, (dict, list))
+        if old_is_container and new_is_container:
+            if unchecked:
+                unchecked -= 1
+            else:
+                # Equality of containers is checked in C and stops at the first difference.
+                try:
+                    if old == new:
+                        continue
+                except RecursionError:
+                    unchecked = _DIFF_UNCHECKED_LEVELS
+            old_map = old if isinstance(old, dict) else dict(enumerate(old))
+            new_map = new if isinstance(new, dict) else dict(enumerate(new))
+            pairs = [(k, v, new_map.get(k, MISSING)) for k, v in old_map.items()]
+            pairs.extend((k, MISSING, v) for k, v in new_map.items() if k not in old_map)
+            # Push in reverse, so the pairs are popped in document order.
+            for k, v, w in reversed(pairs):
+                if isinstance(k, (str, int)) or not _is_traversal_iterable(k):
+                    child_path = step(path, k)
+                else:
+                    # k is a tuple/list/iterable, extend the path by each of its parts.
+                    child_path = path
+                    for part in tuple(k):
+                        child_path = step(child_path, part)
+                stack.append((child_path, v, w, unchecked))
+        elif old is MISSING:
+            added.update(_flatten(new, path, step))
+        elif new is MISSING:
+            removed.update(_flatten(old, path, step))
+        elif old_is_container or new_is_container:
+            removed.update(_flatten(old, path, step))
+            added.update(_flatten(new, path, step))
+        elif old != new:
+            changed[path] = (old, new)
+
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+
+def inverse(mapping: Mapping[Any, set]) -> Mapping[Any, set]:
+    """
+    Return a new dictionary with keys and values swapped from the input mapping.
+
+    Args:
+        mapping (Mapping[Any, set]): The input mapping to invert.
+
+    Returns:
+        Mapping: A new Mapping with values as keys and keys as values.
+    """
+    items = chain.from_iterable(((vi, k) for vi in v) for k, v in mapping.items())
+    dd = defaultdict(set)
+    for k, v in items:
+        dd[k].add(v)
+
+    return dict(dd)
+
+
+def _merge_leaf(tree1: Any, tree2: Any) -> Any:
+    """Merge a node pair that is not structurally mergeable (i.e., not a dict/dict or list/list pair)."""
+    if isinstance(tree1, list) and not isinstance(tree2, list) and tree2 is not MISSING:
+        # If tree1 is a list and tree2 is not, append tree2 to a new list
+        return [*tree1, tree2]
+    elif not isinstance(tree1, list) and tree1 is not MISSING and isinstance(tree2, list):
+        # If tree2 is a list and tree1 is not, prepend tree1 to a new list
+        return [tree1, *tree2]
+    elif tree1 is MISSING:
+        return tree2
+    elif tree2 is MISSING:
+        return tree1
+    else:
+        # If both are values (not dicts or lists), or one is a value and the other is a dict/list,
+        # the non-MISSING value takes precedence.
+        # If both are non-MISSING and different types, tree2 overwrites tree1.
+        return tree2
+
+
+def _merge(tree1: Any, tree2: Any) -> Any:
+    if isinstance(tree1, dict) and isinstance(tree2, dict):
+        merged = dict(tree1)
+        for k, v in tree2.items():
+            merged[k] = _merge(merged.get(k, MISSING), v)
+        return merged
+    elif isinstance(tree1, list) and isinstance(tree2, list):
+        # zip longest to handle different lengths, filling missing values with MISSING
+        zipped = itertools.zip_longest(tree1, tree2, fillvalue=MISSING)
+        return [_merge(t1, t2) for t1, t2 in zipped]
+    return _merge_leaf(tree1, tree2)
 
 
-def inverse(mapping: Mapping[Any, set]) -> Mapping[Any, set]:
+def _merge_iterative(tree1: Any, tree2: Any) -> Any:
     """
-    Return a new dictionary with keys and values swapped from the input mapping.
-
-    Args:
-        mapping (Mapping[Any, set]): The input mapping to invert.
+    An explicit-stack equivalent of `_merge`.
 
-    Returns:
-        Mapping: A new Mapping with values as keys and keys as values.
+    Each stack frame holds a children iterator together with the (still filling) output node. A child node is
+    attached to its parent as soon as it is created, and filled before the remaining siblings are visited,
+    so the insertion order, and hence the output, is identical to the recursive implementation.
     """
-    items = chain.from_iterable(((vi, k) for vi in v) for k, v in mapping.items())
-    dd = defaultdict(set)
-    for k, v in items:
-        dd[k].add(v)
+    if not _is_branch_pair(tree1, tree2):
+        return _merge_leaf(tree1, tree2)
 
-    return dict(dd)
+    if isinstance(tree1, dict):
+        root = (iter(tree2.items()), tree1, dict(tree1))
+    else:
+        root = (itertools.zip_longest(tree1, tree2, fillvalue=MISSING), None, [])
+    stack = [root]
+
+    while stack:
+        children, d1, node = stack[-1]
+        if d1 is not None:
+            # A dict frame: children is an iterator over the items of tree2.
+            for k, t2 in children:
+                t1 = d1.get(k, MISSING)
+                if isinstance(t1, dict) and isinstance(t2, dict):
+                    frame = (iter(t2.items()), t1, dict(t1))
+                elif isinstance(t1, list) and isinstance(t2, list):
+                    frame = (itertools.zip_longest(t1, t2, fillvalue=MISSING), None, [])
+                else:
+                    node[k] = _merge_leaf(t1, t2)
+                    continue
+                node[k] = frame[2]
+                # Descend into the child before visiting the remaining siblings.
+                stack.append(frame)
+                break
+            else:
+                stack.pop()
+        else:
+            # A list frame: children is an iterator over the zipped (longest) pairs.
+            for t1, t2 in children:
+                if isinstance(t1, dict) and isinstance(t2, dict):
+                    frame = (iter(t2.items()), t1, dict(t1))
+                elif isinstance(t1, list) and isinstance(t2, list):
+                    frame = (itertools.zip_longest(t1, t2, fillvalue=MISSING), None, [])
+                else:
+                    node.append(_merge_leaf(t1, t2))
+                    continue
+                node.append(frame[2])
+                # Descend into the child before visiting the remaining siblings.
+                stack.append(frame)
+                break
+            else:
+                stack.pop()
 
+    return root[2]
 
-def merge(tree1: Tree[T] | Missing = MISSING, tree2: Tree[T] | Missing = MISSING) -> Tree[T]:
+
+def merge(
+        tree1: Tree[T] | Missing = MISSING,
+        tree2: Tree[T] | Missing = MISSING,
+        *,
+        engine: Engine = Engine.RECURSIVE,
+        share_unchanged: bool = False,
+) -> Tree[T]:
     """
     A pure function (Monoid operation) to deeply merge two recursive tree structures.
     The merging strategy resolves conflicts by overwriting existing values with new ones (right-side precedence).
@@ -310,34 +2026,195 @@ def merge(tree1: Tree[T] | Missing = MISSING, tree2: Tree[T] | Missing = MISSING
     Args:
         tree1 (Tree[T] | Missing): The first tree structure.
         tree2 (Tree[T] | Missing): The second tree structure.
+        engine (Engine): The traversal strategy. Defaults to Engine.RECURSIVE, which retries trees deeper than the
+            recursion limit with Engine.ITERATIVE.
+        share_unchanged (bool): If True, reuse subtrees that are identical (by identity) in both trees instead of
+            walking and copying them (`merge(tree, tree) is tree`). The output then shares nodes with the inputs,
+            so it must not be mutated in place. Defaults to False.
 
     Returns:
         Tree[T] | Missing: The deeply merged tree structure.
     """
-    if isinstance(tree1, dict) and isinstance(tree2, dict):
-        merged = dict(tree1)
-        for k, v in tree2.items():
-            merged[k] = merge(merged.get(k, MISSING), v)
-        return merged
-    elif isinstance(tree1, list) and isinstance(tree2, list):
-        # zip longest to handle different lengths, filling missing values with MISSING
-        zipped = itertools.zip_longest(tree1, tree2, fillvalue=MISSING)
-        return [merge(t1, t2) for t1, t2 in zipped]
-    elif isinstance(tree1, list) and not isinstance(tree2, list) and tree2 is not MISSING:
-        # If tree1 is a list and tree2 is not, append tree2 to a new list
-        return [*tree1, tree2]
-    elif not isinstance(tree1, list) and tree1 is not MISSING and isinstance(tree2, list):
-        # If tree2 is a list and tree1 is not, prepend tree1 to a new list
-        return [tree1, *tree2]
-    elif tree1 is MISSING:
-        return tree2
-    elif tree2 is MISSING:
-        return tree1
+    if share_unchanged:
+        return _run_engine(engine, _combine_shared, _combine_shared_iterative, tree1, tree2, _merge_leaf, True)
+    return _run_engine(engine, _merge, _merge_iterative, tree1, tree2)
+
+
+def _merge_leaf_into(node: Any, tree: Any) -> Any:
+    """
+    An in place equivalent of `_merge_leaf`, where `node` is owned by the accumulator. Returns the (possibly new) node.
+    Containers taken from `tree` are copied, so the accumulator never shares nodes with the merged trees.
+    """
+    if tree is MISSING:
+        return node
+    if isinstance(node, list) and not isinstance(tree, list):
+        node.append(_copy_branches(tree))
+        return node
+    if node is not MISSING and not isinstance(node, list) and isinstance(tree, list):
+        return [node, *_copy_branches(tree)]
+    return _copy_branches(tree)
+
+
+def _merge_into(accumulator: Any, tree: Any) -> Any:  # NOSONAR
+    """
+    Merge a tree into an accumulator in place, using an explicit stack. Returns the (possibly new) accumulator root.
+    """
+    if not _is_branch_pair(accumulator, tree):
+        return _merge_leaf_into(accumulator, tree)
+
+    stack = [(iter(tree.items()) if isinstance(tree, dict) else enumerate(tree), accumulator)]
+    while stack:
+        children, node = stack[-1]
+        if isinstance(node, dict):
+            # A dict frame: children is an iterator over the items of the merged tree.
+            for k, t in children:
+                n = node.get(k, MISSING)
+                if isinstance(n, dict) and isinstance(t, dict):
+                    # Descend into the child before visiting the remaining siblings.
+                    stack.append((iter(t.items()), n))
+                    break
+                if isinstance(n, list) and isinstance(t, list):
+                    stack.append((enumerate(t), n))
+                    break
+                node[k] = _merge_leaf_into(n, t)
+            else:
+                stack.pop()
+        else:
+            # A list frame: children is an iterator over the enumerated items of the merged tree.
+            for i, t in children:
+                if i >= len(node):
+                    node.append(_merge_leaf_into(MISSING, t))
+                    continue
+                n = node[i]
+                if isinstance(n, dict) and isinstance(t, dict):
+                    stack.append((iter(t.items()), n))
+                    break
+                if isinstance(n, list) and isinstance(t, list):
+                    stack.append((enumerate(t), n))
+                    break
+                node[i] = _merge_leaf_into(n, t)
+            else:
+                stack.pop()
+
+    return accumulator
+
+
+def merge_stream(trees: Iterable[Tree[T] | Missing], accumulator: Tree[T] | Missing = MISSING) -> Tree[T]:
+    """
+    Merges a stream of trees into a single mutable accumulator, in place.
+
+    The result equals the pure fold `functools.reduce(merge, trees, accumulator)`, but instead of copying the
+    accumulated tree on every step, each tree is merged directly into the accumulator. The trees are consumed lazily
+    and never retained (the containers taken from them are copied), so memory stays proportional to the result tree,
+    regardless of the number of trees.
+
+    Args:
+        trees (Iterable[Tree[T] | Missing]): The trees to merge, e.g., parsed lines of a newline-delimited JSON file.
+        accumulator (Tree[T] | Missing): The tree to merge into, which is mutated in place. Defaults to MISSING,
+            which starts a new accumulator.
+
+    Returns:
+        Tree[T] | Missing: The accumulator. It is a new object only if the root itself had to be replaced (e.g., when
+        the accumulator is MISSING).
+    """
+    for tree in trees:
+        accumulator = _merge_into(accumulator, tree)
+    return accumulator
+
+
+def _pivot(rows: Iterable[tuple[Any, Any, Any]], aggregation: Aggregation) -> dict[Any, dict[Any, Any]]:
+    """Aggregate (index value, column value, value) triples into a pivot table."""
+    # Initialize inner collectors based on mode
+    # We use a functional primitive to determine the collection type
+    ctype = aggregation.collection_type
+    result = defaultdict(lambda: defaultdict(ctype)) if ctype else defaultdict(dict)
+
+    if aggregation is Aggregation.LAST:
+        # Fast path: the last value of a single value is the value itself
+        for row_key, col_key, val in rows:
+            result[row_key][col_key] = val
     else:
-        # If both are values (not dicts or lists), or one is a value and the other is a dict/list,
-        # the non-MISSING value takes precedence.
-        # If both are non-MISSING and different types, tree2 overwrites tree1.
-        return tree2
+        # Optimization: Bind a specialized aggregator function to the local scope
+        aggregate = aggregation.aggregator
+
+        for row_key, col_key, val in rows:
+            # Pass value as a tuple because aggregator expects iterable
+            aggregate(result[row_key], col_key, (val,))
+
+    # Convert defaultdicts to regular dicts for clean output
+    # This is a deep conversion
+    final_result = {}
+    for row_k, row_v in result.items():
+        final_result[row_k] = dict(row_v)
+
+    return final_result
+
+
+def _pivot_specs(values: str | Sequence[str],
+                 aggregation: Aggregation | Mapping[str, Aggregation]) -> tuple[list, list, list[Aggregation]]:
+    """Return the value keys, the names and the aggregation modes of the cells of a multi-value pivot table."""
+    if isinstance(aggregation, Aggregation):
+        return list(values), list(values), [aggregation] * len(values)
+    if isinstance(values, str) or len(values) == 1:
+        # A single value is aggregated by each aggregation
+        value = values if isinstance(values, str) else values[0]
+        return [value] * len(aggregation), list(aggregation), list(aggregation.values())
+    if len(values) != len(aggregation):
+        raise ValueError("'values' and 'aggregation' must be of the same length.")
+    return list(values), list(aggregation), list(aggregation.values())
+
+
+def _pivot_many(rows: Iterable[tuple[Any, Any, Sequence]],
+                names: list,
+                aggregations: list[Aggregation]) -> dict[Any, dict[Any, dict[Any, Any]]]:
+    """Aggregate (index value, column value, values) triples into a pivot table with a {name: value} dict per cell."""
+    # One table per aggregation, each aggregating its own value of every row
+    tables = [
+        defaultdict(lambda ctype=a.collection_type: defaultdict(ctype)) if a.collection_type else defaultdict(dict)
+        for a in aggregations
+    ]
+    aggregates = list(zip(tables, (a.aggregator for a in aggregations), strict=True))
+
+    for row_key, col_key, vals in rows:
+        for (table, aggregate), val in zip(aggregates, vals, strict=True):
+            # Pass value as a tuple because aggregator expects iterable
+            aggregate(table[row_key], col_key, (val,))
+
+    # Every row updates all the tables, so they share the order of their rows and columns
+    final_result = {}
+    for name, table in zip(names, tables, strict=True):
+        for row_k, row_v in table.items():
+            final_row = final_result.setdefault(row_k, {})
+            for col_k, value in row_v.items():
+                final_row.setdefault(col_k, {})[name] = value
+
+    return final_result
+
+
+def _pivot_rows(iterable: Iterable[Mapping],
+                index: str,
+                columns: str,
+                values: str | Sequence[str],
+                aggregation: Aggregation | Mapping[str, Aggregation]) -> tuple[Iterator, Callable[[Iterable], dict]]:
+    """Return the (index value, column value, value(s)) rows of the items and the function aggregating them."""
+    if isinstance(values, str) and isinstance(aggregation, Aggregation):
+        # Skip items that don't have the required keys
+        rows = (
+            (item[index], item[columns], item[values])
+            for item in iterable
+            if index in item and columns in item and values in item
+        )
+        return rows, partial(_pivot, aggregation=aggregation)
+
+    value_keys, names, aggregations = _pivot_specs(values, aggregation)
+    required = {index, columns, *value_keys}
+    # Skip items that don't have the required keys
+    rows = (
+        (item[index], item[columns], [item[k] for k in value_keys])
+        for item in iterable
+        if item.keys() >= required
+    )
+    return rows, partial(_pivot_many, names=names, aggregations=aggregations)
 
 
 def pivot(
@@ -345,49 +2222,126 @@ def pivot(
         *,
         index: str,
         columns: str,
-        values: str,
-        aggregation: Aggregation = Aggregation.LAST,
+        values: str | Sequence[str],
+        aggregation: Aggregation | Mapping[str, Aggregation] = Aggregation.LAST,
 ) -> dict[Any, dict[Any, Any]]:
     """
     Reshape data (produce a "pivot" table) based on column values.
 
+    Several values, or several aggregations, are computed in a single pass over the iterable, and each cell of the
+    table is then a dictionary {name: aggregated_value}:
+
+    - Several values and one aggregation: each value is aggregated under its own key.
+    - One value (or a sequence of one) and several aggregations: the value is aggregated by each aggregation, under
+      its name.
+    - Several values and aggregations: the values and aggregations are paired in order, under the aggregation names.
+
     Args:
         iterable: An iterable of mappings (e.g., list of dicts).
         index: The key to use for the row labels.
         columns: The key to use for the column labels.
-        values: The key to use for the values.
-        aggregation: The aggregation mode to use for values. Defaults to Aggregation.LAST.
+        values: The key to use for the values, or a sequence of keys.
+        aggregation: The aggregation mode to use for values, or a mapping of names to aggregation modes.
+            Defaults to Aggregation.LAST.
 
     Returns:
-        A nested dictionary: {index_value: {column_value: aggregated_value}}.
+        A nested dictionary: {index_value: {column_value: aggregated_value}}, or
+        {index_value: {column_value: {name: aggregated_value}}} for several values or aggregations.
+
+    Raises:
+        ValueError: If several values and aggregations are not of the same length.
     """
-    # Initialize inner collectors based on mode
-    # We use a functional primitive to determine the collection type
-    ctype = aggregation.collection_type
-    result = defaultdict(lambda: defaultdict(ctype)) if ctype else defaultdict(dict)
+    rows, table = _pivot_rows(iterable, index, columns, values, aggregation)
+    return table(rows)
 
-    # Optimization: Bind a specialized aggregator function to the local scope
-    aggregate = aggregation.aggregator
 
-    for item in iterable:
-        # Skip items that don't have the required keys
-        if index not in item or columns not in item or values not in item:
-            continue
+def pivot_sorted(
+        iterable: Iterable[Mapping],
+        *,
+        index: str,
+        columns: str,
+        values: str | Sequence[str],
+        aggregation: Aggregation | Mapping[str, Aggregation] = Aggregation.LAST,
+) -> Iterator[tuple[Any, dict[Any, Any]]]:
+    """
+    Lazily reshape data sorted (or grouped) by the index into the rows of a pivot table.
 
-        row_key = item[index]
-        col_key = item[columns]
-        val = item[values]
+    The streaming counterpart of `pivot`: a row is yielded as soon as the index value changes, so only the current row
+    is held in memory. Like `itertools.groupby`, an index value that reappears after another one starts a new row, so
+    for input that is not grouped by the index, use `pivot` instead.
 
-        # Pass value as a tuple because aggregator expects iterable
-        aggregate(result[row_key], col_key, (val,))
+    Args:
+        iterable: An iterable of mappings (e.g., list of dicts), sorted or grouped by the index.
+        index: The key to use for the row labels.
+        columns: The key to use for the column labels.
+        values: The key to use for the values, or a sequence of keys.
+        aggregation: The aggregation mode to use for values, or a mapping of names to aggregation modes.
+            Defaults to Aggregation.LAST.
 
-    # Convert defaultdicts to regular dicts for clean output
-    # This is a deep conversion
-    final_result = {}
-    for row_k, row_v in result.items():
-        final_result[row_k] = dict(row_v)
+    Returns:
+        An iterator of (index_value, {column_value: aggregated_value}) pairs, with cells of the form
+        {name: aggregated_value} for several values or aggregations.
 
-    return final_result
+    Raises:
+        ValueError: If several values and aggregations are not of the same length.
+    """
+    # Validate eagerly; only the rows are produced lazily
+    rows, table = _pivot_rows(iterable, index, columns, values, aggregation)
+    return _pivot_sorted(rows, table)
+
+
+def _pivot_sorted(rows: Iterator, table: Callable[[Iterable], dict]) -> Iterator[tuple[Any, dict[Any, Any]]]:
+    for row_key, group in itertools.groupby(rows, key=itemgetter(0)):
+        yield row_key, table(group)[row_key]
+
+
+def pivot_columns(
+        data: Mapping[str, Iterable],
+        *,
+        index: str,
+        columns: str,
+        values: str | Sequence[str],
+        aggregation: Aggregation | Mapping[str, Aggregation] = Aggregation.LAST,
+) -> dict[Any, dict[Any, Any]]:
+    """
+    Reshape columnar data (produce a "pivot" table) based on column values.
+
+    The columnar counterpart of `pivot`, for data that is already column-oriented (e.g. from Arrow or CSV readers).
+    The columns are zipped directly, without building a mapping per row. The result is identical to that of `pivot`
+    over the rows of the data, including for several values or aggregations.
+
+    Args:
+        data: A mapping of column names to columns (e.g., dict of lists).
+        index: The column to use for the row labels.
+        columns: The column to use for the column labels.
+        values: The column to use for the values, or a sequence of columns.
+        aggregation: The aggregation mode to use for values, or a mapping of names to aggregation modes.
+            Defaults to Aggregation.LAST.
+
+    Returns:
+        A nested dictionary: {index_value: {column_value: aggregated_value}}, or
+        {index_value: {column_value: {name: aggregated_value}}} for several values or aggregations.
+
+    Raises:
+        ValueError: If the columns are not of the same length, or several values and aggregations are not of the
+            same length.
+    """
+    if isinstance(values, str) and isinstance(aggregation, Aggregation):
+        # Like rows without the required keys, data without the required columns has nothing to pivot
+        if index not in data or columns not in data or values not in data:
+            return {}
+        return _pivot(zip(data[index], data[columns], data[values], strict=True), aggregation)
+
+    value_keys, names, aggregations = _pivot_specs(values, aggregation)
+    if index not in data or columns not in data or any(k not in data for k in value_keys):
+        return {}
+    unique_keys = list(dict.fromkeys(value_keys))
+    value_rows = zip(*(data[k] for k in unique_keys), strict=True)
+    if len(unique_keys) < len(value_keys):
+        # A column aggregated several times is zipped once, and its values are repeated
+        positions = [unique_keys.index(k) for k in value_keys]
+        value_rows = ([vals[i] for i in positions] for vals in value_rows)
+    return _pivot_many(zip(data[index], data[columns], value_rows, strict=True), names, aggregations)
 
 
 def rename(
@@ -412,11 +2366,32 @@ def rename(
     Returns:
         A new dictionary with renamed keys and aggregated values.
     """
+    # Resolve the mapper once, not per key
+    if isinstance(mapper, Mapping):
+        get = mapper.get
+
+        if aggregation is Aggregation.LAST:
+            # Fast path: a plain dict comprehension, without a call per key
+            return {get(k, k): v for k, v in mapping.items()}
+        if aggregation is Aggregation.FIRST:
+            target = {}
+            for k, v in mapping.items():
+                target.setdefault(get(k, k), v)
+            return target
+
+        def key_factory(k: K, _: Any) -> K:
+            return get(k, k)
+    else:
+        if aggregation is Aggregation.LAST:
+            return {mapper(k): v for k, v in mapping.items()}
+        if aggregation is Aggregation.FIRST:
+            target = {}
+            for k, v in mapping.items():
+                target.setdefault(mapper(k), v)
+            return target
 
-    def key_factory(k: K, _: Any) -> K:
-        if isinstance(mapper, Mapping):
-            return mapper.get(k, k)
-        return mapper(k)
+        def key_factory(k: K, _: Any) -> K:
+            return mapper(k)
 
     return rekey(mapping, key_factory, aggregation=aggregation)
 
@@ -442,6 +2417,15 @@ def rekey(
     Returns:
         A new dictionary with keys generated by the factory and aggregated values.
     """
+    if aggregation is Aggregation.LAST:
+        # Fast path: a plain dict comprehension, without an aggregator call and a 1-tuple per key
+        return {key_factory(k, v): v for k, v in mapping.items()}
+    if aggregation is Aggregation.FIRST:
+        target = {}
+        for k, v in mapping.items():
+            target.setdefault(key_factory(k, v), v)
+        return target
+
     ctype = aggregation.collection_type
     target = defaultdict(ctype) if ctype else {}
 
@@ -454,26 +2438,153 @@ def rekey(
     return dict(target)
 
 
+class TensorFormat(Enum):
+    """
+    Defines the output format of `reshape`.
+    """
+    NESTED = 'nested'
+    """Nested dictionaries, one level per key."""
+
+    COO = 'coo'
+    """A `SparseTensor` in coordinate format."""
+
+
+class SparseTensor:
+    """
+    A sparse tensor in coordinate (COO) format, as returned by `reshape` with `output=TensorFormat.COO`.
+
+    Each dimension (key) is a categorical encoder of its values as the int codes 0..n-1, assigned in order of first
+    appearance (encoders passed to `reshape` may be shared by several tensors). Every cell of the tensor is stored at
+    the same position of the parallel coordinate columns (one `array('q')` of codes per dimension) and of the value
+    column, which is an `array.array` if all the values are ints (fitting in 64 bits) or all floats, and a list
+    otherwise. The columns load directly into NumPy arrays, e.g. for `scipy.sparse.coo_array`.
+
+    Args:
+        dimensions: One dictionary per dimension, mapping its values to their codes.
+        coords: One column of codes per dimension.
+        values: The column of cell values.
+    """
+
+    __slots__ = ('coords', 'dimensions', 'values')
+
+    def __init__(self, dimensions: list[dict[Any, int]], coords: list[array], values: array | list):
+        self.dimensions = dimensions
+        self.coords = coords
+        self.values = values
+
+    def __repr__(self):
+        return f'{type(self).__name__}(shape={self.shape}, nnz={len(self)})'
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """The number of distinct values of each dimension."""
+        return tuple(len(dimension) for dimension in self.dimensions)
+
+    def to_nested(self) -> dict[Any, Any]:
+        """
+        Convert the tensor to the nested dictionaries `reshape` returns by default.
+
+        The cell values are shared with the tensor, not copied.
+
+        Returns:
+            A nested dictionary where the depth equals the number of dimensions.
+        """
+        if not self.dimensions:
+            return {}
+
+        # Invert the encoders, so the codes of a dimension index its values
+        labels = []
+        for dimension in self.dimensions:
+            level_labels = [None] * len(dimension)
+            for key_val, code in dimension.items():
+                level_labels[code] = key_val
+            labels.append(level_labels)
+        path_labels = labels[:-1]
+        leaf_labels = labels[-1]
+
+        result = {}
+        for *codes, leaf_code, value in zip(*self.coords, self.values, strict=True):
+            current = result
+            for level_labels, code in zip(path_labels, codes, strict=True):
+                key_val = level_labels[code]
+                try:
+                    current = current[key_val]
+                except KeyError:
+                    current[key_val] = current = {}
+            current[leaf_labels[leaf_code]] = value
+
+        return result
+
+
+@overload
 def reshape(
         iterable: Iterable[Mapping],
         keys: Sequence[str | Callable[[Mapping], Any]],
         value: str | Callable[[Mapping], Any],
-        aggregation: Aggregation = Aggregation.LAST,
+        aggregation: Aggregation = ...,
+        *,
+        output: Literal[TensorFormat.NESTED, 'nested'] = ...,
+        dimensions: None = ...,
 ) -> dict[Any, Any]:
+    ...
+
+
+@overload
+def reshape(
+        iterable: Iterable[Mapping],
+        keys: Sequence[str | Callable[[Mapping], Any]],
+        value: str | Callable[[Mapping], Any],
+        aggregation: Aggregation = ...,
+        *,
+        output: Literal[TensorFormat.COO, 'coo'],
+        dimensions: list[dict[Any, int]] | None = ...,
+) -> SparseTensor:
+    ...
+
+
+def reshape(
+        iterable: Iterable[Mapping],
+        keys: Sequence[str | Callable[[Mapping], Any]],
+        value: str | Callable[[Mapping], Any],
+        aggregation: Aggregation = Aggregation.LAST,
+        *,
+        output: TensorFormat | str = TensorFormat.NESTED,
+        dimensions: list[dict[Any, int]] | None = None,
+) -> dict[Any, Any] | SparseTensor:
     """
     Reshape a stream of mappings into a nested dictionary (tensor) of arbitrary depth.
 
-    This is a generalization of `pivot` that supports N-dimensional nesting.
+    This is a generalization of `pivot` that supports N-dimensional nesting. For large sparse tensors, the
+    `TensorFormat.COO` output stores the cells in flat columns of int codes, at a fraction of the memory of nested
+    dictionaries; `SparseTensor.to_nested()` converts it back.
 
     Args:
         iterable: An iterable of mappings (records).
         keys: A sequence of keys (or callables) to use for the nesting hierarchy.
         value: The key (or callable) to use for the leaf values.
         aggregation: The aggregation mode to use for collisions at the leaf.
+        output: The output format, as a TensorFormat or its value (e.g., 'coo'). Defaults to TensorFormat.NESTED.
+        dimensions: For TensorFormat.COO, the categorical encoders of the keys, one dictionary per key mapping its
+            values to the codes 0..n-1. Values missing from an encoder are assigned the next code, in place, so
+            tensors reshaped with the same encoders share their codes. Defaults to None (new encoders).
 
     Returns:
-        A nested dictionary where the depth equals len(keys).
+        A nested dictionary where the depth equals len(keys), or a SparseTensor with len(keys) dimensions for
+        TensorFormat.COO.
+
+    Raises:
+        ValueError: If the output format is invalid, dimensions are given for the nested output, or their number
+            differs from that of the keys.
     """
+    output = TensorFormat(output)
+    if output is TensorFormat.COO:
+        return _reshape_coo(iterable, keys, value, aggregation, dimensions)
+    if dimensions is not None:
+        raise ValueError("'dimensions' requires output=TensorFormat.COO.")
+
     if not keys:
         return {}
 
@@ -483,30 +2594,222 @@ def reshape(
     # Optimization: Bind the aggregator
     aggregate = aggregation.aggregator
     ctype = aggregation.collection_type
+    last = aggregation is Aggregation.LAST
 
-    # Optimization: Pre-calculate slice indices
-    path_keys = keys[:-1]
-    leaf_key = keys[-1]
+    # Optimization: Compile the keys and the value into one extractor of a (*path, leaf, value) tuple
+    extract_dict, extract = _reshape_extractors(keys, value)
+    depth = len(keys) - 1
 
     for item in iterable:
+        if type(item) is dict:
+            try:
+                parts = extract_dict(item)
+            except KeyError:
+                # Like item.get, missing keys are None
+                parts = extract(item)
+        else:
+            # Other mappings may define __missing__ (e.g., Counter or defaultdict), so use their get
+            parts = extract(item)
+
         # Navigate/Build the tree structure
         current = result
-        for k in path_keys:
-            key_val = k(item) if callable(k) else item.get(k)
-
-            if key_val not in current:
-                current[key_val] = {}
-
-            current = current[key_val]
-
-        leaf_val = leaf_key(item) if callable(leaf_key) else item.get(leaf_key)
-        value_val = value(item) if callable(value) else item.get(value)
+        for i in range(depth):
+            key_val = parts[i]
+            try:
+                current = current[key_val]
+            except KeyError:
+                current[key_val] = current = {}
+
+        leaf_val = parts[depth]
+
+        if last:
+            # Fast path: the last value of a single value is the value itself
+            current[leaf_val] = parts[-1]
+            continue
 
         # Apply aggregation at the leaf
         if ctype and leaf_val not in current:
             current[leaf_val] = ctype()
 
         # Pass value as a tuple because aggregator expects iterable
-        aggregate(current, leaf_val, (value_val,))
+        aggregate(current, leaf_val, (parts[-1],))
+
+    return result
+
+
+def _reshape_extractors(
+        keys: Sequence[str | Callable[[Mapping], Any]],
+        value: str | Callable[[Mapping], Any],
+) -> tuple[Callable[[dict], tuple], Callable[[Mapping], tuple]]:
+    """Compile the keys and the value into an extractor of their tuple from dicts, and one from any mapping."""
+    specs = (*keys, value)
+    getters = [spec if callable(spec) else methodcaller('get', spec) for spec in specs]
+
+    def extract(item: Mapping) -> tuple:
+        return tuple([get(item) for get in getters])
+
+    if any(callable(spec) for spec in specs):
+        return extract, extract
+    # A single C call per dict record, which raises KeyError on records missing a key
+    return itemgetter(*specs), extract
+
+
+def _reshape_coo(
+        iterable: Iterable[Mapping],
+        keys: Sequence[str | Callable[[Mapping], Any]],
+        value: str | Callable[[Mapping], Any],
+        aggregation: Aggregation,
+        dimensions: list[dict[Any, int]] | None,
+) -> SparseTensor:
+    """Reshape a stream of mappings into a SparseTensor, aggregating the cells by their (flat) key tuples."""
+    if dimensions is None:
+        dimensions = [{} for _ in keys]
+    elif len(dimensions) != len(keys):
+        raise ValueError("'dimensions' and 'keys' must be of the same length.")
+
+    if not keys:
+        return SparseTensor([], [], [])
+
+    aggregate = aggregation.aggregator
+    ctype = aggregation.collection_type
+    last = aggregation is Aggregation.LAST
+    extract_dict, extract = _reshape_extractors(keys, value)
+
+    cells = {}
+    for item in iterable:
+        if type(item) is dict:
+            try:
+                parts = extract_dict(item)
+            except KeyError:
+                # Like item.get, missing keys are None
+                parts = extract(item)
+        else:
+            # Other mappings may define __missing__ (e.g., Counter or defaultdict), so use their get
+            parts = extract(item)
+
+        cell = parts[:-1]
+        if last:
+            # Fast path: the last value of a single value is the value itself
+            cells[cell] = parts[-1]
+            continue
+
+        if ctype and cell not in cells:
+            cells[cell] = ctype()
+
+        # Pass value as a tuple because aggregator expects iterable
+        aggregate(cells, cell, (parts[-1],))
+
+    # Encode the cells in order of first appearance, so the new codes of each dimension are too.
+    # Aggregating by the raw key tuples and encoding once per cell is faster than encoding every record,
+    # as the hashes of str keys are cached anyway.
+    coords = [array('q') for _ in keys]
+    for cell in cells:
+        for dimension, column, key_val in zip(dimensions, coords, cell, strict=True):
+            column.append(dimension.setdefault(key_val, len(dimension)))
+
+    return SparseTensor(dimensions, coords, _flatten_column_array(list(cells.values())))
+
+
+def _merge_partial_tensors(result: dict, tensor: dict, depth: int, merge: Callable[[Any, Any], Any]):
+    """Merge a partial tensor of the given depth into result (in place), merging colliding leaves with merge."""
+    stack = [(result, tensor, depth)]
+    while stack:
+        into, part, level = stack.pop()
+        if level == 1:
+            for k, v in part.items():
+                into[k] = merge(into[k], v) if k in into else v
+        else:
+            for k, v in part.items():
+                if k in into:
+                    stack.append((into[k], v, level - 1))
+                else:
+                    into[k] = v
+
+
+def reshape_parallel(
+        iterable: Iterable[Mapping],
+        keys: Sequence[str | Callable[[Mapping], Any]],
+        value: str | Callable[[Mapping], Any],
+        aggregation: Aggregation = Aggregation.LAST,
+        *,
+        executor: Executor | None = None,
+        chunk_size: int = 100_000,
+) -> dict[Any, Any]:
+    """
+    Reshape a stream of mappings into a nested dictionary (tensor) in parallel. The stream is split into contiguous
+    chunks, each chunk is reshaped in a `concurrent.futures` executor, and the partial tensors are merged in order with
+    the aggregation's merger. The output equals that of `reshape` (sums of floats up to rounding).
+
+    A stream that fits in a single chunk is reshaped serially, so small inputs do not pay the pickling and scheduling
+    overhead.
+
+    Args:
+        iterable: An iterable of mappings (records).
+        keys: A sequence of keys (or callables) to use for the nesting hierarchy.
+        value: The key (or callable) to use for the leaf values.
+        aggregation: The aggregation mode to use for collisions at the leaf. Must have a merger (i.e., not EMA).
+        executor: The executor to reshape the chunks in. With a process pool, the records and any callable keys or
+            value must be picklable (e.g., module level functions). Defaults to None, which creates (and shuts down)
+            a ProcessPoolExecutor per call; pass a long-lived executor to amortize its startup.
+        chunk_size: The number of records per chunk. Defaults to 100,000.
+
+    Returns:
+        A nested dictionary where the depth equals len(keys).
 
+    Raises:
+        ValueError: If chunk_size is not positive or the aggregation's partial results cannot be merged.
+    """
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' must be positive.")
+    merge = aggregation.merger
+    if merge is None:
+        raise ValueError(f'Partial results of Aggregation.{aggregation.name} cannot be merged.')
+    if not keys:
+        return {}
+
+    iterator = iter(iterable)
+    chunk = list(itertools.islice(iterator, chunk_size))
+    if len(chunk) < chunk_size:
+        return reshape(chunk, keys, value, aggregation)
+
+    if executor is None:
+        with concurrent.futures.ProcessPoolExecutor() as pool:
+            return _reshape_chunks(pool, chunk, iterator, keys, value, aggregation, chunk_size, merge)
+    return _reshape_chunks(executor, chunk, iterator, keys, value, aggregation, chunk_size, merge)
+
+
+def _reshape_chunk(
+        chunk: list[Mapping],
+        keys: Sequence[str | Callable[[Mapping], Any]],
+        value: str | Callable[[Mapping], Any],
+        aggregation_name: str,
+) -> dict[Any, Any]:
+    """Reshape a chunk in a worker. The aggregation is passed by name, as its members do not pickle on Python 3.11."""
+    return reshape(chunk, keys, value, Aggregation[aggregation_name])
+
+
+def _reshape_chunks(  # NOSONAR
+        executor: Executor,
+        chunk: list,
+        iterator: Iterator[Mapping],
+        keys: Sequence[str | Callable[[Mapping], Any]],
+        value: str | Callable[[Mapping], Any],
+        aggregation: Aggregation,
+        chunk_size: int,
+        merge: Callable[[Any, Any], Any],
+) -> dict[Any, Any]:
+    """Reshape the chunks in the executor and merge the partial tensors in submission order."""
+    # Bound the chunks in flight, so a long stream is not materialized at once.
+    max_pending = 2 * (os.cpu_count() or 1)
+    pending = deque()
+    result = {}
+    depth = len(keys)
+    while chunk:
+        pending.append(executor.submit(_reshape_chunk, chunk, keys, value, aggregation.name))
+        if len(pending) >= max_pending:
+            _merge_partial_tensors(result, pending.popleft().result(), depth, merge)
+        chunk = list(itertools.islice(iterator, chunk_size))
+
+    while pending:
+        _merge_partial_tensors(result, pending.popleft().result(), depth, merge)
     return result
@@ -1,5 +1,7 @@
 import operator
+from collections.abc import Callable
 from enum import Enum
+from functools import cache
 from typing import Any, Protocol, cast
 
 from mappingtools.typing import MISSING, T, Tree
@@ -194,6 +196,100 @@ ResolverType = Resolver | LogicalResolver | NumericResolver
 
 # endregion Resolvers
 
+# region Vectorized Resolvers
+
+_VECTORIZE_MIN_SIZE = 64
+"""The minimal length of a pair of numeric lists to resolve with a single vectorized (NumPy) operation."""
+
+
+@cache
+def _numpy() -> Any:
+    """Import NumPy on the first vectorized resolution (not on importing mappingtools), or return None if missing."""
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover
+        return None
+    return np
+
+
+def _vectorized_max(first: Any, last: Any) -> Any:
+    # Same semantics as the builtin max(first, last), including NaNs: the last wins only if it is greater.
+    return _numpy().where(last > first, last, first)
+
+
+def _vectorized_min(first: Any, last: Any) -> Any:
+    # Same semantics as the builtin min(first, last), including NaNs: the last wins only if it is less.
+    return _numpy().where(last < first, last, first)
+
+
+def _vectorized_ema(first: Any, last: Any) -> Any:
+    return (first + last) * 0.5
+
+
+# The NumPy equivalent of each numeric resolver, and the bound on the magnitude of its integer operands that
+# guarantees the int64 result is exact (Python integers are unbounded).
+_VECTORIZED_RESOLVERS = {
+    NumericResolver.SUM.value: (operator.add, 2 ** 62),
+    NumericResolver.MUL.value: (operator.mul, 2 ** 31),
+    NumericResolver.MAX.value: (_vectorized_max, 2 ** 63),
+    NumericResolver.MIN.value: (_vectorized_min, 2 ** 63),
+    NumericResolver.EMA.value: (_vectorized_ema, 2 ** 62),
+}
+
+
+def _numeric_kind(values: list, int_bound: int) -> type | None:
+    """Return float (or int) if all values are floats (or all are ints within the bound), otherwise None."""
+    kinds = set(map(type, values))
+    if kinds == {float}:
+        return float
+    if kinds == {int} and -int_bound < min(values) and max(values) < int_bound:
+        return int
+    return None
+
+
+def _vectorized_resolver(op: Any) -> Callable[[list, list], list | None] | None:
+    """
+    Return a vectorized equivalent of a numeric resolver, that positionally resolves a pair of numeric lists (with
+    the zip-longest semantics of `combine`) in a single NumPy operation.
+
+    The returned function returns None for lists it does not vectorize: lists shorter than _VECTORIZE_MIN_SIZE, or
+    lists that are not homogeneously floats (or ints small enough for exact int64 arithmetic), so the results are
+    identical to resolving the pairs one by one. It also returns None if NumPy is not installed, which it imports on
+    its first vectorized resolution.
+
+    Args:
+        op: A resolver strategy or callable.
+
+    Returns:
+        The vectorized resolver, or None if `op` is not a NumericResolver.
+    """
+    if isinstance(op, NumericResolver):
+        op = op.value
+    try:
+        func, int_bound = _VECTORIZED_RESOLVERS[op]
+    except (KeyError, TypeError):
+        return None
+
+    def resolve(first: list, last: list) -> list | None:
+        n = min(len(first), len(last))
+        if n < _VECTORIZE_MIN_SIZE or (np := _numpy()) is None:
+            return None
+        head_first = first[:n] if len(first) > n else first
+        head_last = last[:n] if len(last) > n else last
+        kind = _numeric_kind(head_first, int_bound)
+        if kind is None or _numeric_kind(head_last, int_bound) is not kind:
+            return None
+
+        dtype = np.float64 if kind is float else np.int64
+        resolved = func(np.fromiter(head_first, dtype, n), np.fromiter(head_last, dtype, n)).tolist()
+        # Positions beyond the shorter list are taken as is, like a MISSING side.
+        resolved.extend(first[n:] if len(first) > n else last[n:])
+        return resolved
+
+    return resolve
+
+# endregion Vectorized Resolvers
+
 # region Decision Metrics
 
 class DecisionMetricOperator(Protocol):
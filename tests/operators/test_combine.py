@@ -1,7 +1,7 @@
 import pytest
 
-from mappingtools.operators import combine
-from mappingtools.resolvers import LogicalResolver, NumericResolver, Resolver
+from mappingtools.operators import Engine, combine
+from mappingtools.resolvers import DecisionMetric, LogicalResolver, NumericResolver, Resolver
 from mappingtools.typing import MISSING
 
 
@@ -260,3 +260,102 @@ def test_combine_deep_nested_conflict():
             }
         }
     }
+
+
+def test_combine_engines_are_equivalent():
+    t1 = {"a": [1, {"b": 2}, [3]], "c": {"d": {"e": 1}}, "f": 1, "g": [1], "v": 1}
+    t2 = {"a": [{"x": 1}, {"b": 3, "y": 4}], "c": {"d": [1]}, "f": [2], "g": 2, "h": {"i": 1}, "v": 2}
+
+    def op(a, b):
+        return MISSING if a == 1 and b == 2 else (a, b)
+
+    recursive = combine(t1, t2, op=op, engine=Engine.RECURSIVE)
+    iterative = combine(t1, t2, op=op, engine=Engine.ITERATIVE)
+
+    assert iterative == recursive
+    assert list(iterative) == list(recursive)
+    assert "v" not in iterative
+
+
+@pytest.mark.parametrize("engine", list(Engine))
+@pytest.mark.parametrize("share_unchanged", [False, True])
+def test_combine_key_order_is_deterministic(engine, share_unchanged):
+    t1 = {"z": 1, "m": {"y": 1, "b": 2}, "a": 3}
+    t2 = {"q": 1, "m": {"c": 1, "b": 3, "a": 0}, "z": 2, "b": 4}
+
+    result = combine(t1, t2, engine=engine, share_unchanged=share_unchanged)
+
+    assert list(result) == ["z", "m", "a", "q", "b"]
+    assert list(result["m"]) == ["y", "b", "c", "a"]
+
+
+@pytest.mark.parametrize("engine", list(Engine))
+def test_combine_metrics_key_order_is_deterministic(engine):
+    t1 = {"z": 1, "m": {"y": 1, "b": 2}}
+    t2 = {"q": 1, "m": {"c": 1, "b": 3}}
+
+    result, metrics = combine(t1, t2, decision_metrics=[DecisionMetric.PROVENANCE], engine=engine)
+
+    assert list(result) == list(metrics["PROVENANCE"]) == ["z", "m", "q"]
+    assert list(result["m"]) == list(metrics["PROVENANCE"]["m"]) == ["y", "b", "c"]
+
+
+@pytest.mark.parametrize("engine", list(Engine))
+def test_combine_handles_trees_deeper_than_recursion_limit(engine):
+    depth = 5_000
+    t1 = t2 = 1
+    for _ in range(depth):
+        t1, t2 = [{"x": t1}], [{"x": t2}]
+
+    # The recursive engine falls back to the iterative one
+    result = combine(t1, t2, op=NumericResolver.SUM, engine=engine)
+    node = result
+    while isinstance(node, (dict, list)):
+        node = node[0] if isinstance(node, list) else node["x"]
+    assert node == 2
+
+
+@pytest.mark.parametrize("decision_metrics", [None, [DecisionMetric.PROVENANCE]])
+def test_combine_circular_trees_raise_recursion_error(decision_metrics):
+    t1 = {"a": 1}
+    t1["self"] = t1
+    t2 = [{"b": 2}]
+    t2[0]["self"] = t2
+
+    with pytest.raises(RecursionError):
+        combine(t1, {"self": t1}, decision_metrics=decision_metrics)
+    with pytest.raises(RecursionError):
+        combine([{"self": t2}], t2, decision_metrics=decision_metrics)
+
+
+@pytest.mark.parametrize("engine", list(Engine))
+def test_combine_share_unchanged(engine):
+    untouched = {"x": [1, 2, {"y": 3}]}
+    t1 = {"a": untouched, "b": {"c": 1, "d": 2}, "e": [1, 2], "v": 1}
+    t2 = {"b": {"c": 10}, "e": t1["e"], "f": 1, "v": 2}
+
+    result = combine(t1, t2, op=Resolver.LAST, engine=engine, share_unchanged=True)
+
+    assert result == combine(t1, t2, op=Resolver.LAST)
+    assert result["a"] is untouched
+    assert result["e"] is t1["e"]
+    assert result["b"] is not t1["b"]
+    assert combine(t1, t1, op=Resolver.LAST, engine=engine, share_unchanged=True) is t1
+
+
+@pytest.mark.parametrize("engine", list(Engine))
+def test_combine_share_unchanged_does_not_skip_non_idempotent_resolvers(engine):
+    t1 = {"a": {"b": 1}, "c": [1, 2], "d": 3}
+
+    summed = combine(t1, t1, op=NumericResolver.SUM, engine=engine, share_unchanged=True)
+    voided = combine(t1, {"d": 4}, op=Resolver.VOID, engine=engine, share_unchanged=True)
+
+    assert summed == {"a": {"b": 2}, "c": [2, 4], "d": 6}
+    assert voided == {"a": {"b": 1}, "c": [1, 2]}
+    assert voided["a"] is t1["a"]
+    assert t1 == {"a": {"b": 1}, "c": [1, 2], "d": 3}
+
+
+def test_combine_share_unchanged_rejects_decision_metrics():
+    with pytest.raises(ValueError, match="share_unchanged"):
+        combine({"a": 1}, {"a": 2}, decision_metrics=[], share_unchanged=True)
@@ -0,0 +1,110 @@
+from functools import reduce
+
+import pytest
+
+from mappingtools.operators import combine, combine_all
+from mappingtools.resolvers import DecisionMetric, NumericResolver, Resolver
+from mappingtools.typing import MISSING
+
+layers = [
+    {"a": 1, "b": {"c": 1, "d": [1, 2]}, "e": "base"},
+    {"a": 2, "b": {"c": 2}, "f": {"g": 1}},
+    {"b": {"d": [10], "h": True}, "e": ["x"]},
+    {"a": 3, "f": 4},
+]
+
+
+@pytest.mark.parametrize(
+    "op",
+    [Resolver.LAST, Resolver.FIRST, Resolver.ALL, Resolver.VOID, Resolver.MARK, Resolver.NULL],
+)
+def test_combine_all_equals_pairwise_reduce(op):
+    def combine_op(t1, t2):
+        return combine(t1, t2, op)
+
+    expected = reduce(combine_op, layers)
+
+    result = combine_all(*layers, op=op)
+
+    assert result == expected
+
+
+def test_combine_all_sum():
+    trees = [{"x": 1, "y": {"z": 1}}, {"x": 2, "y": {"z": 2}}, {"x": 3, "y": {"w": 1}}]
+
+    result = combine_all(*trees, op=NumericResolver.SUM)
+
+    assert result == {"x": 6, "y": {"z": 3, "w": 1}}
+
+
+def test_combine_all_left_fold_resolver_calls():
+    calls = []
+
+    def op(a, b):
+        calls.append((a, b))
+        return a + b
+
+    result = combine_all({"a": 1, "b": 1}, {"a": 2}, {"a": 3}, op=op)
+
+    assert result == {"a": 6, "b": 1}
+    assert calls == [(1, 2), (3, 3)]
+
+
+def test_combine_all_shares_subtrees_present_in_a_single_tree():
+    shared = {"deep": {"config": [1, 2, 3]}}
+
+    result = combine_all({"a": shared}, {"b": 1}, {"c": 2})
+
+    assert result["a"] is shared
+
+
+def test_combine_all_key_order_is_first_seen():
+    result = combine_all({"b": 1, "a": 1}, {"c": 1, "a": 2}, {"d": 1})
+
+    assert list(result) == ["b", "a", "c", "d"]
+
+
+def test_combine_all_key_dropped_by_resolver_keeps_first_seen_position():
+    trees = [{"a": 1, "b": 1}, {"a": 2, "c": 1}, {"a": 3}]
+
+    result = combine_all(*trees, op=Resolver.VOID)
+    folded = reduce(lambda t1, t2: combine(t1, t2, Resolver.VOID), trees)
+
+    assert result == folded == {"a": 3, "b": 1, "c": 1}
+    assert list(result) == ["a", "b", "c"]
+    assert list(folded) == ["b", "c", "a"]
+
+
+def test_combine_all_edge_cases():
+    assert combine_all() is MISSING
+    assert combine_all({"a": 1}) == {"a": 1}
+    assert combine_all(MISSING, {"a": 1}, MISSING) == {"a": 1}
+    assert combine_all(1, 2, 3) == 3
+
+
+def test_combine_all_with_metrics_describe_the_last_tree():
+    decision_metrics = [DecisionMetric.PROVENANCE, DecisionMetric.CHANGELOG]
+
+    combined, metrics = combine_all(*layers, decision_metrics=decision_metrics)
+    expected = combine(combine_all(*layers[:-1]), layers[-1], Resolver.LAST, decision_metrics)
+
+    assert (combined, metrics) == expected
+    assert metrics["PROVENANCE"]["a"] == 1
+    assert metrics["CHANGELOG"]["b"]["h"] == "unchanged"
+
+
+def test_combine_all_handles_deep_trees():
+    depth = 5_000
+    trees = []
+    for i in range(3):
+        tree = {"leaf": i}
+        for _ in range(depth):
+            tree = {"child": tree}
+        trees.append(tree)
+
+    result = combine_all(*trees, op=NumericResolver.SUM)
+
+    node = result
+    while "child" in node:
+        node = node["child"]
+    assert node == {"leaf": 3}
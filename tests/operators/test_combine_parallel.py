@@ -0,0 +1,65 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from mappingtools.operators import combine, combine_parallel
+from mappingtools.resolvers import DecisionMetric, NumericResolver, Resolver
+
+tree1 = {f"tenant_{i}": {"quota": i, "tags": [i, i + 1], "cfg": {"a": i}} for i in range(0, 100, 2)}
+tree2 = {f"tenant_{i}": {"quota": -i, "tags": [i], "cfg": {"b": i}} for i in range(0, 100, 3)}
+
+
+@pytest.mark.parametrize("chunks", [1, 3, 7, 1_000])
+@pytest.mark.parametrize("op", [Resolver.LAST, NumericResolver.SUM])
+def test_combine_parallel_equals_combine(chunks, op):
+    # Arrange
+    expected = combine(tree1, tree2, op)
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = combine_parallel(tree1, tree2, op, executor=executor, chunks=chunks, min_keys=0)
+
+    # Assert
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+def test_combine_parallel_with_metrics():
+    # Arrange
+    metrics = [DecisionMetric.PROVENANCE, DecisionMetric.CHANGELOG]
+    expected, expected_metrics = combine(tree1, tree2, Resolver.LAST, metrics)
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result, result_metrics = combine_parallel(tree1, tree2, Resolver.LAST, metrics, executor=executor, min_keys=0)
+
+    # Assert
+    assert result == expected
+    assert result_metrics == expected_metrics
+    assert list(result_metrics["PROVENANCE"]) == list(expected)
+
+
+def test_combine_parallel_with_process_pool():
+    # Act
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result = combine_parallel(tree1, tree2, NumericResolver.SUM, executor=executor, chunks=4, min_keys=0)
+    default_executor_result = combine_parallel(tree1, tree2, chunks=2, min_keys=0)
+
+    # Assert
+    assert result == combine(tree1, tree2, NumericResolver.SUM)
+    assert default_executor_result == combine(tree1, tree2)
+
+
+def test_combine_parallel_falls_back_to_serial():
+    # Arrange
+    executor = Mock()
+
+    # Act
+    small = combine_parallel(tree1, tree2, executor=executor)
+    leaf = combine_parallel(1, 2, executor=executor, min_keys=0)
+
+    # Assert
+    assert small == combine(tree1, tree2)
+    assert leaf == 2
+    executor.submit.assert_not_called()
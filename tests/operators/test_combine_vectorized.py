@@ -0,0 +1,82 @@
+import math
+import random
+
+import pytest
+
+from mappingtools.operators import Engine, combine
+from mappingtools.resolvers import NumericResolver, _vectorized_resolver
+
+pytest.importorskip("numpy")
+
+numeric_resolvers = list(NumericResolver)
+
+
+def _scalar(op):
+    # A plain callable is never vectorized, so it resolves the list pairs one by one.
+    return lambda first, last: op.value(first, last)
+
+
+def _assert_identical(result, expected):
+    assert len(result) == len(expected)
+    for r, e in zip(result, expected, strict=True):
+        assert type(r) is type(e)
+        assert r == e or (math.isnan(r) and math.isnan(e))
+
+
+@pytest.mark.parametrize("engine", list(Engine))
+@pytest.mark.parametrize("op", numeric_resolvers)
+def test_combine_vectorized_floats(op, engine):
+    # Arrange
+    rng = random.Random(42)
+    t1 = {"cpu": [rng.uniform(-10, 10) for _ in range(500)] + [math.nan, 1.0, -0.0]}
+    t2 = {"cpu": [rng.uniform(-10, 10) for _ in range(400)] + [2.0, math.nan, 0.0]}
+
+    # Act
+    result = combine(t1, t2, op, engine=engine)
+
+    # Assert
+    assert _vectorized_resolver(op)(t1["cpu"], t2["cpu"]) is not None
+    _assert_identical(result["cpu"], combine(t1, t2, _scalar(op))["cpu"])
+
+
+@pytest.mark.parametrize("engine", list(Engine))
+@pytest.mark.parametrize("op", numeric_resolvers)
+def test_combine_vectorized_ints(op, engine):
+    # Arrange
+    rng = random.Random(7)
+    t1 = [[rng.randint(-1000, 1000) for _ in range(300)]]
+    t2 = [[rng.randint(-1000, 1000) for _ in range(350)]]
+
+    # Act
+    result = combine(t1, t2, op, engine=engine)
+
+    # Assert
+    assert _vectorized_resolver(op)(t1[0], t2[0]) is not None
+    _assert_identical(result[0], combine(t1, t2, _scalar(op))[0])
+
+
+@pytest.mark.parametrize(
+    ("first", "last"),
+    [
+        ([1] * 99 + [2.0], [1] * 100),  # mixed ints and floats
+        ([2 ** 63] * 100, [1] * 100),  # ints beyond int64
+        ([True] * 100, [1] * 100),  # bools
+        (list(range(10)), list(range(10))),  # too short
+    ],
+)
+def test_vectorized_resolver_skips_lists_it_cannot_resolve_exactly(first, last):
+    # Arrange
+    resolve = _vectorized_resolver(NumericResolver.SUM)
+
+    # Act
+    resolved = resolve(first, last)
+
+    # Assert
+    assert resolved is None
+    assert combine([first], [last], NumericResolver.SUM) == combine([first], [last], _scalar(NumericResolver.SUM))
+
+
+def test_vectorized_resolver_only_for_numeric_resolvers():
+    assert _vectorized_resolver(NumericResolver.MAX) is not None
+    assert _vectorized_resolver(max) is not None
+    assert _vectorized_resolver(lambda first, last: last) is None
@@ -1,4 +1,4 @@
-from mappingtools.operators import combine
+from mappingtools.operators import Engine, combine
 from mappingtools.resolvers import DecisionMetric, NumericResolver, Resolver
 
 
@@ -275,3 +275,14 @@ def test_change_count_metric_of_method():
     change_count_tree_side_0 = DecisionMetric.CHANGE_COUNT.of(combined, 0)
     assert change_count_tree_side_0 == {"a": 0, "b": 0, "c": [0, MISSING]}
 
+
+def test_combine_with_metrics_engines_are_equivalent():
+    t1 = {"a": 1, "b": {"c": [1, 2, {"d": 3}]}, "e": {"f": 1}, "g": 5}
+    t2 = {"a": 2, "b": {"c": [4, 5, {"d": 1, "x": 1}], "y": 2}, "e": {"f": 1}, "h": [1, {"i": 2}]}
+    decision_metrics = [DecisionMetric.PROVENANCE, DecisionMetric.AUDIT, DecisionMetric.CHANGE_COUNT]
+
+    recursive = combine(t1, t2, NumericResolver.SUM, decision_metrics, engine=Engine.RECURSIVE)
+    iterative = combine(t1, t2, NumericResolver.SUM, decision_metrics, engine=Engine.ITERATIVE)
+
+    assert iterative == recursive
+    assert repr(iterative) == repr(recursive)
@@ -0,0 +1,170 @@
+import pytest
+
+from mappingtools.operators import Combiner, combine, fingerprint
+from mappingtools.resolvers import DecisionMetric, Resolver
+from mappingtools.typing import MISSING
+
+base = {"flags": {"a": True, "b": False}, "limits": {"cpu": 1, "memory": [512, 1024]}, "name": "base"}
+overlay = {"flags": {"b": True}, "limits": {"cpu": 2}}
+
+
+def test_combiner_initial_result_equals_combine():
+    # Act
+    combiner = Combiner(base, overlay)
+
+    # Assert
+    assert combiner.result == combine(base, overlay)
+    assert combiner.tree1 == base
+    assert combiner.tree2 == overlay
+
+
+@pytest.mark.parametrize(
+    ("delta1", "delta2", "expected_tree1", "expected_tree2"),
+    [
+        # Update a leaf of the overlay
+        (None, {"flags": {"b": False}}, base, {"flags": {"b": False}, "limits": {"cpu": 2}}),
+        # Add a new subtree to the overlay
+        (None, {"extra": {"x": 1}}, base, {**overlay, "extra": {"x": 1}}),
+        # Delete a key from the overlay
+        (None, {"limits": MISSING}, base, {"flags": {"b": True}}),
+        # Replace a dict by a scalar in the base
+        ({"limits": 0}, None, {**base, "limits": 0}, overlay),
+        # Patch both sides at once
+        (
+            {"flags": {"c": 1}},
+            {"limits": {"memory": [256]}},
+            {**base, "flags": {"a": True, "b": False, "c": 1}},
+            {"flags": {"b": True}, "limits": {"cpu": 2, "memory": [256]}},
+        ),
+    ],
+)
+def test_combiner_update(delta1, delta2, expected_tree1, expected_tree2):
+    # Arrange
+    combiner = Combiner(base, overlay)
+
+    # Act
+    result = combiner.update(delta1, delta2)
+
+    # Assert
+    assert combiner.tree1 == expected_tree1
+    assert combiner.tree2 == expected_tree2
+    assert result == combine(expected_tree1, expected_tree2)
+    assert combiner.result is result
+
+
+def test_combiner_update_with_metrics():
+    # Arrange
+    metrics = [DecisionMetric.PROVENANCE, DecisionMetric.CHANGELOG]
+    combiner = Combiner(base, overlay, Resolver.LAST, metrics)
+    provenance = combiner.metrics["PROVENANCE"]
+
+    # Act
+    result, result_metrics = combiner.update(delta2={"flags": {"a": False}, "limits": {"cpu": MISSING}})
+
+    # Assert
+    expected_tree2 = {"flags": {"a": False, "b": True}, "limits": {}}
+    assert (result, result_metrics) == combine(base, expected_tree2, Resolver.LAST, metrics)
+    assert result_metrics["PROVENANCE"] is provenance
+    assert provenance["flags"] == {"a": 1, "b": 1}
+    assert provenance["limits"]["cpu"] == 0
+
+
+def test_combiner_update_recomputes_only_touched_paths():
+    # Arrange
+    calls = []
+
+    def op(t1, t2):
+        calls.append((t1, t2))
+        return t1 + t2
+
+    combiner = Combiner({"a": 1, "b": {"c": 1, "d": 1}}, {"a": 1, "b": {"c": 1, "d": 1}}, op)
+    calls.clear()
+
+    # Act
+    result = combiner.update(delta2={"b": {"d": 5}})
+
+    # Assert
+    assert result == {"a": 2, "b": {"c": 2, "d": 6}}
+    assert calls == [(1, 5)]
+
+
+def test_combiner_void_resolver_drops_and_restores_keys():
+    # Arrange
+    combiner = Combiner({"a": 1, "b": 2}, {"a": 3}, Resolver.VOID)
+
+    # Act
+    dropped = dict(combiner.result)
+    restored = combiner.update(delta2={"a": MISSING})
+
+    # Assert
+    assert dropped == {"b": 2}
+    assert restored == {"a": 1, "b": 2}
+
+
+def test_combiner_does_not_mutate_inputs():
+    # Arrange
+    tree1 = {"a": {"b": 1}}
+    tree2 = {"a": {"c": 2}}
+    delta = {"a": {"b": [1, 2]}}
+
+    # Act
+    combiner = Combiner(tree1, tree2)
+    combiner.update(delta, {"a": {"c": MISSING}})
+    delta["a"]["b"].append(3)
+
+    # Assert
+    assert tree1 == {"a": {"b": 1}}
+    assert tree2 == {"a": {"c": 2}}
+    assert combiner.result == {"a": {"b": [1, 2]}}
+
+
+def test_combiner_missing_trees():
+    # Arrange
+    combiner = Combiner()
+
+    # Act
+    result = combiner.update(delta2={"a": 1})
+
+    # Assert
+    assert Combiner().result is MISSING
+    assert combiner.tree1 is MISSING
+    assert result == {"a": 1}
+
+
+@pytest.mark.parametrize(
+    ("delta1", "delta2"),
+    [
+        # Move a key from the first tree to the second
+        ({"a": MISSING}, {"a": 5}),
+        # Add to the first tree a key that only the second tree had
+        ({"c": 1}, None),
+        # Delete from the second tree a key that the first tree lacks, then add it back to the first
+        ({"c": 4}, {"c": MISSING}),
+        # Nested dicts are reordered too
+        ({"d": {"x": MISSING}}, {"d": {"x": 2}}),
+    ],
+)
+def test_combiner_update_keeps_the_key_order_of_combine(delta1, delta2):
+    # Arrange
+    metrics = [DecisionMetric.PROVENANCE]
+    combiner = Combiner({"a": 1, "b": 2, "d": {"x": 1, "y": 1}}, {"c": 3, "d": {"z": 1}}, Resolver.LAST, metrics)
+
+    # Act
+    result, result_metrics = combiner.update(delta1, delta2)
+
+    # Assert
+    expected, expected_metrics = combine(combiner.tree1, combiner.tree2, Resolver.LAST, metrics)
+    assert repr(result) == repr(expected)
+    assert repr(result_metrics) == repr(expected_metrics)
+    assert fingerprint(result) == fingerprint(expected)
+
+
+def test_combiner_void_resolver_restores_keys_in_order():
+    # Arrange
+    combiner = Combiner({"a": 1, "b": 2}, {"a": 3}, Resolver.VOID)
+
+    # Act
+    restored = combiner.update(delta2={"a": MISSING})
+
+    # Assert
+    assert list(restored) == list(combine({"a": 1, "b": 2}, {})) == ["a", "b"]
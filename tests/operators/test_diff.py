@@ -0,0 +1,89 @@
+import pytest
+
+from mappingtools.operators import KeyFormat, diff, flatten
+
+old = {
+    "user": {"id": 101, "name": "Alice", "tags": ["a", "b"], "prefs": {"email": True, "sms": False}},
+    "items": [{"sku": 1}, {"sku": 2}],
+}
+new = {
+    "user": {"id": 101, "name": "Alice Smith", "tags": ["a"], "prefs": {"email": True, "push": True}},
+    "items": [{"sku": 1}, {"sku": 3}, {"sku": 4}],
+}
+
+
+def _flattened_diff(tree1, tree2, key_format):
+    flat1, flat2 = flatten(tree1, key_format), flatten(tree2, key_format)
+    return {
+        "added": {k: v for k, v in flat2.items() if k not in flat1},
+        "removed": {k: v for k, v in flat1.items() if k not in flat2},
+        "changed": {k: (v, flat2[k]) for k, v in flat1.items() if k in flat2 and v != flat2[k]},
+    }
+
+
+@pytest.mark.parametrize("key_format", list(KeyFormat))
+@pytest.mark.parametrize(
+    ("tree1", "tree2"),
+    [
+        (old, new),
+        (new, old),
+        (old, old),
+        ({"a": {"b": 1}}, {"a": 1}),
+        ({"a": [1, 2]}, {"a": {"x": 1}}),
+        ({"a": []}, {"a": {}}),
+        ({("a", "b"): 1}, {"a": {"c": 2}}),
+        (1, 2),
+        (1, {"a": 1}),
+        ([], [1, [2]]),
+    ],
+)
+def test_diff_equals_flattened_diff(tree1, tree2, key_format):
+    # Act
+    result = diff(tree1, tree2, key_format)
+
+    # Assert
+    assert result == _flattened_diff(tree1, tree2, key_format)
+
+
+def test_diff_paths():
+    # Act
+    result = diff(old, new, KeyFormat.JSONPATH)
+
+    # Assert
+    assert result == {
+        "added": {"$.user.prefs.push": True, "$.items[2].sku": 4},
+        "removed": {"$.user.tags[1]": "b", "$.user.prefs.sms": False},
+        "changed": {"$.user.name": ("Alice", "Alice Smith"), "$.items[1].sku": (2, 3)},
+    }
+
+
+def test_diff_skips_identical_subtrees():
+    # Arrange
+    class Leaf:
+        def __eq__(self, other):
+            raise AssertionError("identical subtrees must not be visited")
+
+        __hash__ = object.__hash__
+
+    shared = {"deep": [Leaf()]}
+
+    # Act
+    result = diff({"shared": shared, "x": 1}, {"shared": shared, "x": 2})
+
+    # Assert
+    assert result == {"added": {}, "removed": {}, "changed": {("x",): (1, 2)}}
+
+
+def test_diff_deep_trees():
+    # Arrange
+    # Deeper than the trees can be compared at once
+    depth = 20_000
+    tree1, tree2 = 1, 2
+    for _ in range(depth):
+        tree1, tree2 = {"k": tree1}, {"k": tree2}
+
+    # Act
+    result = diff(tree1, tree2, KeyFormat.JSONPOINTER)
+
+    # Assert
+    assert result["changed"] == {"/k" * depth: (1, 2)}
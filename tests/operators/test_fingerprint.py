@@ -0,0 +1,128 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from mappingtools.operators import FingerprintCache, fingerprint
+
+tree = {"user": {"id": 1, "tags": ["a", "b"], "prefs": {"theme": "dark", "ratio": 0.5}}, "items": [{"sku": 1}]}
+
+
+def _copy(value):
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+def test_fingerprint_equal_trees():
+    # Act
+    result = fingerprint(tree)
+
+    # Assert
+    assert result == fingerprint(_copy(tree))
+    assert len(result) == 32
+    int(result, 16)
+
+
+@pytest.mark.parametrize(
+    ("tree1", "tree2"),
+    [
+        ({"a": 1}, {"a": 2}),
+        ({"a": 1}, {"b": 1}),
+        ({"a": 1, "b": 2}, {"b": 2, "a": 1}),  # key order
+        ([1, 2], [2, 1]),
+        ([1], [1.0]),
+        ([1], [True]),
+        ([0.0], [-0.0]),
+        ([1], ["1"]),
+        ({}, []),
+        ({0: "a"}, ["a"]),
+        ([[1], 2], [1, [2]]),
+        ({"a": [1]}, {"a": 1}),
+        (None, "None"),
+    ],
+)
+def test_fingerprint_different_trees(tree1, tree2):
+    assert fingerprint(tree1) != fingerprint(tree2)
+
+
+def test_fingerprint_is_stable_across_processes():
+    # Arrange
+    code = f"from mappingtools.operators import fingerprint; print(fingerprint({tree!r}))"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), "PYTHONHASHSEED": "random"}
+
+    # Act
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout
+
+    # Assert
+    assert output.strip() == fingerprint(tree)
+
+
+def test_fingerprint_cache():
+    # Arrange
+    cache = FingerprintCache()
+    expected = fingerprint(tree, cache)
+    visited = []
+
+    class Leaf:
+        def __repr__(self):
+            visited.append(self)
+            return "Leaf()"
+
+    changed = {**tree, "user": {**tree["user"], "id": Leaf()}}
+
+    # Act
+    unchanged = fingerprint(tree, cache)
+    result = fingerprint(changed, cache)
+
+    # Assert
+    assert unchanged == expected
+    assert cache.get(tree) == bytes.fromhex(expected)
+    assert cache.get(_copy(tree)) is None
+    assert result == fingerprint(_copy(changed))
+    assert result != expected
+    # Only the changed path is hashed again, the cached subtrees are reused.
+    assert len(visited) == 2
+    assert cache.get(tree["items"]) is not None
+
+
+def test_fingerprint_cache_is_bounded():
+    # Arrange
+    cache = FingerprintCache(maxsize=3)
+    trees = [[i] for i in range(5)]
+
+    # Act
+    for t in trees:
+        fingerprint(t, cache)
+    fingerprint(trees[2], cache)  # Now the most recently used
+    fingerprint([5], cache)
+
+    # Assert
+    assert len(cache) == 3
+    assert [cache.get(t) is not None for t in trees] == [False, False, True, False, True]
+    assert repr(cache) == "FingerprintCache(maxsize=3)"
+    cache.clear()
+    assert len(cache) == 0
+    assert len(FingerprintCache(maxsize=None)) == 0
+    with pytest.raises(ValueError, match="'maxsize' must be zero or more"):
+        FingerprintCache(maxsize=-1)
+
+
+def test_fingerprint_edge_cases():
+    # Arrange
+    deep = 1
+    for _ in range(5000):
+        deep = [deep]
+    circular = []
+    circular.append(circular)
+    for _ in range(2000):
+        circular = [circular]
+
+    # Assert
+    assert fingerprint(deep) != fingerprint([deep])
+    assert fingerprint(1) != fingerprint([1])
+    with pytest.raises(RecursionError):
+        fingerprint(circular)
@@ -249,3 +249,42 @@ def test_key_formats_coverage():
     assert _flatten_step_str('', 'a') == '"a"'
     assert _flatten_step_str('', 123) == '123'
     assert _flatten_step_str('a', 'b') == 'a,"b"'
+
+
+# Flatten trees deeper than the recursion limit
+@pytest.mark.parametrize('key_format', list(KeyFormat))
+def test_flatten_beyond_recursion_limit(key_format):
+    # Arrange
+    depth = 5000
+    nested = 'leaf'
+    for i in range(depth):
+        nested = {'k': nested} if i % 2 else [nested]
+
+    # Act
+    result = flatten(nested, key_format)
+
+    # Assert
+    assert list(result.values()) == ['leaf']
+    if key_format is KeyFormat.TUPLE:
+        assert len(next(iter(result))) == depth
+
+
+# Keys repeated across records produce the same paths as a single step
+@pytest.mark.parametrize('key_format', list(KeyFormat))
+def test_flatten_repeated_keys(key_format):
+    # Arrange
+    initial, step = key_format.value
+    records = [{'id': i, 'a/b~c': {'x-y': [i]}, ('t', 0): None} for i in range(3)]
+
+    # Act
+    result = flatten(records, key_format)
+
+    # Assert
+    expected = {}
+    for i in range(3):
+        row = step(initial, i)
+        expected[step(row, 'id')] = i
+        expected[step(step(step(row, 'a/b~c'), 'x-y'), 0)] = i
+        expected[step(step(row, 't'), 0)] = None
+    assert result == expected
+    assert list(result) == list(expected)
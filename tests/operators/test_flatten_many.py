@@ -0,0 +1,84 @@
+import tracemalloc
+from array import array
+
+import pytest
+
+from mappingtools.operators import KeyFormat, flatten, flatten_many
+from mappingtools.typing import MISSING
+
+records = [
+    {"id": 1, "user": {"name": "ann", "tags": ["a"]}},
+    {"id": 2, "score": 1.5},
+    {"id": 3, "user": {"name": "cid", "tags": ["c", "d"]}, "score": 2.5},
+]
+
+
+@pytest.mark.parametrize("key_format", list(KeyFormat))
+def test_flatten_many_equals_transposed_flatten(key_format):
+    # Arrange
+    rows = [flatten(record, key_format) for record in records]
+    paths = list(dict.fromkeys(path for row in rows for path in row))
+
+    # Act
+    columns = flatten_many(iter(records), key_format)
+
+    # Assert
+    assert list(columns) == paths
+    assert columns == {path: [row.get(path) for row in rows] for path in paths}
+
+
+def test_flatten_many_fill():
+    # Act
+    columns = flatten_many(records, fill=MISSING)
+
+    # Assert
+    assert columns[("score",)] == [MISSING, 1.5, 2.5]
+    assert columns[("user", "tags", 1)] == [MISSING, MISSING, "d"]
+
+
+def test_flatten_many_arrays():
+    # Act
+    columns = flatten_many([*records, {"id": 4, "score": 3.5, "big": 2 ** 64}], arrays=True, fill=0.0)
+
+    # Assert
+    assert columns[("id",)] == array("q", [1, 2, 3, 4])
+    assert columns[("score",)] == array("d", [0.0, 1.5, 2.5, 3.5])
+    assert columns[("user", "name")] == ["ann", 0.0, "cid", 0.0]
+    assert columns[("big",)] == [0.0, 0.0, 0.0, 2 ** 64]
+
+
+def test_flatten_many_edge_cases():
+    assert flatten_many([]) == {}
+    assert flatten_many([1, {"a": 2}]) == {(): [1, None], ("a",): [None, 2]}
+    assert flatten_many([{"a": [1]}, {"a": [2]}], arrays=True) == {("a", 0): array("q", [1, 2])}
+
+
+def test_flatten_many_arrays_demote_on_first_mismatch():
+    # Arrange
+    mixed = [{"a": 1, "b": 1.0, "c": 1}, {"a": True, "b": 2, "c": 2}, {"a": 3, "b": 3.0, "c": 2 ** 63}]
+
+    # Act
+    columns = flatten_many(mixed, arrays=True)
+
+    # Assert
+    assert columns == {("a",): [1, True, 3], ("b",): [1.0, 2, 3.0], ("c",): [1, 2, 2 ** 63]}
+    assert [type(value) for value in columns[("a",)]] == [int, bool, int]
+    assert [type(value) for value in columns[("b",)]] == [float, int, float]
+
+
+
+def test_flatten_many_arrays_lower_peak_memory():
+    # Arrange
+    def peak(arrays):
+        tracemalloc.start()
+        try:
+            flatten_many(({"i": i, "x": i / 2} for i in range(50_000)), arrays=arrays)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # Act
+    lists, arrays = peak(False), peak(True)
+
+    # Assert (the columns never exist as lists of boxed numbers)
+    assert arrays * 2 < lists
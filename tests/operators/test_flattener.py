@@ -0,0 +1,75 @@
+import pytest
+
+from mappingtools.operators import Flattener, KeyFormat, flatten, iflatten
+
+records = [
+    {"id": i, "user": {"name": f"u{i}", "preferences": {"theme": "dark"}, "tags": [i, i + 1]}, 1: True}
+    for i in range(3)
+]
+
+
+@pytest.mark.parametrize("key_format", list(KeyFormat))
+def test_flattener_equals_flatten(key_format):
+    # Arrange
+    flattener = Flattener(key_format)
+
+    # Act
+    results = [flattener(record) for record in records]
+
+    # Assert
+    assert results == [flatten(record, key_format) for record in records]
+    assert [list(r) for r in results] == [list(flatten(record, key_format)) for record in records]
+    assert list(flattener.iflatten(records[0], max_depth=1)) == list(iflatten(records[0], key_format, max_depth=1))
+
+
+@pytest.mark.parametrize("key_format", list(KeyFormat))
+def test_flattener_shares_keys(key_format):
+    # Arrange
+    flattener = Flattener(key_format)
+
+    # Act
+    first, second = flattener(records[0]), flattener(records[1])
+
+    # Assert
+    for k1, k2 in zip(first, second, strict=True):
+        assert k1 is k2
+    assert flattener.cache_info().hits > 0
+
+
+@pytest.mark.parametrize("key_format", list(KeyFormat))
+def test_flattener_tells_equal_parts_of_different_types_apart(key_format):
+    # Arrange
+    flattener = Flattener(key_format)
+    documents = [{1: "int"}, {True: "bool"}, {1.0: "float"}]
+
+    # Act
+    results = [flattener(document) for document in documents]
+
+    # Assert
+    assert results == [flatten(document, key_format) for document in documents]
+
+
+def test_flattener_cache_is_bounded():
+    # Arrange
+    flattener = Flattener(KeyFormat.JSONPATH, maxsize=4)
+
+    # Act
+    result = flattener({f"k{i}": {"a": i} for i in range(10)})
+
+    # Assert
+    assert result == {f"$.k{i}.a": i for i in range(10)}
+    assert flattener.cache_info().currsize == 4
+    flattener.cache_clear()
+    assert flattener.cache_info().currsize == 0
+
+
+def test_flattener_attributes():
+    # Arrange
+    flattener = Flattener(KeyFormat.STR, maxsize=None)
+
+    # Assert
+    assert flattener.key_format is KeyFormat.STR
+    assert repr(flattener) == "Flattener(key_format=STR, maxsize=None)"
+    assert flattener(5) == {"": 5}
+    with pytest.raises(ValueError, match="'max_depth' must be zero or more"):
+        flattener.iflatten({}, max_depth=-1)
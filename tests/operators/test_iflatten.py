@@ -0,0 +1,86 @@
+import csv
+import io
+from types import GeneratorType
+
+import pytest
+
+from mappingtools.collectors import MappingCollector
+from mappingtools.operators import KeyFormat, flatten, iflatten
+
+tree = {"a": {"b": [1, {"c": 2}], "e": {}}, ("f", "g"): None, "x": 3}
+
+
+@pytest.mark.parametrize("key_format", list(KeyFormat))
+def test_iflatten_equals_flatten(key_format):
+    # Act
+    pairs = iflatten(tree, key_format)
+
+    # Assert
+    assert isinstance(pairs, GeneratorType)
+    assert list(pairs) == list(flatten(tree, key_format).items())
+
+
+@pytest.mark.parametrize(
+    ("max_depth", "expected"),
+    [
+        (0, [((), tree)]),
+        (1, [(("a",), tree["a"]), (("f", "g"), None), (("x",), 3)]),
+        (2, [(("a", "b"), [1, {"c": 2}]), (("a", "e"), {}), (("f", "g"), None), (("x",), 3)]),
+        (None, [(("a", "b", 0), 1), (("a", "b", 1, "c"), 2), (("f", "g"), None), (("x",), 3)]),
+    ],
+)
+def test_iflatten_max_depth(max_depth, expected):
+    # Act
+    result = list(iflatten(tree, max_depth=max_depth))
+
+    # Assert
+    assert result == expected
+
+
+def test_iflatten_is_leaf_prunes_subtrees():
+    # Arrange
+    visited = []
+
+    def is_leaf(path, value):
+        visited.append(path)
+        return path == "$.a.b"
+
+    # Act
+    result = list(iflatten(tree, KeyFormat.JSONPATH, is_leaf=is_leaf))
+
+    # Assert
+    assert result == [("$.a.b", [1, {"c": 2}]), ("$.f.g", None), ("$.x", 3)]
+    assert visited == ["$", "$.a", "$.a.b", "$.a.e"]
+
+
+def test_iflatten_consumers():
+    # Arrange
+    records = [{"id": 1, "user": {"name": "ann"}}, {"id": 2, "user": {"name": "bob"}}]
+    collector = MappingCollector()
+    buffer = io.StringIO()
+
+    # Act
+    collector.collect(iflatten(records, max_depth=1))
+    csv.writer(buffer, lineterminator="\n").writerows(iflatten(records, KeyFormat.JSONPOINTER))
+
+    # Assert
+    assert collector.mapping == {(0,): [records[0]], (1,): [records[1]]}
+    assert buffer.getvalue() == "/0/id,1\n/0/user/name,ann\n/1/id,2\n/1/user/name,bob\n"
+
+
+def test_iflatten_edge_cases():
+    # Arrange
+    deep = "leaf"
+    for _ in range(5000):
+        deep = [deep]
+    circular = {}
+    circular["a"] = circular
+
+    # Assert
+    assert list(iflatten(5)) == [((), 5)]
+    assert list(iflatten({}, KeyFormat.STR)) == []
+    assert list(iflatten(deep)) == [((0,) * 5000, "leaf")]
+    with pytest.raises(ValueError, match="'max_depth' must be zero or more"):
+        iflatten(tree, max_depth=-1)
+    with pytest.raises(RecursionError):
+        list(iflatten(circular))
@@ -2,7 +2,7 @@ from functools import reduce
 
 import pytest
 
-from mappingtools.operators import merge
+from mappingtools.operators import Engine, merge
 from mappingtools.optics import Lens
 from mappingtools.typing import MISSING
 
@@ -37,10 +37,11 @@ trees_scenarios = [
 ]
 
 
+@pytest.mark.parametrize("engine", list(Engine))
 @pytest.mark.parametrize(("tree1", "tree2", "expected"), trees_scenarios)
-def test_merge(tree1, tree2, expected):
+def test_merge(tree1, tree2, expected, engine):
     # Act
-    merged = merge(tree1, tree2)
+    merged = merge(tree1, tree2, engine=engine)
 
     # Assert
     assert merged == expected
@@ -77,3 +78,81 @@ def test_merge_with_lens():
     assert new_state == {"system": {"config": {"retries": 3, "timeout": 30}}}
     # Ensure original state wasn't mutated
     assert system_state == {"system": {"config": {"retries": 3}}}
+
+
+def _deep_tree(depth: int, leaf):
+    tree = {"leaf": leaf}
+    for i in range(depth):
+        tree = {"child": tree, "level": i} if i % 2 else {"child": [tree, i]}
+    return tree
+
+
+def test_merge_engines_are_equivalent():
+    # Arrange
+    tree1 = {"a": [1, {"b": 2}, [3]], "c": {"d": {"e": 1}}, "f": 1, "g": [1]}
+    tree2 = {"a": [{"x": 1}, {"b": 3, "y": 4}], "c": {"d": [1]}, "f": [2], "g": 2, "h": {"i": 1}}
+
+    # Act
+    recursive = merge(tree1, tree2, engine=Engine.RECURSIVE)
+    iterative = merge(tree1, tree2, engine=Engine.ITERATIVE)
+
+    # Assert
+    assert iterative == recursive
+    assert list(iterative) == list(recursive)
+
+
+@pytest.mark.parametrize("share_unchanged", [False, True])
+@pytest.mark.parametrize("engine", list(Engine))
+def test_merge_handles_trees_deeper_than_recursion_limit(engine, share_unchanged):
+    # Arrange
+    depth = 5_000
+    tree1 = _deep_tree(depth, "old")
+    tree2 = _deep_tree(depth, "new")
+
+    # Act (the recursive engine falls back to the iterative one)
+    merged = merge(tree1, tree2, engine=engine, share_unchanged=share_unchanged)
+
+    # Assert
+    node = merged
+    while isinstance(node, (dict, list)):
+        node = node[0] if isinstance(node, list) else node.get("child", node.get("leaf"))
+    assert node == "new"
+
+
+@pytest.mark.parametrize("engine", list(Engine))
+@pytest.mark.parametrize(("tree1", "tree2", "expected"), trees_scenarios)
+def test_merge_share_unchanged(tree1, tree2, expected, engine):
+    # Act
+    merged = merge(tree1, tree2, engine=engine, share_unchanged=True)
+
+    # Assert
+    assert merged == expected
+
+
+@pytest.mark.parametrize("engine", list(Engine))
+def test_merge_share_unchanged_reuses_untouched_subtrees(engine):
+    # Arrange
+    untouched = {"x": [1, 2, {"y": 3}]}
+    base = {"a": untouched, "b": {"c": 1, "d": 2}, "e": [1, 2]}
+    override = {"b": {"c": 10}, "e": base["e"], "f": 1}
+
+    # Act
+    merged = merge(base, override, engine=engine, share_unchanged=True)
+
+    # Assert
+    assert merged == merge(base, override)
+    assert merged["a"] is untouched
+    assert merged["e"] is base["e"]
+    assert merged["b"] is not base["b"]
+    assert base == {"a": untouched, "b": {"c": 1, "d": 2}, "e": [1, 2]}
+    assert merge(base, base, engine=engine, share_unchanged=True) is base
+
+
+def test_merge_circular_trees_raise_recursion_error():
+    # Arrange
+    tree = {"a": 1}
+    tree["self"] = tree
+
+    # Act & Assert
+    with pytest.raises(RecursionError):
+        merge(tree, {"self": tree})
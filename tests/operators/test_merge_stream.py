@@ -0,0 +1,85 @@
+import json
+from functools import reduce
+
+import pytest
+
+from mappingtools.operators import merge, merge_stream
+from mappingtools.typing import MISSING
+
+docs_scenarios = [
+    # Scalars
+    [1, 2, 3],
+    # Dictionaries
+    [{"a": 1, "b": {"c": 2}}, {"b": {"d": 3}}, {"a": 10}],
+    # Lists (Positional Zip)
+    [{"x": [1, 2]}, {"x": [3]}, {"x": [4, 5, 6]}],
+    # Mixed List/Scalar (Free Monoid Fallback)
+    [{"x": [1]}, {"x": 2}, {"x": {"y": 1}}, {"x": [3]}],
+    [{"x": 1}, {"x": [2, {"y": 1}]}, {"x": [{"y": 2}]}],
+    # Mixed Dict/Scalar
+    [{"a": {"b": 1}}, {"a": 2}, {"a": {"c": 3}}],
+    # MISSING Identity
+    [MISSING, {"a": 1}, MISSING],
+]
+
+
+@pytest.mark.parametrize("docs", docs_scenarios)
+def test_merge_stream_equals_merge_fold(docs):
+    # Arrange
+    expected = reduce(merge, docs)
+    snapshot = repr(docs)
+
+    # Act
+    result = merge_stream(iter(docs))
+
+    # Assert
+    assert result == expected
+    assert repr(docs) == snapshot
+
+
+def test_merge_stream_ndjson():
+    # Arrange
+    lines = [
+        '{"user": {"id": 1, "events": ["login"]}}',
+        '{"user": {"events": ["click"], "name": "ann"}}',
+        '{"user": {"events": ["logout", "exit"]}}',
+    ]
+
+    # Act
+    state = merge_stream(json.loads(line) for line in lines)
+
+    # Assert
+    assert state == {"user": {"id": 1, "events": ["logout", "exit"], "name": "ann"}}
+
+
+def test_merge_stream_into_accumulator_in_place():
+    # Arrange
+    accumulator = {"a": {"b": 1}, "c": [1]}
+    inner = accumulator["a"]
+
+    # Act
+    result = merge_stream([{"a": {"d": 2}}, {"c": 2}], accumulator)
+
+    # Assert
+    assert result is accumulator
+    assert accumulator["a"] is inner
+    assert accumulator == {"a": {"b": 1, "d": 2}, "c": [1, 2]}
+
+
+def test_merge_stream_does_not_share_nodes_with_the_trees():
+    # Arrange
+    doc = {"a": {"b": [1, {"c": 1}]}}
+
+    # Act
+    result = merge_stream([doc, doc, {"a": {"b": [2, {"d": 2}]}}])
+
+    # Assert
+    assert result == {"a": {"b": [2, {"c": 1, "d": 2}]}}
+    assert doc == {"a": {"b": [1, {"c": 1}]}}
+    assert result["a"] is not doc["a"]
+
+
+def test_merge_stream_edge_cases():
+    assert merge_stream([]) is MISSING
+    assert merge_stream([], {"a": 1}) == {"a": 1}
+    assert merge_stream([{"a": 1}], 5) == {"a": 1}
@@ -0,0 +1,118 @@
+from collections.abc import Mapping
+from functools import reduce
+
+import pytest
+
+from mappingtools.operators import MergedView, combine, combine_all
+from mappingtools.resolvers import NumericResolver, Resolver
+from mappingtools.typing import MISSING
+
+layers = [
+    {"a": 1, "b": {"c": 1, "d": [1, 2]}, "e": "base"},
+    {"a": 2, "b": {"c": 2}, "f": {"g": 1}},
+    {"b": {"d": [10], "h": True}, "e": ["x"]},
+    {"a": 3, "f": 4},
+]
+
+
+def _to_dict(value):
+    if isinstance(value, Mapping):
+        return {k: _to_dict(v) for k, v in value.items()}
+    return value
+
+
+@pytest.mark.parametrize(
+    "op",
+    [Resolver.LAST, Resolver.FIRST, Resolver.ALL, Resolver.VOID, Resolver.MARK, Resolver.NULL],
+)
+def test_merged_view_matches_combine(op):
+    # Arrange
+    expected = reduce(lambda t1, t2: combine(t1, t2, op), layers)
+
+    # Act
+    view = MergedView(*layers, op=op)
+
+    # Assert
+    assert view == expected
+    assert _to_dict(view) == expected
+    assert view.materialize() == expected
+    assert view.materialize() == combine_all(*layers, op=op)
+
+
+def test_merged_view_nested_values_are_views():
+    # Act
+    view = MergedView(*layers)
+
+    # Assert
+    assert isinstance(view, Mapping)
+    assert isinstance(view["b"], MergedView)
+    assert view["b"]["c"] == 2
+    assert view["b"]["d"] == [10, 2]
+    assert view["b"].materialize() == {"c": 2, "d": [10, 2], "h": True}
+    assert view["f"] == 4
+    assert view["b"] is view["b"]
+
+
+def test_merged_view_resolves_lazily():
+    # Arrange
+    calls = []
+
+    def op(t1, t2):
+        calls.append((t1, t2))
+        return t1 + t2
+
+    view = MergedView({"x": 1, "y": {"z": 1}}, {"x": 2, "y": {"z": 2}}, op=op)
+
+    # Act
+    z = view["y"]["z"]
+
+    # Assert
+    assert z == 3
+    assert calls == [(1, 2)]
+
+
+def test_merged_view_key_order_and_membership():
+    # Act
+    view = MergedView({"a": 1, "b": 2}, {"c": 3, "a": 4})
+
+    # Assert
+    assert list(view) == ["a", "b", "c"]
+    assert len(view) == 3
+    assert "c" in view
+    assert "z" not in view
+    assert view.get("z") is None
+    with pytest.raises(KeyError):
+        view["z"]
+
+
+def test_merged_view_void_drops_conflicting_keys():
+    # Act
+    view = MergedView({"a": 1, "b": 2}, {"a": 3}, op=Resolver.VOID)
+
+    # Assert
+    assert "a" not in view
+    assert list(view) == ["b"]
+    assert len(view) == 1
+    with pytest.raises(KeyError):
+        view["a"]
+
+
+def test_merged_view_custom_resolver_enum():
+    # Act
+    view = MergedView({"x": 1, "y": {"z": 1}}, {"x": 2, "y": {"z": 2}}, op=NumericResolver.SUM)
+
+    # Assert
+    assert view.materialize() == {"x": 3, "y": {"z": 3}}
+
+
+def test_merged_view_edge_cases():
+    # Arrange
+    tree = {"a": {"b": 1}}
+
+    # Assert
+    assert MergedView() == {}
+    assert MergedView().materialize() == {}
+    assert MergedView(MISSING, tree, MISSING).materialize() is tree
+    assert MergedView(tree).layers == (tree,)
+    with pytest.raises(TypeError):
+        MergedView({"a": 1}, [1, 2])
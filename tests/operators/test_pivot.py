@@ -3,6 +3,9 @@ import pytest
 from mappingtools.aggregations import Aggregation
 from mappingtools.operators import pivot
 
+# On Python 3.11, the nested Aggregation.Item class is listed as a member too
+aggregations = [aggregation for aggregation in Aggregation if aggregation.name != 'Item']
+
 
 def test_pivot_basic():
     # Basic pivot: rows=A, cols=B, values=C
@@ -129,3 +132,61 @@ def test_pivot_ema():
 
 def test_pivot_empty():
     assert pivot([], index='A', columns='B', values='C') == {}
+
+
+multi_data = [
+    {'A': 'foo', 'B': 'one', 'C': 1, 'D': 10},
+    {'A': 'foo', 'B': 'two', 'C': 2, 'D': 20},
+    {'A': 'bar', 'B': 'one', 'C': 3},  # Missing D
+    {'A': 'foo', 'B': 'one', 'C': 4, 'D': 40},
+]
+
+
+def test_pivot_several_aggregations():
+    # One pass over an iterator, one aggregation per name
+    result = pivot(
+        iter(multi_data),
+        index='A',
+        columns='B',
+        values='C',
+        aggregation={'sum': Aggregation.SUM, 'max': Aggregation.MAX, 'all': Aggregation.ALL},
+    )
+    assert result == {
+        'foo': {'one': {'sum': 5, 'max': 4, 'all': [1, 4]}, 'two': {'sum': 2, 'max': 2, 'all': [2]}},
+        'bar': {'one': {'sum': 3, 'max': 3, 'all': [3]}},
+    }
+
+
+def test_pivot_several_values():
+    # Items missing any of the values are skipped
+    result = pivot(multi_data, index='A', columns='B', values=['C', 'D'], aggregation=Aggregation.SUM)
+    assert result == {'foo': {'one': {'C': 5, 'D': 50}, 'two': {'C': 2, 'D': 20}}}
+
+
+def test_pivot_several_values_and_aggregations():
+    result = pivot(
+        multi_data,
+        index='A',
+        columns='B',
+        values=['C', 'D', 'D'],
+        aggregation={'first_c': Aggregation.FIRST, 'last_d': Aggregation.LAST, 'count_d': Aggregation.COUNT},
+    )
+    assert result['foo']['one'] == {'first_c': 1, 'last_d': 40, 'count_d': {10: 1, 40: 1}}
+    aggregation = {'a': Aggregation.SUM, 'b': Aggregation.ALL}
+    with pytest.raises(ValueError, match="'values' and 'aggregation' must be of the same length"):
+        pivot(multi_data, index='A', columns='B', values=['C', 'D', 'C'], aggregation=aggregation)
+
+
+def test_pivot_one_value_sequence_and_several_aggregations():
+    # A single value key is shared by all the aggregations, as with a plain string
+    aggregation = {'sum': Aggregation.SUM, 'all': Aggregation.ALL}
+    result = pivot(multi_data, index='A', columns='B', values=['C'], aggregation=aggregation)
+    assert result == pivot(multi_data, index='A', columns='B', values='C', aggregation=aggregation)
+    assert result['foo']['one'] == {'sum': 5, 'all': [1, 4]}
+
+
+@pytest.mark.parametrize('aggregation', aggregations)
+def test_pivot_several_aggregations_equal_single_pivots(aggregation):
+    result = pivot(multi_data, index='A', columns='B', values='C', aggregation={'x': aggregation})
+    single = pivot(multi_data, index='A', columns='B', values='C', aggregation=aggregation)
+    assert result == {row: {col: {'x': value} for col, value in cells.items()} for row, cells in single.items()}
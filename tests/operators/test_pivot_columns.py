@@ -0,0 +1,63 @@
+import pytest
+
+from mappingtools.aggregations import Aggregation
+from mappingtools.operators import pivot, pivot_columns
+
+# On Python 3.11, the nested Aggregation.Item class is listed as a member too
+aggregations = [aggregation for aggregation in Aggregation if aggregation.name != 'Item']
+
+rows = [
+    {'A': 'foo', 'B': 'one', 'C': 1},
+    {'A': 'foo', 'B': 'two', 'C': 2},
+    {'A': 'bar', 'B': 'one', 'C': 3},
+    {'A': 'foo', 'B': 'one', 'C': 4},
+    {'A': 'bar', 'B': 'one', 'C': 3},
+]
+
+
+@pytest.mark.parametrize('aggregation', aggregations)
+def test_pivot_columns_equals_pivot(aggregation):
+    # Transpose the rows into columns
+    data = {key: [row[key] for row in rows] for key in rows[0]}
+
+    result = pivot_columns(data, index='A', columns='B', values='C', aggregation=aggregation)
+
+    assert result == pivot(rows, index='A', columns='B', values='C', aggregation=aggregation)
+    assert list(result) == ['foo', 'bar']
+
+
+def test_pivot_columns_accepts_iterables():
+    # Columns can be any iterables, e.g. tuples, ranges or generators
+    data = {'A': ('x', 'y', 'x'), 'B': range(3), 'C': (c for c in 'abc')}
+
+    result = pivot_columns(data, index='A', columns='B', values='C')
+
+    assert result == {'x': {0: 'a', 2: 'c'}, 'y': {1: 'b'}}
+
+
+def test_pivot_columns_missing_column():
+    # Like rows without the required keys, there is nothing to pivot
+    result = pivot_columns({'A': [1], 'B': [2]}, index='A', columns='B', values='C')
+    assert result == {}
+
+
+def test_pivot_columns_ragged_columns():
+    with pytest.raises(ValueError):
+        pivot_columns({'A': [1, 2], 'B': [1, 2], 'C': [1]}, index='A', columns='B', values='C')
+
+
+@pytest.mark.parametrize(
+    ('values', 'aggregation'),
+    [
+        ('C', {'sum': Aggregation.SUM, 'all': Aggregation.ALL, 'count': Aggregation.COUNT}),
+        (['C', 'A'], Aggregation.DISTINCT),
+        (['C', 'B', 'C'], {'max': Aggregation.MAX, 'first': Aggregation.FIRST, 'ema': Aggregation.EMA}),
+    ],
+)
+def test_pivot_columns_several_values_or_aggregations(values, aggregation):
+    data = {key: [row[key] for row in rows] for key in rows[0]}
+
+    result = pivot_columns(data, index='A', columns='B', values=values, aggregation=aggregation)
+
+    assert result == pivot(rows, index='A', columns='B', values=values, aggregation=aggregation)
+    assert pivot_columns(data, index='A', columns='B', values=['C', 'Z'], aggregation=Aggregation.SUM) == {}
@@ -0,0 +1,54 @@
+import pytest
+
+from mappingtools.aggregations import Aggregation
+from mappingtools.operators import pivot, pivot_sorted
+
+# On Python 3.11, the nested Aggregation.Item class is listed as a member too
+aggregations = [aggregation for aggregation in Aggregation if aggregation.name != 'Item']
+
+rows = [
+    {'A': 'bar', 'B': 'one', 'C': 3},
+    {'A': 'bar', 'B': 'one', 'C': 3},
+    {'A': 'baz', 'C': 7},
+    {'A': 'foo', 'B': 'one', 'C': 1},
+    {'A': 'foo', 'B': 'two', 'C': 2, 'D': 20},
+    {'A': 'foo', 'B': 'one', 'C': 4, 'D': 40},
+]
+
+
+@pytest.mark.parametrize('aggregation', aggregations)
+def test_pivot_sorted_equals_pivot(aggregation):
+    result = pivot_sorted(rows, index='A', columns='B', values='C', aggregation=aggregation)
+
+    assert list(result) == list(pivot(rows, index='A', columns='B', values='C', aggregation=aggregation).items())
+
+
+def test_pivot_sorted_several_values_and_aggregations():
+    result = pivot_sorted(rows, index='A', columns='B', values=['C', 'D'], aggregation=Aggregation.SUM)
+
+    assert dict(result) == pivot(rows, index='A', columns='B', values=['C', 'D'], aggregation=Aggregation.SUM)
+
+
+def test_pivot_sorted_is_lazy():
+    def feed():
+        yield {'A': 1, 'B': 'x', 'C': 1}
+        yield {'A': 1, 'B': 'y', 'C': 2}
+        yield {'A': 2, 'B': 'x', 'C': 3}
+        raise AssertionError('The feed must not be consumed beyond the next row.')
+
+    result = pivot_sorted(feed(), index='A', columns='B', values='C')
+
+    assert next(result) == (1, {'x': 1, 'y': 2})
+
+
+def test_pivot_sorted_yields_a_reappearing_index_again():
+    data = [{'A': 1, 'B': 'x', 'C': 1}, {'A': 2, 'B': 'x', 'C': 2}, {'A': 1, 'B': 'y', 'C': 3}]
+
+    result = pivot_sorted(data, index='A', columns='B', values='C')
+
+    assert list(result) == [(1, {'x': 1}), (2, {'x': 2}), (1, {'y': 3})]
+
+
+def test_pivot_sorted_validates_eagerly():
+    with pytest.raises(ValueError, match="'values' and 'aggregation' must be of the same length"):
+        pivot_sorted(rows, index='A', columns='B', values=['C', 'D'], aggregation={})
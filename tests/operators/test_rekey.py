@@ -1,5 +1,7 @@
 from collections import Counter
 
+import pytest
+
 from mappingtools.aggregations import Aggregation
 from mappingtools.operators import rekey
 
@@ -60,3 +62,19 @@ def test_rekey_empty_mapping():
 
     # Assert
     assert result == {}
+
+
+@pytest.mark.parametrize("aggregation", [Aggregation.LAST, Aggregation.FIRST])
+def test_rekey_fast_paths_equal_aggregation(aggregation):
+    # Arrange
+    data = {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}
+    expected = {}
+    for v in data.values():
+        aggregation.aggregator(expected, v % 3, (v,))
+
+    # Act
+    result = rekey(data, lambda k, v: v % 3, aggregation=aggregation)
+
+    # Assert
+    assert result == expected
+    assert list(result) == list(expected)
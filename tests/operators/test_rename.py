@@ -1,3 +1,8 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import pytest
+
 from mappingtools.aggregations import Aggregation
 from mappingtools.operators import rename
 
@@ -84,3 +89,24 @@ def test_rename_empty_mapping():
 
     # Assert
     assert result == {}
+
+
+@pytest.mark.parametrize("aggregation", [Aggregation.LAST, Aggregation.FIRST])
+@pytest.mark.parametrize(
+    "mapper",
+    [{"a": "x", "c": "x", "d": "y"}, MappingProxyType({"a": "x", "c": "x", "d": "y"}), lambda k: "x" if k < "d" else k],
+)
+def test_rename_fast_paths_equal_aggregation(mapper, aggregation):
+    # Arrange
+    data = {"d": 4, "a": 1, "b": 2, "c": 3}
+    expected = {}
+    for k, v in data.items():
+        new_key = mapper.get(k, k) if isinstance(mapper, Mapping) else mapper(k)
+        aggregation.aggregator(expected, new_key, (v,))
+
+    # Act
+    result = rename(data, mapper, aggregation=aggregation)
+
+    # Assert
+    assert result == expected
+    assert list(result) == list(expected)
@@ -1,3 +1,6 @@
+from collections import Counter, defaultdict
+from types import MappingProxyType
+
 import pytest
 
 from mappingtools.aggregations import Aggregation
@@ -75,6 +78,30 @@ def test_reshape_missing_keys():
     assert result[1][2] == 10
     assert result[1][None] == 20
 
+
+def test_reshape_missing_keys_in_path_and_value():
+    """Test that records missing path keys or the value are grouped under None, in any mapping type."""
+    data = [
+        MappingProxyType({"a": 1, "b": 2, "c": 3, "val": 10}),
+        {"c": 3, "val": 20},  # Missing 'a' and 'b'
+        {"a": 1, "b": 2, "c": 4},  # Missing 'val'
+    ]
+
+    result = reshape(data, keys=["a", "b", "c"], value="val")
+
+    assert result == {1: {2: {3: 10, 4: None}}, None: {None: {3: 20}}}
+
+
+def test_reshape_records_with_missing_hook():
+    """Test that records defining __missing__ still group missing keys under None, without being mutated."""
+    counters = [Counter(a=1), Counter(a=2, b=3)]
+    record = defaultdict(list, a=1)
+
+    assert reshape(counters, keys=["a", "b"], value="a") == {1: {None: 1}, 2: {3: 2}}
+    assert reshape([record], keys=["a", "b"], value="a") == {1: {None: 1}}
+    assert record == {"a": 1}
+
+
 def test_reshape_empty():
     assert reshape([], keys=["a"], value="v") == {}
 
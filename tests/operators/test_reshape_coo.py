@@ -0,0 +1,155 @@
+from array import array
+from collections import Counter, defaultdict
+
+import pytest
+
+from mappingtools.aggregations import Aggregation
+from mappingtools.operators import SparseTensor, TensorFormat, reshape
+
+# On Python 3.11, the nested Aggregation.Item class is listed as a member too
+aggregations = [aggregation for aggregation in Aggregation if aggregation.name != "Item"]
+
+records = [
+    {"country": f"c{i % 3}", "region": f"r{i % 5}", "product": f"p{i % 7}", "sales": i % 11, "price": i / 4}
+    for i in range(200)
+] + [{"region": "r0", "product": "p0", "sales": 1}]  # Missing 'country' and 'price'
+keys = ["country", "region", "product"]
+
+
+@pytest.mark.parametrize("depth", [1, 2, 3])
+@pytest.mark.parametrize("aggregation", aggregations)
+def test_reshape_coo_to_nested_equals_reshape(aggregation, depth):
+    # Act
+    tensor = reshape(records, keys[:depth], "sales", aggregation, output=TensorFormat.COO)
+
+    # Assert
+    expected = reshape(records, keys[:depth], "sales", aggregation)
+    nested = tensor.to_nested()
+    assert nested == expected
+    assert list(nested) == list(expected)
+    assert len(tensor.coords) == depth
+
+
+def test_reshape_coo_columns():
+    # Arrange
+    data = [
+        {"a": "x", "b": 1, "v": 10},
+        {"a": "y", "b": 2, "v": 20},
+        {"a": "x", "b": 2, "v": 30},
+        {"a": "x", "b": 1, "v": 40},
+    ]
+
+    # Act
+    tensor = reshape(data, ["a", "b"], "v", Aggregation.SUM, output=TensorFormat.COO)
+
+    # Assert
+    assert tensor.dimensions == [{"x": 0, "y": 1}, {1: 0, 2: 1}]
+    assert tensor.coords == [array("q", [0, 1, 0]), array("q", [0, 1, 1])]
+    assert tensor.values == array("d", [50.0, 20.0, 30.0])
+    assert tensor.shape == (2, 2)
+    assert len(tensor) == 3
+    assert repr(tensor) == "SparseTensor(shape=(2, 2), nnz=3)"
+
+
+def test_reshape_coo_value_columns():
+    # Act
+    ints = reshape(records, keys, "sales", output=TensorFormat.COO)
+    floats = reshape(records[:-1], keys, "price", output=TensorFormat.COO)
+    mixed = reshape(records, keys, "price", output=TensorFormat.COO)
+    lists = reshape(records, keys, "sales", Aggregation.ALL, output=TensorFormat.COO)
+
+    # Assert
+    assert ints.values.typecode == "q"
+    assert floats.values.typecode == "d"
+    assert None in mixed.values
+    assert isinstance(lists.values, list)
+
+
+def test_reshape_coo_callable_keys():
+    # Act
+    tensor = reshape(records, [lambda r: r.get("country"), "region"], lambda r: r["sales"], output=TensorFormat.COO)
+
+    # Assert
+    assert tensor.to_nested() == reshape(records, ["country", "region"], "sales")
+
+
+def test_reshape_coo_records_with_missing_hook():
+    # Arrange
+    record = defaultdict(list, a=1)
+
+    # Act
+    counters = reshape([Counter(a=1), Counter(a=2, b=3)], ["a", "b"], "a", output=TensorFormat.COO)
+    defaults = reshape([record], ["a", "b"], "a", output=TensorFormat.COO)
+
+    # Assert
+    assert counters.to_nested() == {1: {None: 1}, 2: {3: 2}}
+    assert defaults.to_nested() == {1: {None: 1}}
+    assert record == {"a": 1}
+
+
+def test_reshape_coo_empty():
+    # Act
+    no_keys = reshape(records, [], "sales", output=TensorFormat.COO)
+    no_records = reshape([], keys, "sales", output=TensorFormat.COO)
+
+    # Assert
+    assert no_keys.to_nested() == {}
+    assert no_keys.shape == ()
+    assert no_records.to_nested() == {}
+    assert no_records.shape == (0, 0, 0)
+
+
+def test_sparse_tensor_loads_into_numpy():
+    # Arrange
+    np = pytest.importorskip("numpy")
+    tensor = reshape(records, keys, "sales", Aggregation.SUM, output=TensorFormat.COO)
+
+    # Act
+    dense = np.zeros(tensor.shape)
+    dense[tuple(np.asarray(column) for column in tensor.coords)] = np.asarray(tensor.values)
+
+    # Assert
+    assert dense[tensor.dimensions[0]["c1"], tensor.dimensions[1]["r1"], tensor.dimensions[2]["p1"]] == sum(
+        r["sales"] for r in records if (r.get("country"), r["region"], r["product"]) == ("c1", "r1", "p1")
+    )
+    assert isinstance(tensor, SparseTensor)
+
+
+def test_reshape_coo_shared_dimensions():
+    # Arrange
+    dimensions = [{"c2": 0, "c0": 1}, {}, {}]
+    first, second = records[:100], records[100:]
+
+    # Act
+    tensor1 = reshape(first, keys, "sales", Aggregation.SUM, output=TensorFormat.COO, dimensions=dimensions)
+    tensor2 = reshape(second, keys, "sales", Aggregation.SUM, output=TensorFormat.COO, dimensions=dimensions)
+
+    # Assert
+    assert tensor1.dimensions is dimensions
+    assert tensor2.dimensions is dimensions
+    assert dimensions[0] == {"c2": 0, "c0": 1, "c1": 2, None: 3}
+    assert tensor1.shape == tensor2.shape == (4, 5, 7)
+    assert tensor1.to_nested() == reshape(first, keys, "sales", Aggregation.SUM)
+    assert tensor2.to_nested() == reshape(second, keys, "sales", Aggregation.SUM)
+
+
+def test_reshape_dimensions_invalid():
+    with pytest.raises(ValueError, match="'dimensions' and 'keys' must be of the same length"):
+        reshape(records, keys, "sales", output=TensorFormat.COO, dimensions=[{}])
+    with pytest.raises(ValueError, match="'dimensions' requires output"):
+        reshape(records, keys, "sales", dimensions=[{}, {}, {}])
+
+
+def test_reshape_output_by_value():
+    # Act
+    tensor = reshape(records, keys, "sales", output="coo")
+    nested = reshape(records, keys, "sales", output="nested")
+
+    # Assert
+    assert isinstance(tensor, SparseTensor)
+    assert tensor.to_nested() == nested == reshape(records, keys, "sales")
+
+
+def test_reshape_invalid_output():
+    with pytest.raises(ValueError, match="'bogus' is not a valid TensorFormat"):
+        reshape(records, keys, "sales", output="bogus")
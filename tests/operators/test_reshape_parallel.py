@@ -0,0 +1,72 @@
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from mappingtools.aggregations import Aggregation
+from mappingtools.operators import reshape, reshape_parallel
+
+records = [
+    {"country": f"c{i % 3}", "region": f"r{i % 5}", "product": f"p{i % 7}", "sales": i % 11}
+    for i in range(500)
+]
+keys = ["country", "region", "product"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 499])
+@pytest.mark.parametrize("aggregation", [a for a in Aggregation if a.merger is not None])
+def test_reshape_parallel_equals_reshape(aggregation, chunk_size):
+    # Arrange
+    expected = reshape(records, keys, "sales", aggregation)
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = reshape_parallel(iter(records), keys, "sales", aggregation, executor=executor, chunk_size=chunk_size)
+
+    # Assert
+    assert result == expected
+    assert list(result) == list(expected)
+    assert list(result["c0"]) == list(expected["c0"])
+
+
+def test_reshape_parallel_records_with_missing_hook():
+    # Arrange
+    data = [Counter(a=1), Counter(a=2, b=3), defaultdict(list, a=1)]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = reshape_parallel(data, ["a", "b"], "a", Aggregation.ALL, executor=executor, chunk_size=1)
+
+    # Assert
+    assert result == {1: {None: [1, 1]}, 2: {3: [2]}}
+    assert data[2] == {"a": 1}
+
+
+def test_reshape_parallel_with_process_pool():
+    # Act
+    result = reshape_parallel(records, keys[:2], "sales", Aggregation.SUM, chunk_size=100)
+
+    # Assert
+    assert result == reshape(records, keys[:2], "sales", Aggregation.SUM)
+
+
+def test_reshape_parallel_falls_back_to_serial():
+    # Arrange
+    executor = Mock()
+
+    # Act
+    result = reshape_parallel(records, keys, "sales", executor=executor)
+    empty = reshape_parallel(records, [], "sales", executor=executor, chunk_size=1)
+
+    # Assert
+    assert result == reshape(records, keys, "sales")
+    assert empty == {}
+    executor.submit.assert_not_called()
+
+
+def test_reshape_parallel_invalid_arguments():
+    with pytest.raises(ValueError, match="'chunk_size' must be positive"):
+        reshape_parallel(records, keys, "sales", chunk_size=0)
+    with pytest.raises(ValueError, match="EMA cannot be merged"):
+        reshape_parallel(records, keys, "sales", Aggregation.EMA)
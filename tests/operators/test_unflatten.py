@@ -0,0 +1,75 @@
+import pytest
+
+from mappingtools.operators import KeyFormat, flatten, unflatten
+
+roundtrip_cases = [
+    ({"a": {"b": {"c": 1}, "d": 2}}, {"a": {"b": {"c": 1}, "d": 2}}),
+    ({"a": [1, [2, 3], {"b": None}], "e": "x"}, {"a": [1, [2, 3], {"b": None}], "e": "x"}),
+    # flatten drops empty containers
+    ([{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": []}], [{"id": 1, "tags": ["a", "b"]}, {"id": 2}]),
+    (
+        {"c-d": {"x y": 1, "": 2}, "a/b~c": 3, "x,y": [4], 5: {"q": "w"}, "_k1": 6},
+        {"c-d": {"x y": 1, "": 2}, "a/b~c": 3, "x,y": [4], 5: {"q": "w"}, "_k1": 6},
+    ),
+]
+
+
+@pytest.mark.parametrize("key_format", list(KeyFormat))
+@pytest.mark.parametrize(("tree", "expected"), roundtrip_cases)
+def test_unflatten_roundtrip(tree, expected, key_format):
+    # Act
+    result = unflatten(flatten(tree, key_format), key_format)
+
+    # Assert
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("flat", "key_format", "expected"),
+    [
+        ({}, KeyFormat.TUPLE, {}),
+        ({(): 5}, KeyFormat.TUPLE, 5),
+        ({"$": 5}, KeyFormat.JSONPATH, 5),
+        ({("a",): 1, "b": 2}, KeyFormat.TUPLE, {"a": 1, "b": 2}),
+        ({"a[1]": "y", "a[0]": "x"}, KeyFormat.JAVASCRIPT, {"a": ["x", "y"]}),
+        ({"/a/1": "y", "/a/2": "z"}, KeyFormat.JSONPOINTER, {"a": {1: "y", 2: "z"}}),
+        ({'"a",-1': 1, '"a","0"': 2}, KeyFormat.STR, {"a": {-1: 1, "0": 2}}),
+        ({("a",): {"leaf": "dict"}}, KeyFormat.TUPLE, {"a": {"leaf": "dict"}}),
+    ],
+)
+def test_unflatten_keys(flat, key_format, expected):
+    # Act
+    result = unflatten(flat, key_format)
+
+    # Assert
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "flat",
+    [
+        {("a",): 1, ("a", "b"): 2},
+        {("a", "b"): 1, ("a",): 2},
+        {(): 1, ("a",): 2},
+    ],
+)
+def test_unflatten_conflicting_keys(flat):
+    with pytest.raises(ValueError, match="Conflicting flat keys"):
+        unflatten(flat)
+
+
+def test_unflatten_deep_tree():
+    # Arrange
+    depth = 5000
+    tree = "leaf"
+    for i in range(depth):
+        tree = {"k": tree} if i % 2 else [tree]
+
+    # Act
+    result = unflatten(flatten(tree))
+
+    # Assert
+    node = result
+    for _ in range(depth):
+        node = node[0] if isinstance(node, list) else node["k"]
+    assert node == "leaf"
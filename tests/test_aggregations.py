@@ -3,6 +3,7 @@ from collections import Counter
 import pytest
 
 from mappingtools.aggregations import (
+    Aggregation,
     all_aggregator,
     count_aggregator,
     distinct_aggregator,
@@ -136,3 +137,19 @@ def test_last_aggregator_direct():
 
     last_aggregator(mapping, 'empty_iter', empty_iterator())
     assert mapping['empty_iter'] is None
+
+
+@pytest.mark.parametrize("aggregation", [a for a in Aggregation if a.merger is not None])
+def test_merger_of_partials_equals_aggregation_of_all_values(aggregation):
+    values = [3, 1, 4, 1, 5, 9, 2, 6]
+
+    def aggregate(batch):
+        mapping = {} if aggregation.collection_type is None else {'key': aggregation.collection_type()}
+        aggregation.aggregator(mapping, 'key', batch)
+        return mapping['key']
+
+    assert aggregation.merger(aggregate(values[:3]), aggregate(values[3:])) == aggregate(values)
+
+
+def test_ema_has_no_merger():
+    assert Aggregation.EMA.merger is None